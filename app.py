@@ -2,8 +2,13 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.express as px
-import plotly.figure_factory as ff 
 import time
+from data_utils import source_fingerprint
+from film_store import load_aggregate_store, load_film_store
+from figure_cache import MAX_POINTS_PER_TRACE, cached_figure
+from filter_state import year_range_controls
+from rating_density import density_figure
+from result_cache import filter_results_cache
 
 st.set_page_config(
     page_title="Dashboard Tren Genre Film IMDb", 
@@ -152,84 +157,35 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-@st.cache_data
-def load_data():
-    """Memuat dan menyiapkan dataset IMDb"""
-    try:
-        df = pd.read_csv('data_final.csv')
-        
-        df = df.rename(columns={
-            'Name': 'Title',
-            'Directors': 'Director',
-            'Actors': 'Stars',
-            'Rating': 'IMDb-Rating',
-            'Genres': 'Category',
-            'Year': 'ReleaseYear'
-        })
-        
-        # Tambahkan kolom yang tidak ada di dataset baru
-        if 'Censor-board-rating' not in df.columns:
-            df['Censor-board-rating'] = 'Not Rated'  # Default value
-            
-    except FileNotFoundError:
-        try:
-            df = pd.read_csv('IMDb_Data_final.csv')
-        except FileNotFoundError:
-            st.error("File 'data_final.csv' atau 'IMDb_Data_final.csv' tidak ditemukan.")
-            return pd.DataFrame(), pd.DataFrame()
-
-    df['ReleaseYear'] = pd.to_numeric(df['ReleaseYear'], errors='coerce')
-    df.dropna(subset=['ReleaseYear'], inplace=True)
-    
-    if df['ReleaseYear'].empty:
-        st.warning("Kolom 'ReleaseYear' tidak memiliki data numerik yang valid.")
-        return pd.DataFrame(), pd.DataFrame()
-
-    df['ReleaseYear'] = df['ReleaseYear'].astype(int)
-    df['Decade'] = (df['ReleaseYear'] // 10) * 10
-    df['Decade_Label'] = df['Decade'].astype(str) + 's'
-
-    def clean_duration(duration_str):
-        if pd.isna(duration_str):
-            return None
-        if isinstance(duration_str, (int, float)):
-            return duration_str
-        cleaned = str(duration_str).replace('min', '').strip()
-        try:
-            return int(cleaned)
-        except ValueError:
-            return None
-            
-    df['Duration_Clean'] = df['Duration'].apply(clean_duration)
-
-    genres_expanded = []
-    for idx, row in df.iterrows():
-        if pd.notna(row['Category']):
-            genres = str(row['Category']).split(',')
-            for genre in genres:
-                new_row = row.copy()
-                new_row['Genre'] = genre.strip()
-                if new_row['Genre']:
-                    genres_expanded.append(new_row)
-        else:
-            new_row = row.copy()
-            new_row['Genre'] = 'Unknown'
-            genres_expanded.append(new_row)
-
-    if not genres_expanded:
-        df_expanded = pd.DataFrame(columns=list(df.columns) + ['Genre'])
-    else:
-        df_expanded = pd.DataFrame(genres_expanded)
+# data_partitions/ (python build_data.py --partitions data_partitions) dipakai lebih dulu jika ada
+DATA_SOURCES = ('data_partitions', 'data_final.csv', 'IMDb_Data_final.csv')
+# Rentang tahun yang dimuat, mis. (2015, 2024) untuk deployment yang hanya butuh dekade terakhir;
+# dengan data_partitions/ hanya partisi dekade yang beririsan yang dibaca. None = semua tahun.
+YEAR_BOUNDS = None
+# Mode "hanya agregat" (stream_aggregates.py): sumber dibaca per potongan dan hanya agregatnya yang
+# disimpan, untuk katalog yang lebih besar dari RAM. Total film dihitung per film, bukan per judul unik.
+AGGREGATES_ONLY = False
 
-    if 'Duration_Clean' in df_expanded.columns:
-        df_expanded = df_expanded.dropna(subset=['Duration_Clean'])
-    if 'Genre' in df_expanded.columns:
-        df_expanded = df_expanded[df_expanded['Genre'] != '']
 
-    return df, df_expanded
+@st.cache_resource(max_entries=1)
+def load_data(fingerprint):
+    """Memuat FilmStore (atau AggregateStore jika AGGREGATES_ONLY): kubus agregat tahun x genre dan indeks sutradara.
+
+    Satu instance hanya-baca dipakai bersama oleh semua sesi (tanpa salinan per rerun)
+    dan dimuat ulang ketika sidik jari file sumber berubah.
+    """
+    try:
+        loader = load_aggregate_store if AGGREGATES_ONLY else load_film_store
+        store = loader(DATA_SOURCES, YEAR_BOUNDS)
+    except FileNotFoundError:
+        st.error("File 'data_final.csv' atau 'IMDb_Data_final.csv' tidak ditemukan.")
+        return None
+    # Spec grafik yang tersimpan berasal dari data lama
+    filter_results_cache.clear()
+    return store
 
 
-df_original, df_expanded = load_data()
+store = load_data(source_fingerprint(*DATA_SOURCES))
 
 
 genre_color_map = {
@@ -246,7 +202,101 @@ genre_color_map = {
 }
 
 
-if df_original.empty or df_expanded.empty or 'ReleaseYear' not in df_expanded.columns or df_expanded['ReleaseYear'].empty:
+def build_stacked_bar(year_range, genres):
+    """Membuat grafik batang bertumpuk produksi film per tahun dan genre"""
+    movies_per_year_genre = store.year_genre_counts(year_range, genres)
+    if movies_per_year_genre.empty:
+        return None
+    fig_stacked_bar = px.bar(
+        movies_per_year_genre,
+        x='ReleaseYear', y='Jumlah Film', color='Genre',
+        labels={'ReleaseYear': 'Tahun Rilis', 'Jumlah Film': 'Jumlah Film Diproduksi'},
+        color_discrete_map=genre_color_map,
+        height=300
+    )
+    fig_stacked_bar.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+        legend_title_text='Genre', barmode='stack',
+        margin=dict(l=10, r=20, t=30, b=10),
+        legend=dict(font=dict(size=10))
+    )
+    return fig_stacked_bar
+
+
+def build_genre_bar(year_range, genres):
+    """Membuat grafik batang horizontal 10 genre dengan produksi terbanyak"""
+    top_10_genres_series = store.genre_counts(year_range, genres).nlargest(10)
+    if top_10_genres_series.empty:
+        return None
+    top_10_df = top_10_genres_series.reset_index()
+    top_10_df.columns = ['Genre', 'Jumlah Instance Genre']
+    fig_bar_genre_h = px.bar(
+        top_10_df,
+        x='Jumlah Instance Genre', y='Genre', orientation='h',
+        labels={'Jumlah Instance Genre': 'Jumlah Film', 'Genre': 'Genre'},
+        color='Genre', color_discrete_map=genre_color_map,
+        height=300
+    )
+    fig_bar_genre_h.update_layout(
+        yaxis={'categoryorder': 'total ascending'},
+        plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+        showlegend=False,
+        margin=dict(l=20, r=10, t=30, b=10)
+    )
+    return fig_bar_genre_h
+
+
+def build_rating_density(year_range, genres):
+    """Membuat density plot rating per genre dari histogram rating di kubus tahun x genre"""
+    # Histogram rating per (tahun, genre) diambil dari kubus, lalu semua kurva KDE dihitung sekaligus
+    group_labels_ratings, curve_x, curve_y = store.rating_density(year_range, genres, n_points=MAX_POINTS_PER_TRACE)
+    if not group_labels_ratings:
+        return None
+    plot_colors_ratings = [genre_color_map.get(genre, '#CCCCCC') for genre in group_labels_ratings]
+    fig_dist_rating = density_figure(group_labels_ratings, curve_x, curve_y, plot_colors_ratings)
+    fig_dist_rating.update_layout(
+        title_text='Distribusi Kepadatan Rating IMDb',
+        xaxis_title='Rating IMDb', yaxis_title='Kepadatan',
+        plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+        legend_title_text='Genre',
+        height=300,
+        margin=dict(l=10, r=20, t=30, b=10),
+        legend=dict(font=dict(size=10))
+    )
+    return fig_dist_rating
+
+
+def build_director_scatter(year_range, genres):
+    """Membuat scatter sutradara (min. 3 film, 15 teratas) dari statistik sutradara terfilter"""
+    directors_data = store.director_stats(year_range, genres)
+    directors_data = directors_data[directors_data['Title_Count'] >= 3].nlargest(15, 'Title_Count')
+    if directors_data.empty:
+        return None
+    fig_bubble = px.scatter(
+        directors_data,
+        x='Avg_IMDb_Rating', y='Unique_Genres',
+        # Director dan Title_Count sudah dikirim lewat text dan marker.color; memasukkannya ke
+        # hover_data akan menyalinnya lagi ke customdata
+        hover_data={'Avg_IMDb_Rating': ':.2f'},
+        title='Analisis Sutradara',
+        labels={'Avg_IMDb_Rating': 'Rata-Rata Rating', 'Unique_Genres': 'Jumlah Genre', 'Title_Count': 'Jumlah Film'},
+        color='Title_Count', color_continuous_scale='YlOrRd',
+        text='Director',
+        height=300
+    )
+    fig_bubble.update_traces(
+        marker=dict(size=12),
+        textposition='top center',
+        textfont=dict(size=8, color='#FFFFFF')
+    )
+    fig_bubble.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+        margin=dict(l=20, r=10, t=30, b=10)
+    )
+    return fig_bubble
+
+
+if store is None:
     st.warning("Gagal memuat atau memproses data, atau data tahun tidak tersedia. Tidak ada yang bisa ditampilkan.")
     st.markdown(f"""
     <div class="main-header">
@@ -256,86 +306,27 @@ if df_original.empty or df_expanded.empty or 'ReleaseYear' not in df_expanded.co
     """, unsafe_allow_html=True)
     st.stop()
 else:
-    min_year_data_available = int(df_expanded['ReleaseYear'].min())
-    max_year_data_available = int(df_expanded['ReleaseYear'].max())
+    min_year_data_available, max_year_data_available = store.year_bounds
 
     with st.sidebar:
         
         st.header("🎯 Filter Dashboard")
 
-        if 'slider_year_range' not in st.session_state:
-            st.session_state.slider_year_range = (min_year_data_available, max_year_data_available)
-        if 'start_year_input' not in st.session_state:
-            st.session_state.start_year_input = min_year_data_available
-        if 'end_year_input' not in st.session_state:
-            st.session_state.end_year_input = max_year_data_available
-        # Sinkronisasi dari slider ke input angka
-        def sync_slider_to_inputs():
-            st.session_state.start_year_input = st.session_state.year_slider[0]
-            st.session_state.end_year_input = st.session_state.year_slider[1]
-
-        # Sinkronisasi dari input angka ke slider
-        def sync_inputs_to_slider():
-            start_val = st.session_state.start_year_num_input
-            end_val = st.session_state.end_year_num_input
-
-        col_start_year, col_end_year = st.columns(2)
-        with col_start_year:
-            start_year_input_val = st.number_input(
-                "Tahun Awal:", min_value=min_year_data_available, max_value=max_year_data_available,
-                value=st.session_state.start_year_input, step=1, key="start_year_num_input",
-                on_change=sync_inputs_to_slider
-            )
-        with col_end_year:
-            end_year_input_val = st.number_input(
-                "Tahun Akhir:", min_value=min_year_data_available, max_value=max_year_data_available,
-                value=st.session_state.end_year_input, step=1, key="end_year_num_input",
-                on_change=sync_inputs_to_slider
-            )
-
-        if start_year_input_val > end_year_input_val:
-            st.warning("Tahun awal tidak boleh lebih besar dari tahun akhir.")
-            start_year_input_val = st.session_state.start_year_input
-            end_year_input_val = st.session_state.end_year_input
-        else:
-            st.session_state.start_year_input = start_year_input_val
-            st.session_state.end_year_input = end_year_input_val
-            st.session_state.slider_year_range = (start_year_input_val, end_year_input_val)
-
-        selected_year_range_slider = st.slider(
-            "Rentang Tahun Rilis:", 
-            min_value=min_year_data_available, 
-            max_value=max_year_data_available,
-            value=st.session_state.slider_year_range, 
-            key="year_slider",
-            on_change=sync_slider_to_inputs
-        )
-        if selected_year_range_slider != st.session_state.slider_year_range:
-            st.session_state.slider_year_range = selected_year_range_slider
-            st.session_state.start_year_input = selected_year_range_slider[0]
-            st.session_state.end_year_input = selected_year_range_slider[1]
-            # st.rerun()
-
-        selected_year_range = st.session_state.slider_year_range
+        selected_year_range = year_range_controls(min_year_data_available, max_year_data_available)
 
         st.markdown("##### Pilih Genre")
-        if 'Genre' in df_expanded.columns:
-            all_genres = sorted(list(df_expanded['Genre'].unique()))
-            top_5_genres_overall = df_expanded['Genre'].value_counts().nlargest(5).index.tolist() \
-                                   if not df_expanded.empty else []
-            valid_top_5_genres = [g for g in top_5_genres_overall if g in all_genres]
-            if not valid_top_5_genres and all_genres:
-                valid_top_5_genres = all_genres[:min(5, len(all_genres))]
-
-            selected_genres = st.multiselect(
-                "Genre yang ditampilkan:", 
-                options=all_genres, 
-                default=valid_top_5_genres, 
-                key="genre_multiselect"
-            )
-        else:
-            selected_genres = []
-            st.warning("Kolom 'Genre' tidak ditemukan dalam data.")
+        all_genres = store.genre_names
+        top_5_genres_overall = store.default_genres(5)
+        valid_top_5_genres = [g for g in top_5_genres_overall if g in all_genres]
+        if not valid_top_5_genres and all_genres:
+            valid_top_5_genres = all_genres[:min(5, len(all_genres))]
+
+        selected_genres = st.multiselect(
+            "Genre yang ditampilkan:", 
+            options=all_genres, 
+            default=valid_top_5_genres, 
+            key="genre_multiselect"
+        )
 
 st.markdown(f"""
 <div class="main-header">
@@ -344,18 +335,13 @@ st.markdown(f"""
 </div>
 """, unsafe_allow_html=True)
 
-df_filtered = df_expanded[
-    (df_expanded['ReleaseYear'] >= selected_year_range[0]) &
-    (df_expanded['ReleaseYear'] <= selected_year_range[1])
-]
-if selected_genres:
-    df_filtered = df_filtered[df_filtered['Genre'].isin(selected_genres)]
-elif not selected_genres and 'Genre' in df_expanded.columns:
+if not selected_genres:
     st.sidebar.info("Anda belum memilih genre. Menampilkan data untuk semua genre.")
 
+kpis = store.kpis(selected_year_range, selected_genres)
 kpi_col1, kpi_col2, kpi_col3, kpi_col4 = st.columns(4)
 with kpi_col1:
-    total_films = df_filtered['Title'].nunique() if not df_filtered.empty else 0
+    total_films = kpis.total_films
     st.markdown(
         f'<div class="kpi-card">'
         f'  <div class="kpi-value">{total_films:,}</div>'
@@ -364,7 +350,7 @@ with kpi_col1:
         unsafe_allow_html=True
     )
 with kpi_col2:
-    avg_rating_val = df_filtered['IMDb-Rating'].mean() if not df_filtered.empty and 'IMDb-Rating' in df_filtered.columns else 0
+    avg_rating_val = kpis.avg_rating
     avg_rating_display = f"{avg_rating_val:.1f}" if pd.notna(avg_rating_val) and avg_rating_val != 0 else "N/A"
     st.markdown(
         f'<div class="kpi-card">'
@@ -374,7 +360,7 @@ with kpi_col2:
         unsafe_allow_html=True
     )
 with kpi_col3:
-    avg_duration_val = df_filtered['Duration_Clean'].mean() if not df_filtered.empty and 'Duration_Clean' in df_filtered.columns else 0
+    avg_duration_val = kpis.avg_duration
     avg_duration_display = f"{avg_duration_val:.0f} menit" if pd.notna(avg_duration_val) and avg_duration_val != 0 else "N/A"
     st.markdown(
         f'<div class="kpi-card">'
@@ -384,11 +370,7 @@ with kpi_col3:
         unsafe_allow_html=True
     )
 with kpi_col4:
-    top_director_name = "N/A"
-    if not df_filtered.empty and 'Director' in df_filtered.columns:
-        director_counts = df_filtered.groupby('Director')['Title'].nunique().sort_values(ascending=False)
-        if not director_counts.empty:
-            top_director_name = director_counts.index[0]
+    top_director_name = store.top_director(selected_year_range, selected_genres) or "N/A"
     st.markdown(
         f'<div class="kpi-card">'
         f'  <div class="kpi-value" style="font-size:1.2rem; white-space:normal;">{top_director_name}</div>'
@@ -399,7 +381,7 @@ with kpi_col4:
 
 st.markdown("<hr style='margin-top:0.5rem; margin-bottom:0.5rem;'>", unsafe_allow_html=True)
 
-if df_filtered.empty:
+if kpis.row_count == 0:
     st.info("Tidak ada data yang cocok dengan filter yang dipilih. Silakan sesuaikan filter Anda.")
     st.stop()
 
@@ -413,55 +395,21 @@ with col1_container:
 with vis_row1_col1:
     st.markdown('<div class="chart-container">', unsafe_allow_html=True)
     st.write("##### Produksi Film Tahunan")
-    if 'ReleaseYear' in df_filtered.columns and 'Genre' in df_filtered.columns:
-        movies_per_year_genre = df_filtered.groupby(['ReleaseYear', 'Genre']).size().reset_index(name='Jumlah Film')
-        if not movies_per_year_genre.empty:
-            fig_stacked_bar = px.bar(
-                movies_per_year_genre,
-                x='ReleaseYear', y='Jumlah Film', color='Genre',
-                labels={'ReleaseYear': 'Tahun Rilis', 'Jumlah Film': 'Jumlah Film Diproduksi'},
-                color_discrete_map=genre_color_map,
-                height=300
-            )
-            fig_stacked_bar.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-                legend_title_text='Genre', barmode='stack',
-                margin=dict(l=10, r=20, t=30, b=10),
-                legend=dict(font=dict(size=10))
-            )
-            st.plotly_chart(fig_stacked_bar, use_container_width=True)
-        else:
-            st.info("Tidak ada data produksi film per tahun untuk filter yang dipilih.")
+    stacked_bar_fig = cached_figure('stacked_bar', build_stacked_bar, selected_year_range, selected_genres)
+    if stacked_bar_fig is not None:
+        st.plotly_chart(stacked_bar_fig, use_container_width=True)
     else:
-        st.info("Tidak cukup data untuk menampilkan grafik produksi film per tahun.")
+        st.info("Tidak ada data produksi film per tahun untuk filter yang dipilih.")
     st.markdown('</div>', unsafe_allow_html=True)
 
 with vis_row1_col2:
     st.markdown('<div class="chart-container-right">', unsafe_allow_html=True)
     st.write("##### Genre Film Terpopuler")
-    if 'Genre' in df_filtered.columns:
-        top_10_genres_series = df_filtered['Genre'].value_counts().nlargest(10)
-        if not top_10_genres_series.empty:
-            top_10_df = top_10_genres_series.reset_index()
-            top_10_df.columns = ['Genre', 'Jumlah Instance Genre']
-            fig_bar_genre_h = px.bar(
-                top_10_df,
-                x='Jumlah Instance Genre', y='Genre', orientation='h',
-                labels={'Jumlah Instance Genre': 'Jumlah Film', 'Genre': 'Genre'},
-                color='Genre', color_discrete_map=genre_color_map,
-                height=300
-            )
-            fig_bar_genre_h.update_layout(
-                yaxis={'categoryorder': 'total ascending'},
-                plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-                showlegend=False,
-                margin=dict(l=20, r=10, t=30, b=10)
-            )
-            st.plotly_chart(fig_bar_genre_h, use_container_width=True)
-        else:
-            st.info("Tidak ada data genre untuk ditampilkan dengan filter yang dipilih.")
+    genre_bar_fig = cached_figure('genre_bar', build_genre_bar, selected_year_range, selected_genres)
+    if genre_bar_fig is not None:
+        st.plotly_chart(genre_bar_fig, use_container_width=True)
     else:
-        st.info("Kolom 'Genre' tidak ditemukan untuk membuat grafik top genre.")
+        st.info("Tidak ada data genre untuk ditampilkan dengan filter yang dipilih.")
     st.markdown('</div>', unsafe_allow_html=True)
 
 st.markdown("<hr style='margin-top:0.5rem; margin-bottom:0.5rem;'>", unsafe_allow_html=True)
@@ -475,84 +423,22 @@ with vis_row2_col1:
     st.markdown('<div class="chart-container">', unsafe_allow_html=True)
     st.subheader("⭐ Distribusi Rating IMDb")
     st.write("Sebaran rating IMDb untuk genre yang dipilih.")
-    if 'Genre' in df_filtered.columns and 'IMDb-Rating' in df_filtered.columns:
-        hist_data_ratings = []
-        group_labels_ratings = []
-        plot_colors_ratings = []
-        genres_in_filtered_data = sorted(list(df_filtered['Genre'].unique()))
-
-        for genre in genres_in_filtered_data:
-            genre_ratings = df_filtered[df_filtered['Genre'] == genre]['IMDb-Rating'].dropna()
-            if len(genre_ratings) > 1:
-                hist_data_ratings.append(genre_ratings.tolist())
-                group_labels_ratings.append(genre)
-                plot_colors_ratings.append(genre_color_map.get(genre, '#CCCCCC'))
-
-        if hist_data_ratings and group_labels_ratings:
-            try:
-                fig_dist_rating = ff.create_distplot(
-                    hist_data_ratings, group_labels_ratings, colors=plot_colors_ratings,
-                    show_hist=False, show_rug=False, bin_size=0.2
-                )
-                fig_dist_rating.update_layout(
-                    title_text='Distribusi Kepadatan Rating IMDb',
-                    xaxis_title='Rating IMDb', yaxis_title='Kepadatan',
-                    plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-                    legend_title_text='Genre',
-                    height=300,
-                    margin=dict(l=10, r=20, t=30, b=10),
-                    legend=dict(font=dict(size=10))
-                )
-                st.plotly_chart(fig_dist_rating, use_container_width=True)
-            except Exception as e:
-                st.warning(f"Tidak dapat membuat density plot: {e}.")
-        else:
-            st.info("Tidak cukup data rating yang beragam untuk membuat density plot.")
+    rating_density_fig = cached_figure('rating_density', build_rating_density, selected_year_range, selected_genres)
+    if rating_density_fig is not None:
+        st.plotly_chart(rating_density_fig, use_container_width=True)
     else:
-        st.info("Tidak cukup data untuk menampilkan distribusi rating.")
+        st.info("Tidak cukup data rating yang beragam untuk membuat density plot.")
     st.markdown('</div>', unsafe_allow_html=True)
 
 with vis_row2_col2:
     st.markdown('<div class="chart-container-right">', unsafe_allow_html=True)
     st.subheader("🎭 Semesta Sutradara")
     st.write("Ukuran titik sama | Warna = Jumlah Film")
-    if 'Director' in df_filtered.columns and 'IMDb-Rating' in df_filtered.columns:
-        directors_data = df_filtered.groupby('Director').agg(
-            Title_Count=('Title', 'nunique'),
-            Avg_IMDb_Rating=('IMDb-Rating', 'mean'),
-            Unique_Genres=('Genre', 'nunique')
-        ).reset_index()
-        directors_data = directors_data[directors_data['Title_Count'] >= 3].nlargest(15, 'Title_Count')
-        if not directors_data.empty:
-            fig_bubble = px.scatter(
-                directors_data,
-                x='Avg_IMDb_Rating', y='Unique_Genres',
-                hover_data={
-                    'Director': True,
-                    'Title_Count': True,
-                    'Avg_IMDb_Rating': ':.2f',
-                    'Unique_Genres': True
-                },
-                title='Analisis Sutradara',
-                labels={'Avg_IMDb_Rating': 'Rata-Rata Rating', 'Unique_Genres': 'Jumlah Genre', 'Title_Count': 'Jumlah Film'},
-                color='Title_Count', color_continuous_scale='YlOrRd',
-                text='Director',
-                height=300
-            )
-            fig_bubble.update_traces(
-                marker=dict(size=12),
-                textposition='top center',
-                textfont=dict(size=8, color='#FFFFFF')
-            )
-            fig_bubble.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-                margin=dict(l=20, r=10, t=30, b=10)
-            )
-            st.plotly_chart(fig_bubble, use_container_width=True)
-        else:
-            st.info("Tidak cukup data sutradara (min. 3 film) untuk ditampilkan.")
+    director_scatter_fig = cached_figure('director_scatter', build_director_scatter, selected_year_range, selected_genres)
+    if director_scatter_fig is not None:
+        st.plotly_chart(director_scatter_fig, use_container_width=True)
     else:
-        st.info("Kolom 'Director' atau 'IMDb-Rating' tidak ditemukan.")
+        st.info("Tidak cukup data sutradara (min. 3 film) untuk ditampilkan.")
     st.markdown('</div>', unsafe_allow_html=True)
 
 st.markdown("<hr style='margin-top:0.5rem; margin-bottom:0.5rem;'>", unsafe_allow_html=True)
@@ -2,9 +2,17 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.express as px
-import plotly.figure_factory as ff
 import time
 from streamlit.components.v1 import html
+from data_utils import source_fingerprint
+from film_store import load_film_store
+from figure_cache import MAX_POINTS_PER_TRACE, cached_figure
+from filter_state import year_range_controls
+from instrumentation import (
+    count_rerun, finish_script_timer, record_action, render_timing_panel, start_script_timer, timed_section
+)
+from rating_density import density_figure
+from result_cache import filter_results_cache, normalize_filter_key
 
 st.set_page_config(
     page_title="Dashboard Tren Genre Film IMDb",
@@ -12,6 +20,8 @@ st.set_page_config(
     layout="wide",
     initial_sidebar_state="expanded"
 )
+start_script_timer()
+count_rerun()
 
 st.markdown("""
 <style>
@@ -194,86 +204,31 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-@st.cache_data
-def load_data():
-    """Memuat dan menyiapkan dataset IMDb"""
-    try:
-        df = pd.read_csv('data_final.csv')
-        
-        df = df.rename(columns={
-            'Name': 'Title',
-            'Directors': 'Director',
-            'Actors': 'Stars',
-            'Rating': 'IMDb-Rating',
-            'Genres': 'Category',
-            'Year': 'ReleaseYear'
-        })
-        
-        if 'Censor-board-rating' not in df.columns:
-            df['Censor-board-rating'] = 'Not Rated' 
-            
-    except FileNotFoundError:
-        try:
-            df = pd.read_csv('IMDb_Data_final.csv')
-        except FileNotFoundError:
-            st.error("File 'data_final.csv' atau 'IMDb_Data_final.csv' tidak ditemukan.")
-            return pd.DataFrame(), pd.DataFrame()
-
-    df['ReleaseYear'] = pd.to_numeric(df['ReleaseYear'], errors='coerce')
-    df.dropna(subset=['ReleaseYear'], inplace=True)
-    
-    if df['ReleaseYear'].empty:
-        st.warning("Kolom 'ReleaseYear' tidak memiliki data numerik yang valid setelah dibersihkan.")
-        return pd.DataFrame(), pd.DataFrame()
-
-    df['ReleaseYear'] = df['ReleaseYear'].astype(int)
-    df['Decade'] = (df['ReleaseYear'] // 10) * 10
-    df['Decade_Label'] = df['Decade'].astype(str) + 's'
-
-    def clean_duration(duration_str):
-        if pd.isna(duration_str):
-            return None
-        if isinstance(duration_str, (int, float)):
-            return duration_str
-        cleaned = str(duration_str).replace('min', '').strip()
-        try:
-            return int(cleaned)
-        except ValueError:
-            return None
-            
-    df['Duration_Clean'] = df['Duration'].apply(clean_duration)
-
-    genres_expanded = []
-    for idx, row in df.iterrows():
-        if pd.notna(row['Category']):
-            genres = str(row['Category']).split(',')
-            for genre_item in genres:
-                new_row = row.copy()
-                new_row['Genre'] = genre_item.strip()
-                if new_row['Genre']:
-                    genres_expanded.append(new_row)
-        else:
-            new_row = row.copy()
-            new_row['Genre'] = 'Unknown'
-            genres_expanded.append(new_row)
-
-    if not genres_expanded:
-        df_expanded = pd.DataFrame(columns=list(df.columns) + ['Genre'])
-    else:
-        df_expanded = pd.DataFrame(genres_expanded)
+# data_partitions/ (python build_data.py --partitions data_partitions) dipakai lebih dulu jika ada
+DATA_SOURCES = ('data_partitions', 'data_final.csv', 'IMDb_Data_final.csv')
+# Rentang tahun yang dimuat, mis. (2015, 2024) untuk deployment yang hanya butuh dekade terakhir;
+# dengan data_partitions/ hanya partisi dekade yang beririsan yang dibaca. None = semua tahun.
+YEAR_BOUNDS = None
 
-    if 'Duration_Clean' in df_expanded.columns:
-        df_expanded = df_expanded.dropna(subset=['Duration_Clean'])
-    if 'Genre' in df_expanded.columns:
-        df_expanded = df_expanded[df_expanded['Genre'] != '']
 
-    if 'IMDb-Rating' in df_expanded.columns:
-        df_expanded['IMDb-Rating'] = pd.to_numeric(df_expanded['IMDb-Rating'], errors='coerce')
+@st.cache_resource(max_entries=1)
+def load_data(fingerprint):
+    """Memuat FilmStore: tabel film beserta kubus agregat tahun x genre dan indeks film terbaik/peringkat.
 
-    return df, df_expanded
+    Satu instance hanya-baca dipakai bersama oleh semua sesi (tanpa salinan per rerun)
+    dan dimuat ulang ketika sidik jari file sumber berubah.
+    """
+    try:
+        store = load_film_store(DATA_SOURCES, YEAR_BOUNDS)
+    except FileNotFoundError:
+        st.error("File 'data_final.csv' atau 'IMDb_Data_final.csv' tidak ditemukan.")
+        return None
+    # Hasil filter yang tersimpan berasal dari data lama
+    filter_results_cache.clear()
+    return store
 
 
-df_original, df_expanded = load_data()
+store = load_data(source_fingerprint(*DATA_SOURCES))
 
 genre_color_map = {
     'Drama': '#E53935', 'Action': '#1E88E5', 'Comedy': '#FFB300', 
@@ -289,154 +244,127 @@ genre_color_map = {
 }
 
 
-if df_original.empty or df_expanded.empty or 'ReleaseYear' not in df_expanded.columns or df_expanded['ReleaseYear'].empty:
-    st.warning("Gagal memuat atau memproses data, atau data tahun tidak tersedia. Tidak ada yang bisa ditampilkan.")
-    st.markdown(f"""
-    <div class="main-header">
-        <h1>🎬 Dashboard Tren Genre Film IMDb</h1>
-        <p>Rentang tahun data tidak dapat ditentukan.</p>
-    </div>
-    """, unsafe_allow_html=True)
-    st.stop() 
-else:
-    min_year_data_available = int(df_expanded['ReleaseYear'].min())
-    max_year_data_available = int(df_expanded['ReleaseYear'].max())
+def compute_kpis(year_range, genres):
+    """Menghitung nilai keempat kartu KPI: (Kpis, baris film dengan rating tertinggi atau None)"""
+    return store.kpis(year_range, genres), store.top_rated_film(year_range, genres)
+
+
+def build_stacked_bar(year_range, genres):
+    """Membuat grafik batang bertumpuk produksi film per tahun dan genre"""
+    movies_per_year_genre = store.year_genre_counts(year_range, genres)
+    if movies_per_year_genre.empty:
+        return None
+    fig_stacked_bar = px.bar(
+        movies_per_year_genre,
+        x='ReleaseYear', y='Jumlah Film', color='Genre',
+        labels={'ReleaseYear': 'Tahun Rilis', 'Jumlah Film': 'Jumlah Film Diproduksi'},
+        color_discrete_map=genre_color_map, 
+        height=350
+    )
+    fig_stacked_bar.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+        legend_title_text='Genre', barmode='stack',
+        margin=dict(l=10, r=20, t=30, b=40), 
+        legend=dict(font=dict(size=10)) 
+    )
+    fig_stacked_bar.update_traces(
+        hovertemplate=
+            # Nama genre diambil dari nama trace, bukan customdata yang diulang per batang
+            'Genre = %{fullData.name}<br>'
+            'Tahun Rilis = %{x}<br>'
+            'Jumlah Film Diproduksi = %{y:.0f}'
+            '<extra></extra>'
+    )
+    return fig_stacked_bar
+
+
+def build_genre_bar(year_range, genres):
+    """Membuat grafik batang horizontal 10 genre dengan produksi terbanyak"""
+    top_10_genres_series = store.genre_counts(year_range, genres).nlargest(10)
+    if top_10_genres_series.empty:
+        return None
+    top_10_df = top_10_genres_series.reset_index()
+    top_10_df.columns = ['Genre', 'Jumlah Instance Genre'] 
+    fig_bar_genre_h = px.bar(
+        top_10_df,
+        x='Jumlah Instance Genre', y='Genre', orientation='h',
+        labels={'Jumlah Instance Genre': 'Jumlah Film', 'Genre': 'Genre'},
+        color='Genre', color_discrete_map=genre_color_map, 
+        height=350
+    )
+    fig_bar_genre_h.update_layout(
+        yaxis={'categoryorder':'total ascending'}, 
+        plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+        showlegend=False, 
+        margin=dict(l=20, r=10, t=30, b=40) 
+    )
+    fig_bar_genre_h.update_traces(
+        hovertemplate=
+            # 'Genre = %{y}<br>'
+            'Jumlah Film = %{x:.0f}'
+            '<extra></extra>'
+    )
+    return fig_bar_genre_h
+
+
+def build_rating_density(year_range, genres):
+    """Membuat density plot rating per genre dari histogram rating di kubus tahun x genre"""
+    group_labels_ratings, curve_x, curve_y = store.rating_density(year_range, genres, n_points=MAX_POINTS_PER_TRACE)
+    if not group_labels_ratings:
+        return None
+
+    plot_colors_ratings = [genre_color_map.get(genre, '#CCCCCC') for genre in group_labels_ratings]
+    fig_dist_rating = density_figure(group_labels_ratings, curve_x, curve_y, plot_colors_ratings)
+    fig_dist_rating.update_layout(
+        xaxis_title='Rating IMDb', 
+        yaxis_title='Kepadatan',
+        plot_bgcolor='rgba(0,0,0,0)', 
+        paper_bgcolor='rgba(0,0,0,0)',
+        legend_title_text='Genre',
+        height=300,
+        margin=dict(l=10, r=20, t=10, b=10), 
+        legend=dict(font=dict(size=10))
+    )
+    return fig_dist_rating
+
+
+def film_card_info(film_id):
+    """Menyiapkan teks kartu film (judul, rating, sutradara, pemain) dari satu baris films"""
+    film_row = store.films.iloc[film_id]
+    title = film_row.get('Title', 'N/A')
+    release_year = film_row.get('ReleaseYear', 'N/A')
+    rating_val = film_row.get('IMDb-Rating', 'N/A')
+    return {
+        'title_display': f"{title} ({int(release_year)})" if pd.notna(release_year) else title,
+        'rating_display': f"{rating_val:.1f}" if pd.notna(rating_val) else "N/A",
+        'director': film_row.get('Director', 'N/A'),
+        'stars': film_row.get('Stars', 'N/A'),
+    }
 
-    with st.sidebar:
-        st.header("Filter Dashboard")
-        st.markdown("""
-        <div style='
-            background-color: rgba(33, 150, 243, 0.1); 
-            border-left: 3px solid #2196F3; 
-            padding: 8px 12px; 
-            margin: 8px 0;
-            font-size: 0.75rem;
-            line-height: 1.3;
-        '>
-            Filter akan diterapkan ke seluruh visualisasi dalam dashboard.
-        </div>
-        """, unsafe_allow_html=True)
 
-        if 'slider_year_range' not in st.session_state:
-            st.session_state.slider_year_range = (min_year_data_available, max_year_data_available)
-        if 'start_year_input' not in st.session_state:
-            st.session_state.start_year_input = min_year_data_available
-        if 'end_year_input' not in st.session_state:
-            st.session_state.end_year_input = max_year_data_available
-        
-        def sync_slider_to_inputs():
-            st.session_state.start_year_input = st.session_state.year_slider[0]
-            st.session_state.end_year_input = st.session_state.year_slider[1]
-
-        def sync_inputs_to_slider():
-            start_val = st.session_state.start_year_num_input
-            end_val = st.session_state.end_year_num_input
-            if start_val <= end_val:
-                valid_start = max(min_year_data_available, min(start_val, max_year_data_available))
-                valid_end = min(max_year_data_available, max(end_val, min_year_data_available))
-                if valid_start <= valid_end:
-                    st.session_state.slider_year_range = (valid_start, valid_end)
-                    st.session_state.start_year_input = valid_start 
-                    st.session_state.end_year_input = valid_end   
-
-        col_start_year, col_end_year = st.columns(2)
-        with col_start_year:
-            start_year_input_val = st.number_input(
-                "Tahun Awal:", min_value=min_year_data_available, max_value=max_year_data_available,
-                value=st.session_state.start_year_input, step=1, key="start_year_num_input",
-                on_change=sync_inputs_to_slider,
-                help=f"Tahun paling awal data: {min_year_data_available}"
-            )
-        with col_end_year:
-            end_year_input_val = st.number_input(
-                "Tahun Akhir:", min_value=min_year_data_available, max_value=max_year_data_available,
-                value=st.session_state.end_year_input, step=1, key="end_year_num_input",
-                on_change=sync_inputs_to_slider,
-                help=f"Tahun paling akhir data: {max_year_data_available}"
-            )
-
-        if start_year_input_val > end_year_input_val:
-            st.warning("Tahun awal tidak boleh lebih besar dari tahun akhir.")
-        else:
-            st.session_state.start_year_input = start_year_input_val
-            st.session_state.end_year_input = end_year_input_val
-            st.session_state.slider_year_range = (start_year_input_val, end_year_input_val)
-
-        selected_year_range_slider = st.slider(
-            "Rentang Tahun Rilis:", 
-            min_value=min_year_data_available, 
-            max_value=max_year_data_available,
-            value=st.session_state.slider_year_range, 
-            key="year_slider",
-            on_change=sync_slider_to_inputs 
-        )
-        
-        if selected_year_range_slider != st.session_state.slider_year_range:
-            st.session_state.slider_year_range = selected_year_range_slider
-            st.session_state.start_year_input = selected_year_range_slider[0]
-            st.session_state.end_year_input = selected_year_range_slider[1]
-            st.rerun() 
+def compute_best_films(year_range, genres):
+    """Mencari hingga TOP_K film dengan rating tertinggi untuk setiap genre yang lolos filter"""
+    best_films = []
+    for genre in sorted(store.genre_counts(year_range, genres).index):
+        top_ids = store.top_films(year_range, genre)
+        best_films.append((genre, [film_card_info(film_id) for film_id in top_ids]))
+    return best_films
 
-        selected_year_range = st.session_state.slider_year_range
 
-        st.markdown("##### Pilih Genre")
-        if 'Genre' in df_expanded.columns:
-            all_genres_list = sorted(list(df_expanded['Genre'].unique()))
-
-            st.markdown("""
-                        <style>
-                        div[data-baseweb="select"] span{
-                            color: #0e1117 !important;
-                        }
-                        </style>
-                        """, unsafe_allow_html=True)
-
-            top_5_genres_overall = df_expanded['Genre'].value_counts().nlargest(5).index.tolist() \
-                                    if not df_expanded.empty else []
-            valid_top_5_genres = [g for g in top_5_genres_overall if g in all_genres_list]
-            if not valid_top_5_genres and all_genres_list:
-                valid_top_5_genres = all_genres_list[:min(5, len(all_genres_list))]
-
-            selected_genres_filter = st.multiselect(
-                "Genre yang ditampilkan:",
-                options=all_genres_list,
-                default=valid_top_5_genres,
-                key="genre_multiselect"
-            )
-        else:
-            selected_genres_filter = []
-            st.warning("Kolom 'Genre' tidak ditemukan dalam data.")
+def cached_result(name, compute_fn, year_range, genres):
+    """Mengambil hasil dari cache LRU lintas sesi, atau menghitungnya jika belum ada"""
+    key = (name,) + normalize_filter_key(year_range, genres)
+    return filter_results_cache.get_or_compute(key, lambda: compute_fn(year_range, genres))
 
-    st.markdown(f"""
-    <div class="main-header">
-        <h1>🎬 Dashboard Tren Genre Film IMDb</h1>
-    </div>
-    """, unsafe_allow_html=True)
-        # <p>Menganalisis Evolusi Sinema ({selected_year_range[0]}–{selected_year_range[1]})</p>
 
-    df_filtered = df_expanded[
-        (df_expanded['ReleaseYear'] >= selected_year_range[0]) &
-        (df_expanded['ReleaseYear'] <= selected_year_range[1])
-    ]
-    if selected_genres_filter: 
-        df_filtered = df_filtered[df_filtered['Genre'].isin(selected_genres_filter)]
-    elif not selected_genres_filter and 'Genre' in df_expanded.columns: 
-        st.sidebar.markdown("""
-        <div style='
-            background-color: rgba(33, 150, 243, 0.1); 
-            border-left: 3px solid #2196F3; 
-            padding: 8px 12px; 
-            margin: 8px 0;
-            font-size: 0.75rem;
-            line-height: 1.3;
-        '>
-            Genre belum dipilih. Menampilkan data untuk semua genre.
-        </div>
-        """, unsafe_allow_html=True)
+@timed_section('kpi')
+def kpi_section(year_range, genres):
+    """Kartu KPI. Bergantung pada: rentang tahun, genre (tanpa widget; ikut eksekusi skrip penuh)."""
+    kpis, top_rated_film = cached_result('kpi', compute_kpis, year_range, genres)
 
     kpi_col1, kpi_col2, kpi_col3, kpi_col4 = st.columns(4)
     with kpi_col1:
-        total_films = df_filtered['Title'].nunique() if not df_filtered.empty else 0
+        total_films = kpis.total_films
         st.markdown(
             f'<div class="kpi-card">'
             f'  <div class="kpi-value">{total_films:,}</div>'
@@ -445,7 +373,7 @@ else:
             unsafe_allow_html=True
         )
     with kpi_col2:
-        avg_rating_val = df_filtered['IMDb-Rating'].mean() if not df_filtered.empty and 'IMDb-Rating' in df_filtered.columns else 0
+        avg_rating_val = kpis.avg_rating
         avg_rating_display = f"{avg_rating_val:.1f}" if pd.notna(avg_rating_val) and avg_rating_val != 0 else "N/A"
         st.markdown(
             f'<div class="kpi-card">'
@@ -455,7 +383,7 @@ else:
             unsafe_allow_html=True
         )
     with kpi_col3:
-        avg_duration_val = df_filtered['Duration_Clean'].mean() if not df_filtered.empty and 'Duration_Clean' in df_filtered.columns else 0
+        avg_duration_val = kpis.avg_duration
         avg_duration_display = f"{avg_duration_val:.0f} menit" if pd.notna(avg_duration_val) and avg_duration_val != 0 else "N/A"
         st.markdown(
             f'<div class="kpi-card">'
@@ -466,23 +394,10 @@ else:
         )
     with kpi_col4:
         top_rated_film_title = "N/A"
-        top_rated_film_rating = ""
         top_rated_film_year = ""
-        if not df_filtered.empty and 'IMDb-Rating' in df_filtered.columns and 'Title' in df_filtered.columns:
-            df_temp_rating = df_filtered.copy()
-            df_temp_rating['IMDb-Rating'] = pd.to_numeric(df_temp_rating['IMDb-Rating'], errors='coerce')
-            df_temp_rating.dropna(subset=['IMDb-Rating', 'Title'], inplace=True)
-
-            if not df_temp_rating.empty:
-                top_film_series = df_temp_rating.sort_values(
-                    by=['IMDb-Rating', 'Title'], 
-                    ascending=[False, True]
-                ).drop_duplicates(subset=['Title'], keep='first')
-                
-                if not top_film_series.empty:
-                    highest_rated_film = top_film_series.loc[top_film_series['IMDb-Rating'].idxmax()]
-                    top_rated_film_title = highest_rated_film['Title']
-                    top_rated_film_year = f"{highest_rated_film['ReleaseYear']}"
+        if top_rated_film is not None:
+            top_rated_film_title = top_rated_film['Title']
+            top_rated_film_year = f"{top_rated_film['ReleaseYear']}"
         
         display_value = top_rated_film_title
         if top_rated_film_year and top_rated_film_title != "N/A":
@@ -498,12 +413,10 @@ else:
             unsafe_allow_html=True
         )
 
-    st.markdown("<hr style='margin-top:0.5rem; margin-bottom:0.5rem;'>", unsafe_allow_html=True)
-
-    if df_filtered.empty:
-        st.info("Tidak ada data yang cocok dengan filter yang dipilih. Silakan sesuaikan filter Anda.")
-        st.stop() 
 
+@timed_section('production_charts')
+def production_section(year_range, genres):
+    """Grafik produksi tahunan dan 10 genre teratas. Bergantung pada: rentang tahun, genre (ikut eksekusi skrip penuh)."""
     # st.subheader("📊 Analisis Produksi & Popularitas Genre Film")
 
     col1_container = st.container()
@@ -514,71 +427,231 @@ else:
         st.markdown('<div class="chart-container">', unsafe_allow_html=True) 
         st.write("##### 📈 Produksi Film Tahunan")
         st.write("Klik genre untuk melakukan filter · Klik 2x untuk fokus ke satu genre")
-        if 'ReleaseYear' in df_filtered.columns and 'Genre' in df_filtered.columns:
-            movies_per_year_genre = df_filtered.groupby(['ReleaseYear', 'Genre']).size().reset_index(name='Jumlah Film')
-            if not movies_per_year_genre.empty:
-                fig_stacked_bar = px.bar(
-                    movies_per_year_genre,
-                    x='ReleaseYear', y='Jumlah Film', color='Genre', custom_data=['Genre'],
-                    labels={'ReleaseYear': 'Tahun Rilis', 'Jumlah Film': 'Jumlah Film Diproduksi'},
-                    color_discrete_map=genre_color_map, 
-                    height=350
-                )
-                fig_stacked_bar.update_layout(
-                    plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-                    legend_title_text='Genre', barmode='stack',
-                    margin=dict(l=10, r=20, t=30, b=40), 
-                    legend=dict(font=dict(size=10)) 
-                )
-                fig_stacked_bar.update_traces(
-                    hovertemplate=
-                        'Genre = %{customdata[0]}<br>'
-                        'Tahun Rilis = %{x}<br>'
-                        'Jumlah Film Diproduksi = %{y:.0f}'
-                        '<extra></extra>'
-                )
-                st.plotly_chart(fig_stacked_bar, use_container_width=True)
-            else:
-                st.info("Tidak ada data produksi film per tahun untuk filter yang dipilih.")
+        stacked_bar_fig = cached_figure('stacked_bar', build_stacked_bar, year_range, genres)
+        if stacked_bar_fig is not None:
+            st.plotly_chart(stacked_bar_fig, use_container_width=True)
         else:
-            st.info("Tidak cukup data (kolom 'ReleaseYear' atau 'Genre' hilang) untuk menampilkan grafik produksi film per tahun.")
+            st.info("Tidak ada data produksi film per tahun untuk filter yang dipilih.")
         st.markdown('</div>', unsafe_allow_html=True)
 
     with vis_row1_col2:
         st.markdown('<div class="chart-container-right">', unsafe_allow_html=True) 
         st.write("##### 🎥 Total Produksi Film")
         st.write('Menampilkan hingga 10 genre teratas')
-        if 'Genre' in df_filtered.columns:
-            top_10_genres_series = df_filtered['Genre'].value_counts().nlargest(10)
-            if not top_10_genres_series.empty:
-                top_10_df = top_10_genres_series.reset_index()
-                top_10_df.columns = ['Genre', 'Jumlah Instance Genre'] 
-                fig_bar_genre_h = px.bar(
-                    top_10_df,
-                    x='Jumlah Instance Genre', y='Genre', orientation='h',
-                    labels={'Jumlah Instance Genre': 'Jumlah Film', 'Genre': 'Genre'},
-                    color='Genre', color_discrete_map=genre_color_map, 
-                    height=350
-                )
-                fig_bar_genre_h.update_layout(
-                    yaxis={'categoryorder':'total ascending'}, 
-                    plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-                    showlegend=False, 
-                    margin=dict(l=20, r=10, t=30, b=40) 
-                )
-                fig_bar_genre_h.update_traces(
-                    hovertemplate=
-                        # 'Genre = %{y}<br>'
-                        'Jumlah Film = %{x:.0f}'
-                        '<extra></extra>'
-                )
-                st.plotly_chart(fig_bar_genre_h, use_container_width=True)
-            else:
-                st.info("Tidak ada data genre untuk ditampilkan dengan filter yang dipilih.")
+        genre_bar_fig = cached_figure('genre_bar', build_genre_bar, year_range, genres)
+        if genre_bar_fig is not None:
+            st.plotly_chart(genre_bar_fig, use_container_width=True)
         else:
-            st.info("Kolom 'Genre' tidak ditemukan untuk membuat grafik top genre.")
+            st.info("Tidak ada data genre untuk ditampilkan dengan filter yang dipilih.")
         st.markdown('</div>', unsafe_allow_html=True)
 
+
+@timed_section('rating_density')
+def rating_density_section(year_range, genres):
+    """Density plot rating IMDb. Bergantung pada: rentang tahun, genre (ikut eksekusi skrip penuh)."""
+    st.markdown('<div class="chart-container">', unsafe_allow_html=True)
+    st.write("##### ⭐ Distribusi Rating IMDb")
+    st.write("Klik genre untuk melakukan filter · Klik 2x untuk fokus ke satu genre")
+    rating_density_fig = cached_figure('rating_density', build_rating_density, year_range, genres)
+    if rating_density_fig is not None:
+        st.plotly_chart(rating_density_fig, use_container_width=True)
+    else:
+        st.info("Tidak cukup data rating yang beragam (perlu >1 film per genre) untuk membuat density plot.")
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+@st.fragment
+@timed_section('best_films')
+def best_films_section(year_range, genres):
+    """Panel film terbaik per genre. Bergantung pada: rentang tahun, genre, pilihan jumlah film."""
+    st.markdown('<div class="chart-container-right">', unsafe_allow_html=True)
+    st.write("##### 🏆 Film Terbaik per Genre")
+    st.write("Klik pada nama genre untuk melihat detail film terbaiknya.")
+
+    top_n = st.radio("Jumlah film per genre", [1, 5, 10], horizontal=True, key='best_films_top_n')
+    best_films = cached_result('best_films', compute_best_films, year_range, genres)
+
+    def film_cards_html(current_genre, film_infos):
+        current_genre_color = genre_color_map.get(current_genre, '#FAFAFA')
+        return "".join(f"""
+            <div style="padding: 5px 10px; margin: 5px 0; border-left: 5px solid {current_genre_color}; background-color: #262730;">
+                <strong>Judul:</strong> {film_info['title_display']}<br>
+                <strong>Rating IMDb:</strong> {film_info['rating_display']} ⭐<br>
+                <strong>Sutradara:</strong> {film_info['director']}<br>
+                <strong>Pemain Utama:</strong> {film_info['stars']}
+            </div>
+        """ for film_info in film_infos[:top_n])
+
+    if not best_films:
+        st.info("Tidak ada genre spesifik dalam data yang difilter untuk menampilkan film terbaik.")
+    else:
+        # Case 1: <= 4 genres
+        if len(best_films) <= 4:
+            for current_genre, film_infos in best_films:
+                with st.expander(f"{current_genre}"):
+                    if film_infos:
+                        st.markdown(film_cards_html(current_genre, film_infos), unsafe_allow_html=True)
+
+        # Case 2: > 4 genres
+        else:
+            scroll_html = """
+                <div style='
+                    max-height: 320px;
+                    overflow-y: auto;
+                    padding: 10px;
+                    border: 3px solid #333;
+                    border-radius: 10px;
+                    margin-top: 10px;
+                    box-sizing: border-box;
+                '>
+            """
+
+            for idx, (current_genre, film_infos) in enumerate(best_films):
+                scroll_html += f"<details><summary>{current_genre}</summary>"
+                scroll_html += film_cards_html(current_genre, film_infos)
+                scroll_html += "</details>"
+                if idx < len(best_films) - 1:
+                    scroll_html += "<hr>"
+
+            scroll_html += "</div>"
+            st.markdown(scroll_html, unsafe_allow_html=True)
+
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+@st.fragment
+@timed_section('leaderboard')
+def leaderboard_section(year_range, genres):
+    """Papan peringkat film. Bergantung pada: rentang tahun, genre, halaman, ukuran halaman.
+
+    Halaman kembali ke 1 setiap kali rentang tahun, genre, atau ukuran halaman berubah.
+    """
+    st.write("##### 🏅 Papan Peringkat Film")
+    st.write("Film dengan rating tertinggi sesuai filter · Rating yang sama diurutkan menurut judul")
+
+    page_col, size_col = st.columns([1, 1])
+    with size_col:
+        page_size = st.selectbox("Film per halaman", [10, 25, 50], key='leaderboard_page_size')
+    # Nomor halaman lama tidak berlaku untuk hasil filter yang baru; diatur sebelum widget halaman dibuat
+    filter_key = normalize_filter_key(year_range, genres) + (page_size,)
+    if st.session_state.get('leaderboard_filter_key') != filter_key:
+        st.session_state['leaderboard_filter_key'] = filter_key
+        st.session_state['leaderboard_page'] = 1
+    with page_col:
+        page_number = st.number_input("Halaman", min_value=1, step=1, key='leaderboard_page')
+
+    page_film_ids, has_next_page = store.leaderboard_page(
+        year_range, genres, page=int(page_number) - 1, page_size=page_size
+    )
+    if len(page_film_ids) == 0:
+        st.info("Tidak ada film pada halaman ini. Silakan kembali ke halaman sebelumnya.")
+    else:
+        leaderboard_rows = store.films.iloc[page_film_ids]
+        first_rank = (int(page_number) - 1) * page_size + 1
+        st.dataframe(
+            pd.DataFrame({
+                'Peringkat': range(first_rank, first_rank + len(leaderboard_rows)),
+                'Judul': leaderboard_rows['Title'].astype(str).values,
+                'Tahun': leaderboard_rows['ReleaseYear'].values,
+                'Rating IMDb': leaderboard_rows['IMDb-Rating'].round(1).values,
+                'Genre': leaderboard_rows['Category'].astype(str).values,
+                'Sutradara': leaderboard_rows['Director'].astype(str).values,
+            }),
+            hide_index=True, use_container_width=True
+        )
+        page_status = "masih ada halaman berikutnya" if has_next_page else "halaman terakhir"
+        st.caption(f"Halaman {int(page_number)} · {page_status}")
+
+
+if store is None:
+    st.warning("Gagal memuat atau memproses data, atau data tahun tidak tersedia. Tidak ada yang bisa ditampilkan.")
+    st.markdown(f"""
+    <div class="main-header">
+        <h1>🎬 Dashboard Tren Genre Film IMDb</h1>
+        <p>Rentang tahun data tidak dapat ditentukan.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    st.stop() 
+else:
+    min_year_data_available, max_year_data_available = store.year_bounds
+
+    with st.sidebar:
+        st.header("Filter Dashboard")
+        st.markdown("""
+        <div style='
+            background-color: rgba(33, 150, 243, 0.1); 
+            border-left: 3px solid #2196F3; 
+            padding: 8px 12px; 
+            margin: 8px 0;
+            font-size: 0.75rem;
+            line-height: 1.3;
+        '>
+            Filter akan diterapkan ke seluruh visualisasi dalam dashboard.
+        </div>
+        """, unsafe_allow_html=True)
+
+        selected_year_range = year_range_controls(min_year_data_available, max_year_data_available)
+
+        st.markdown("##### Pilih Genre")
+        all_genres_list = store.genre_names
+
+        st.markdown("""
+                    <style>
+                    div[data-baseweb="select"] span{
+                        color: #0e1117 !important;
+                    }
+                    </style>
+                    """, unsafe_allow_html=True)
+
+        top_5_genres_overall = store.default_genres(5)
+        valid_top_5_genres = [g for g in top_5_genres_overall if g in all_genres_list]
+        if not valid_top_5_genres and all_genres_list:
+            valid_top_5_genres = all_genres_list[:min(5, len(all_genres_list))]
+
+        selected_genres_filter = st.multiselect(
+            "Genre yang ditampilkan:",
+            options=all_genres_list,
+            default=valid_top_5_genres,
+            key="genre_multiselect",
+            on_change=record_action,
+            args=('genre',)
+        )
+
+    st.markdown(f"""
+    <div class="main-header">
+        <h1>🎬 Dashboard Tren Genre Film IMDb</h1>
+    </div>
+    """, unsafe_allow_html=True)
+        # <p>Menganalisis Evolusi Sinema ({selected_year_range[0]}–{selected_year_range[1]})</p>
+
+    if not selected_genres_filter: 
+        st.sidebar.markdown("""
+        <div style='
+            background-color: rgba(33, 150, 243, 0.1); 
+            border-left: 3px solid #2196F3; 
+            padding: 8px 12px; 
+            margin: 8px 0;
+            font-size: 0.75rem;
+            line-height: 1.3;
+        '>
+            Genre belum dipilih. Menampilkan data untuk semua genre.
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Bagian yang punya widget sendiri (film terbaik, papan peringkat) adalah fragment: widget-nya
+    # hanya menjalankan ulang bagian itu. Bagian tanpa widget (KPI, grafik) hanya berubah lewat
+    # filter di sidebar, yang selalu menjalankan ulang seluruh skrip, sehingga bukan fragment.
+    kpi_section(selected_year_range, selected_genres_filter)
+
+    st.markdown("<hr style='margin-top:0.5rem; margin-bottom:0.5rem;'>", unsafe_allow_html=True)
+
+    filtered_kpis, _ = cached_result('kpi', compute_kpis, selected_year_range, selected_genres_filter)
+    if filtered_kpis.row_count == 0:
+        st.info("Tidak ada data yang cocok dengan filter yang dipilih. Silakan sesuaikan filter Anda.")
+        st.stop() 
+
+    production_section(selected_year_range, selected_genres_filter)
+
     st.markdown("<hr style='margin-top:0.5rem; margin-bottom:0.5rem;'>", unsafe_allow_html=True)
 
     col2_container = st.container()
@@ -586,149 +659,14 @@ else:
         vis_row2_col1, vis_row2_col2 = st.columns([1, 1]) 
 
     with vis_row2_col1:
-        st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-        st.write("##### ⭐ Distribusi Rating IMDb")
-        st.write("Klik genre untuk melakukan filter · Klik 2x untuk fokus ke satu genre")
-        if 'Genre' in df_filtered.columns and 'IMDb-Rating' in df_filtered.columns:
-            df_filtered_rating = df_filtered.copy()
-            df_filtered_rating['IMDb-Rating'] = pd.to_numeric(df_filtered_rating['IMDb-Rating'], errors='coerce')
-            df_filtered_rating.dropna(subset=['IMDb-Rating'], inplace=True)
-
-            hist_data_ratings = []
-            group_labels_ratings = []
-            plot_colors_ratings = []
-            
-            genres_in_filtered_data_rating = sorted(list(df_filtered_rating['Genre'].unique()))
-
-            for genre_item_rating in genres_in_filtered_data_rating: # Ganti nama variabel
-                genre_ratings = df_filtered_rating[df_filtered_rating['Genre'] == genre_item_rating]['IMDb-Rating']
-                if len(genre_ratings) > 1: 
-                    hist_data_ratings.append(genre_ratings.tolist())
-                    group_labels_ratings.append(genre_item_rating)
-                    plot_colors_ratings.append(genre_color_map.get(genre_item_rating, '#CCCCCC')) 
-
-            if hist_data_ratings and group_labels_ratings:
-                try:
-                    fig_dist_rating = ff.create_distplot(
-                        hist_data_ratings, group_labels_ratings, colors=plot_colors_ratings,
-                        show_hist=False, show_rug=False, bin_size=0.2 
-                    )
-                    fig_dist_rating.update_layout(
-                        xaxis_title='Rating IMDb', 
-                        yaxis_title='Kepadatan',
-                        plot_bgcolor='rgba(0,0,0,0)', 
-                        paper_bgcolor='rgba(0,0,0,0)',
-                        legend_title_text='Genre',
-                        height=300,
-                        margin=dict(l=10, r=20, t=10, b=10), 
-                        legend=dict(font=dict(size=10))
-                    )
-                    st.plotly_chart(fig_dist_rating, use_container_width=True)
-                except Exception as e:
-                    st.warning(f"Tidak dapat membuat density plot: {e}. Pastikan data rating cukup beragam.")
-            else:
-                st.info("Tidak cukup data rating yang beragam (perlu >1 film per genre) untuk membuat density plot.")
-        else:
-            st.info("Tidak cukup data (kolom 'Genre' atau 'IMDb-Rating' hilang/kosong) untuk menampilkan distribusi rating.")
-        st.markdown('</div>', unsafe_allow_html=True)
+        rating_density_section(selected_year_range, selected_genres_filter)
 
     with vis_row2_col2:
-        st.markdown('<div class="chart-container-right">', unsafe_allow_html=True)
-        st.write("##### 🏆 Film Terbaik per Genre")
-        st.write("Klik pada nama genre untuk melihat detail film terbaiknya.")
-
-        unique_genres_in_filtered_data = sorted(list(df_filtered['Genre'].unique()))
+        best_films_section(selected_year_range, selected_genres_filter)
 
-        if not unique_genres_in_filtered_data:
-            st.info("Tidak ada genre spesifik dalam data yang difilter untuk menampilkan film terbaik.")
-        else:
-            # Case 1: <= 4 genres
-            if len(unique_genres_in_filtered_data) <= 4:
-                for current_genre in unique_genres_in_filtered_data:
-                    with st.expander(f"{current_genre}"):
-                        genre_films_df = df_filtered[df_filtered['Genre'] == current_genre].copy()
-                        genre_films_df['IMDb-Rating'] = pd.to_numeric(genre_films_df['IMDb-Rating'], errors='coerce')
-                        genre_films_df['ReleaseYear'] = pd.to_numeric(genre_films_df['ReleaseYear'], errors='coerce')
-                        genre_films_df.dropna(subset=['IMDb-Rating', 'Title', 'ReleaseYear'], inplace=True)
-
-                        top_film = genre_films_df.sort_values(
-                            by=['IMDb-Rating', 'Title'], 
-                            ascending=[False, True]
-                        ).head(1)
-                        if not top_film.empty:
-                            film_row = top_film.iloc[0]
-                            title = film_row.get('Title', 'N/A')
-                            release_year = film_row.get('ReleaseYear', 'N/A')
-                            rating_val = film_row.get('IMDb-Rating', 'N/A')
-                            director = film_row.get('Director', 'N/A')
-                            stars = film_row.get('Stars', 'N/A')
-
-                            title_display = f"{title} ({int(release_year)})" if pd.notna(release_year) else title
-                            rating_display = f"{rating_val:.1f}" if pd.notna(rating_val) else "N/A"
-                            current_genre_color = genre_color_map.get(current_genre, '#FAFAFA')
-
-                            st.markdown(f"""
-                                <div style="padding: 5px 10px; margin: 5px 0; border-left: 5px solid {current_genre_color}; background-color: #262730;">
-                                    <strong>Judul:</strong> {title_display}<br>
-                                    <strong>Rating IMDb:</strong> {rating_display} ⭐<br>
-                                    <strong>Sutradara:</strong> {director}<br>
-                                    <strong>Pemain Utama:</strong> {stars}
-                                </div>
-                            """, unsafe_allow_html=True)
-
-            # Case 2: > 4 genres
-            else:
-                scroll_html = """
-                    <div style='
-                        max-height: 320px;
-                        overflow-y: auto;
-                        padding: 10px;
-                        border: 3px solid #333;
-                        border-radius: 10px;
-                        margin-top: 10px;
-                        box-sizing: border-box;
-                    '>
-                """
-
-                for idx, current_genre in enumerate(unique_genres_in_filtered_data):
-                    scroll_html += f"<details><summary>{current_genre}</summary>"
-
-                    genre_films_df = df_filtered[df_filtered['Genre'] == current_genre].copy()
-                    genre_films_df['IMDb-Rating'] = pd.to_numeric(genre_films_df['IMDb-Rating'], errors='coerce')
-                    genre_films_df['ReleaseYear'] = pd.to_numeric(genre_films_df['ReleaseYear'], errors='coerce')
-                    genre_films_df.dropna(subset=['IMDb-Rating', 'Title', 'ReleaseYear'], inplace=True)
-
-                    top_film = genre_films_df.sort_values(by='IMDb-Rating', ascending=False).head(1)
-                    if not top_film.empty:
-                        film_row = top_film.iloc[0]
-                        title = film_row.get('Title', 'N/A')
-                        release_year = film_row.get('ReleaseYear', 'N/A')
-                        rating_val = film_row.get('IMDb-Rating', 'N/A')
-                        director = film_row.get('Director', 'N/A')
-                        stars = film_row.get('Stars', 'N/A')
-
-                        title_display = f"{title} ({int(release_year)})" if pd.notna(release_year) else title
-                        rating_display = f"{rating_val:.1f}" if pd.notna(rating_val) else "N/A"
-                        current_genre_color = genre_color_map.get(current_genre, '#FAFAFA')
-
-                        film_card_html = f"""
-                            <div style="padding: 5px 10px; margin: 5px 0; border-left: 5px solid {current_genre_color}; background-color: #262730;">
-                                <strong>Judul:</strong> {title_display}<br>
-                                <strong>Rating IMDb:</strong> {rating_display} ⭐<br>
-                                <strong>Sutradara:</strong> {director}<br>
-                                <strong>Pemain Utama:</strong> {stars}
-                            </div>
-                        """
-                        scroll_html += film_card_html
-
-                    scroll_html += "</details>"
-                    if idx < len(unique_genres_in_filtered_data) - 1:
-                        scroll_html += "<hr>"
-
-                scroll_html += "</div>"
-                st.markdown(scroll_html, unsafe_allow_html=True)
+    st.markdown("<hr style='margin-top:0.5rem; margin-bottom:0.5rem;'>", unsafe_allow_html=True)
 
-        st.markdown('</div>', unsafe_allow_html=True)
+    leaderboard_section(selected_year_range, selected_genres_filter)
 
     st.markdown("<hr style='margin-top:0.5rem; margin-bottom:0.5rem;'>", unsafe_allow_html=True)
 
@@ -738,3 +676,6 @@ st.markdown("""
     <p>IF4061 Visualisasi Data.</p>
 </div>
 """, unsafe_allow_html=True)
+
+finish_script_timer()
+render_timing_panel()
@@ -0,0 +1,82 @@
+"""Membandingkan biaya per rerun antara st.cache_data dan store hanya-baca bersama.
+
+st.cache_data menyimpan hasil load_data() dalam bentuk pickle dan memberikan salinan
+hasil unpickle ke setiap pemanggil pada setiap rerun. Store bersama (st.cache_resource
++ freeze()) hanya mengembalikan referensi ke objek yang sama.
+
+Jalankan dari root repository:
+    python benchmarks/bench_data_store.py
+"""
+import os
+import pickle
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_utils import (
+    build_film_genre_model, build_year_genre_cube, clean_duration, compact_frame, explode_genres, freeze,
+    source_fingerprint
+)
+
+RERUNS = 50
+
+
+def load_frames():
+    df = pd.read_csv('data_final.csv').rename(columns={'Actors': 'Stars'})
+    df['Censor-board-rating'] = 'Not Rated'
+    df['Decade'] = (df['ReleaseYear'] // 10) * 10
+    df['Decade_Label'] = df['Decade'].astype(str) + 's'
+    df['Duration_Clean'] = clean_duration(df['Duration'])
+    df_expanded = explode_genres(df)
+    df = compact_frame(df)
+    films, film_genres = build_film_genre_model(df)
+    return df, compact_frame(df_expanded), build_year_genre_cube(films, film_genres)
+
+
+def total_bytes(frames):
+    return sum(int(frame.memory_usage(deep=True).sum()) for frame in frames if isinstance(frame, pd.DataFrame))
+
+
+def assert_read_only(frames):
+    """Memastikan setiap kolom hasil freeze() menolak penulisan (ValueError dari numpy)"""
+    for frame in frames:
+        if not isinstance(frame, pd.DataFrame):
+            continue
+        for column in frame.columns:
+            try:
+                frame.iloc[0, frame.columns.get_loc(column)] = frame[column].iloc[0]
+            except ValueError:
+                continue
+            raise AssertionError(f"kolom {column!r} masih bisa ditulis setelah freeze()")
+
+
+def main():
+    value = load_frames()
+    pickled = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    # Perilaku lama: setiap rerun membaca salinan hasil unpickle
+    start = time.perf_counter()
+    for _ in range(RERUNS):
+        pickle.loads(pickled)
+    cache_data_ms = (time.perf_counter() - start) / RERUNS * 1000
+
+    # Perilaku baru: satu instance hanya-baca, kunci berupa sidik jari file sumber
+    value = freeze(value)
+    assert_read_only(value)
+    shared = {source_fingerprint('data_final.csv'): value}
+    start = time.perf_counter()
+    for _ in range(RERUNS):
+        shared[source_fingerprint('data_final.csv')]
+    shared_ms = (time.perf_counter() - start) / RERUNS * 1000
+
+    print(f"ukuran pickle            : {len(pickled) / 1e6:,.1f} MB")
+    print(f"salinan per sesi (lama)  : {total_bytes(value) / 1e6:,.1f} MB")
+    print(f"st.cache_data per rerun  : {cache_data_ms:,.2f} ms")
+    print(f"store bersama per rerun  : {shared_ms:,.4f} ms")
+    print(f"percepatan               : {cache_data_ms / shared_ms:,.0f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""Benchmark pemecahan genre (explode_genres) pada katalog sintetis berukuran besar.
+
+Jalankan dari root repository:
+    python benchmarks/bench_explode_genres.py [faktor_pengali ...]
+
+Dataset `data_final.csv` diduplikasi sebanyak faktor pengali sehingga terlihat
+apakah waktu proses tumbuh linear terhadap jumlah baris.
+"""
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_utils import clean_duration, explode_genres
+
+
+def prepare(df):
+    df = df.copy()
+    df['Duration_Clean'] = clean_duration(df['Duration'])
+    return explode_genres(df)
+
+
+def main():
+    factors = [int(arg) for arg in sys.argv[1:]] or [1, 10, 30, 100]
+    base_df = pd.read_csv('data_final.csv')
+
+    print(f"{'baris':>12} {'baris hasil':>12} {'detik':>10} {'us/baris':>10}")
+    for factor in factors:
+        df = pd.concat([base_df] * factor, ignore_index=True)
+        start = time.perf_counter()
+        df_expanded = prepare(df)
+        elapsed = time.perf_counter() - start
+        print(f"{len(df):>12,} {len(df_expanded):>12,} {elapsed:>10.3f} {elapsed / len(df) * 1e6:>10.2f}")
+        del df, df_expanded
+
+
+if __name__ == '__main__':
+    main()
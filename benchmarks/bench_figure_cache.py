@@ -0,0 +1,75 @@
+"""Membandingkan biaya menampilkan grafik: membangun figure setiap rerun vs figure dari cache.
+
+Tanpa cache, setiap rerun menjalankan plotly.express, lalu st.plotly_chart memvalidasi
+figure dan menserialisasinya ke JSON. Dengan figure_cache, saat cache hit yang tersisa
+hanya pencarian kunci (chart_id, filter) di cache LRU dan serialisasi di st.plotly_chart.
+Kedua angka diukur lewat st.plotly_chart sungguhan (mode bare, tanpa server).
+
+Jalankan dari root repository:
+    python benchmarks/bench_figure_cache.py
+"""
+import logging
+import os
+import sys
+import time
+
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_utils import (
+    build_film_genre_model, build_year_genre_cube, clean_duration, compact_frame, cube_counts_per_year_genre
+)
+from figure_cache import cached_figure, figure_spec
+from result_cache import filter_results_cache
+
+REPEATS = 20
+YEAR_RANGE = (1990, 2020)
+GENRES = ['Action', 'Comedy', 'Drama', 'Horror', 'Romance']
+
+# st.plotly_chart di luar `streamlit run` mencatat peringatan ScriptRunContext pada setiap panggilan
+logging.getLogger('streamlit').setLevel(logging.ERROR)
+
+
+def load_cube():
+    df = pd.read_csv('data_final.csv').rename(columns={'Actors': 'Stars'})
+    df['Duration_Clean'] = clean_duration(df['Duration'])
+    films, film_genres = build_film_genre_model(compact_frame(df))
+    return build_year_genre_cube(films, film_genres)
+
+
+def render_ms(render):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        render()
+    return (time.perf_counter() - start) / REPEATS * 1000
+
+
+def main():
+    cube = load_cube()
+
+    def build_stacked_bar(year_range, genres):
+        data = cube_counts_per_year_genre(cube, year_range, genres)
+        return px.bar(data, x='ReleaseYear', y='Jumlah Film', color='Genre', height=350)
+
+    # Perilaku lama: px + validasi dan serialisasi di st.plotly_chart pada setiap rerun
+    rebuild_ms = render_ms(lambda: st.plotly_chart(build_stacked_bar(YEAR_RANGE, GENRES), use_container_width=True))
+
+    # Perilaku baru: Figure tervalidasi disimpan per (chart_id, filter)
+    filter_results_cache.clear()
+    fig = cached_figure('stacked_bar', build_stacked_bar, YEAR_RANGE, GENRES)
+    hit_ms = render_ms(lambda: cached_figure('stacked_bar', build_stacked_bar, YEAR_RANGE, GENRES))
+    hit_render_ms = render_ms(lambda: st.plotly_chart(
+        cached_figure('stacked_bar', build_stacked_bar, YEAR_RANGE, GENRES), use_container_width=True
+    ))
+
+    print(f"ukuran spec JSON           : {len(figure_spec(fig)) / 1e3:,.1f} KB")
+    print(f"bangun + st.plotly_chart   : {rebuild_ms:,.2f} ms")
+    print(f"cache hit (pencarian)      : {hit_ms:,.4f} ms")
+    print(f"cache hit + st.plotly_chart: {hit_render_ms:,.2f} ms")
+    print(f"percepatan (dengan render) : {rebuild_ms / hit_render_ms:,.1f}x")
+
+
+if __name__ == '__main__':
+    main()
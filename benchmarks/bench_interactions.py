@@ -0,0 +1,44 @@
+"""Mengukur waktu server per interaksi di app2.py: rerun skrip penuh vs rerun fragment.
+
+Sebelum app2.py dibagi menjadi fragment, setiap interaksi menjalankan ulang seluruh skrip.
+Sesudahnya, kontrol di dalam satu bagian hanya menjalankan ulang fragment bagian itu.
+Skrip ini menjalankan app2.py lewat streamlit.testing (yang selalu menjalankan skrip penuh)
+dan membaca catatan waktu dari instrumentation.timed_section() untuk kedua angka tersebut.
+
+Jalankan dari root repository:
+    python benchmarks/bench_interactions.py
+"""
+import os
+import sys
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPEATS = 5
+
+# (nama interaksi, bagian yang memiliki kontrol tersebut, fungsi yang mengubah kontrol)
+INTERACTIONS = [
+    ('jumlah film per genre', 'best_films', lambda at, i: at.radio(key='best_films_top_n').set_value([5, 10][i % 2])),
+    ('halaman papan peringkat', 'leaderboard', lambda at, i: at.number_input(key='leaderboard_page').set_value(i + 2)),
+    ('ukuran halaman', 'leaderboard', lambda at, i: at.selectbox(key='leaderboard_page_size').set_value([25, 50][i % 2])),
+]
+
+
+def main():
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+    at = AppTest.from_file('app2.py', default_timeout=300).run()
+
+    print(f"{'interaksi':<26}{'skrip penuh (ms)':>18}{'fragment (ms)':>16}")
+    for name, section, interact in INTERACTIONS:
+        script_ms, section_ms = [], []
+        for i in range(REPEATS):
+            interact(at, i).run()
+            timings = at.session_state['section_timings']
+            script_ms.append(timings['script']['last_ms'])
+            section_ms.append(timings[section]['last_ms'])
+        print(f"{name:<26}{sorted(script_ms)[REPEATS // 2]:>18.1f}{sorted(section_ms)[REPEATS // 2]:>16.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+"""Membandingkan pemakaian memori df_expanded sebelum dan sesudah compact_frame().
+
+Jalankan dari root repository:
+    python benchmarks/bench_memory.py
+"""
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_utils import clean_duration, compact_frame, explode_genres, memory_report
+
+
+def main():
+    df = pd.read_csv('data_final.csv').rename(columns={'Actors': 'Stars'})
+    df['Censor-board-rating'] = 'Not Rated'
+    df['Decade'] = (df['ReleaseYear'] // 10) * 10
+    df['Decade_Label'] = df['Decade'].astype(str) + 's'
+    df['Duration_Clean'] = clean_duration(df['Duration'])
+    df_expanded = explode_genres(df)
+
+    before = memory_report(df_expanded)
+    after = memory_report(compact_frame(df_expanded))
+    report = before.join(after, lsuffix='_awal', rsuffix='_ringkas', how='outer')
+    report['rasio'] = report['bytes_awal'] / report['bytes_ringkas']
+    print(report.fillna('-').to_string(float_format=lambda x: f'{x:,.1f}'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""Membandingkan puncak memori pemuatan penuh (FilmStore) dan pemuatan streaming (AggregateStore).
+
+Pemuatan penuh membaca seluruh CSV lalu membangun tabel film; pemuatan streaming hanya
+menyimpan satu potongan baris dan agregatnya, sehingga puncak memorinya ditentukan oleh
+ukuran potongan dan jumlah kunci agregat, bukan jumlah baris.
+
+Jalankan dari root repository:
+    python benchmarks/bench_stream_aggregates.py
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from film_store import load_aggregate_store, load_film_store
+
+SOURCES = ('data_final.csv',)
+
+
+def measure(load):
+    tracemalloc.start()
+    start = time.perf_counter()
+    load()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1e6, elapsed
+
+
+def main():
+    # year_bounds diisi agar snapshot Parquet tidak dipakai dan CSV benar-benar dibaca
+    runs = [('penuh (FilmStore)', lambda: load_film_store(SOURCES, year_bounds=(0, 9999)))]
+    for chunksize in (2_000, 10_000, 50_000):
+        runs.append((f'streaming, potongan {chunksize:,}',
+                     lambda chunksize=chunksize: load_aggregate_store(SOURCES, chunksize=chunksize)))
+
+    for label, load in runs:
+        peak_mb, elapsed = measure(load)
+        print(f"{label:<28}: puncak {peak_mb:7.1f} MB, {elapsed:5.2f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,272 @@
+"""Membangun data_final.csv dari file CSV per tahun di dataset_csv/.
+
+Pengganti gabungkan_csv_dalam_folder di scraping_stuff/combine.ipynb. File dibaca paralel
+dengan process pool, dan manifest (mtime, ukuran, hash per file) di .cache/ membuat build
+berikutnya hanya memproses file baru: menambah 2025_final.csv cukup menambahkan barisnya
+ke akhir data_final.csv. Jika ada file lama yang berubah atau hilang, output dibangun ulang.
+
+Baris duplikat (judul, tahun, sutradara ternormalkan; lihat dedup.py), misalnya dari scraper
+yang dijalankan ulang per batch, digabung menjadi satu rekaman terlengkap. Baris yang dibuang
+dicatat di quarantine/<output>-duplicates.csv.
+
+Dengan --partitions, data yang sama juga ditulis sebagai dataset Parquet berpartisi dekade
+(partitions.py); saat append hanya partisi dekade yang menerima baris baru yang ditulis ulang.
+Folder partisi dicatat di manifest, sehingga build berikutnya tanpa --partitions tetap
+memperbaruinya.
+
+Jalankan dari root repository:
+    python build_data.py [--source dataset_csv] [--output data_final.csv] [--partitions data_partitions]
+                         [--workers N] [--full]
+"""
+import argparse
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from data_utils import SNAPSHOT_DIR, file_hash
+from dedup import KEY_COLUMNS, dedup_keys, merge_duplicates
+from partitions import append_partitions, write_partitions
+from schema_adapters import SCRAPE_ADAPTER, normalize_chunk, read_normalized
+from validation import QUARANTINE_DIR, QuarantineWriter, Validator
+
+# Naikkan jika normalize_year_file() atau penggabungan duplikat berubah agar output lama dibangun ulang
+BUILD_VERSION = 4
+
+# Kolom hasil scraping -> kolom data_final.csv (sama dengan rename di combine.ipynb)
+FILE_COLUMNS = {
+    'Name': 'Title',
+    'Year': 'ReleaseYear',
+    'Directors': 'Director',
+    'Rating': 'IMDb-Rating',
+    'Genres': 'Category',
+}
+OUTPUT_COLUMNS = ['Title', 'ReleaseYear', 'Duration', 'Director', 'Actors', 'Category', 'IMDb-Rating']
+
+
+def normalize_year_file(path):
+    """Membaca satu file per tahun dan menyamakan header serta tipe kolomnya ke format data_final.csv"""
+    # utf-8-sig membuang BOM (2000_final.csv dst. disimpan dari Excel)
+    df = pd.read_csv(path, encoding='utf-8-sig')
+    df.columns = df.columns.str.replace('\ufeff', '', regex=False).str.strip()
+    df = df.drop(columns='ID', errors='ignore').rename(columns=FILE_COLUMNS)
+
+    # Durasi ditulis "145" di file 1990-an dan "166.0" di file _final: keduanya disimpan sebagai float
+    # agar baris yang ditambahkan belakangan ditulis dengan format yang sama
+    df['Duration'] = pd.to_numeric(df['Duration'], errors='coerce').astype(float)
+    df['IMDb-Rating'] = pd.to_numeric(df['IMDb-Rating'], errors='coerce').astype(float)
+    df['ReleaseYear'] = pd.to_numeric(df['ReleaseYear'], errors='coerce')
+    # Hanya baris tanpa kunci duplikat yang dibuang di sini; baris yang kosong di kolom lain ikut
+    # digabung dan baru dibuang oleh merge_year_frames() bila tidak ada salinan yang lebih lengkap
+    df = df[OUTPUT_COLUMNS].dropna(subset=KEY_COLUMNS)
+    df['ReleaseYear'] = df['ReleaseYear'].astype(int)
+    # Asal baris (file:nomor baris CSV) untuk laporan duplikat
+    df['Source'] = os.path.basename(path) + ':' + (df.index + 2).astype(str)
+    return df
+
+
+def manifest_path(output_path):
+    stem = os.path.splitext(os.path.basename(output_path))[0]
+    return os.path.join(SNAPSHOT_DIR, f"{stem}.manifest.json")
+
+
+def load_manifest(output_path):
+    """Manifest build sebelumnya, atau None jika tidak ada / tidak cocok dengan output saat ini"""
+    try:
+        with open(manifest_path(output_path)) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get('version') != BUILD_VERSION or not os.path.exists(output_path):
+        return None
+    # Output yang diubah di luar build tidak bisa ditambah dengan aman
+    if manifest.get('output_hash') != file_hash(output_path):
+        return None
+    return manifest
+
+
+def recorded_partitions(output_path):
+    """Folder partisi yang dicatat manifest terakhir (tanpa cek versi/hash) jika masih ada, atau None"""
+    try:
+        with open(manifest_path(output_path)) as f:
+            partitions_dir = json.load(f).get('partitions')
+    except (OSError, ValueError, AttributeError):
+        return None
+    return partitions_dir if partitions_dir and os.path.isdir(partitions_dir) else None
+
+
+def save_manifest(output_path, files, partitions_dir=None):
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    manifest = {
+        'version': BUILD_VERSION, 'output_hash': file_hash(output_path), 'files': files,
+        'partitions': partitions_dir,
+    }
+    path = manifest_path(output_path)
+    with open(path + '.tmp', 'w') as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(path + '.tmp', path)
+
+
+def file_entry(path, previous=None):
+    """Entri manifest {mtime_ns, size, sha256}; hash hanya dihitung ulang jika mtime/ukuran berubah"""
+    stat = os.stat(path)
+    if previous and previous['mtime_ns'] == stat.st_mtime_ns and previous['size'] == stat.st_size:
+        return dict(previous)
+    return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': file_hash(path)}
+
+
+def plan_build(paths, manifest):
+    """Menentukan file yang perlu diproses: (mode 'append' atau 'full', daftar path, entri manifest baru)"""
+    previous = manifest['files'] if manifest else {}
+    entries = {path: file_entry(path, previous.get(path)) for path in paths}
+    if not manifest:
+        return 'full', paths, entries
+
+    unchanged = [
+        path for path in paths
+        if path in previous and previous[path]['sha256'] == entries[path]['sha256']
+    ]
+    new_paths = [path for path in paths if path not in previous]
+    # Append hanya aman jika semua file lama masih ada tanpa perubahan dan file baru berada
+    # di akhir urutan, sehingga hasilnya sama dengan build penuh
+    append_ok = (
+        len(unchanged) == len(previous)
+        and all(new > max(previous) for new in new_paths)
+    )
+    if append_ok:
+        return 'append', new_paths, entries
+    return 'full', paths, entries
+
+
+def read_year_files(paths, workers):
+    """Membaca dan menormalkan file secara paralel; hasil tetap berurutan sesuai paths"""
+    if workers <= 1 or len(paths) <= 1:
+        return [normalize_year_file(path) for path in paths]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(normalize_year_file, paths))
+
+
+def merge_year_frames(frames):
+    """Menggabungkan frame per tahun dan menyisakan satu rekaman terlengkap per kunci duplikat.
+
+    Baris yang masih memiliki kolom kosong dibuang setelah penggabungan, sehingga salinan
+    yang lebih lengkap menang lewat skor kelengkapan (dedup.completeness()) dan salinan tidak
+    lengkap tercatat di laporan. Kunci yang rekaman terlengkapnya pun tidak lengkap tidak
+    ditulis dan tidak dilaporkan.
+    Mengembalikan (DataFrame berkolom OUTPUT_COLUMNS, laporan baris yang dibuang).
+    """
+    df = pd.concat(frames, ignore_index=True)
+    merged, report = merge_duplicates(df[OUTPUT_COLUMNS], sources=df['Source'])
+    incomplete = merged.isna().any(axis=1)
+    report = report[~report['Kept_Source'].isin(df['Source'].to_numpy()[merged.index[incomplete]])]
+    return merged[~incomplete], report.reset_index(drop=True)
+
+
+def overlaps_output(df, output_path):
+    """Apakah ada baris df yang kuncinya sudah ada di output (hanya kolom kunci yang dibaca)"""
+    existing = pd.read_csv(output_path, usecols=KEY_COLUMNS)
+    return bool(pd.Series(dedup_keys(df)).isin(dedup_keys(existing)).any())
+
+
+def merge_report_path(output_path):
+    stem = os.path.splitext(os.path.basename(output_path))[0]
+    return os.path.join(QUARANTINE_DIR, f"{stem}-duplicates.csv")
+
+
+def write_merge_report(report, output_path, append):
+    """Menulis laporan duplikat; build penuh mengganti laporan lama, append menambahkannya"""
+    path = merge_report_path(output_path)
+    if report.empty:
+        if not append and os.path.exists(path):
+            os.remove(path)
+        return
+    os.makedirs(QUARANTINE_DIR, exist_ok=True)
+    header = not (append and os.path.exists(path))
+    report.to_csv(path, mode='a' if append else 'w', header=header, index=False)
+
+
+def build(source_dir, output_path, workers=None, full=False, partitions_dir=None):
+    """Membangun output (dan dataset berpartisi jika partitions_dir diisi) dari source_dir.
+
+    Jika partitions_dir kosong, folder partisi yang dicatat build sebelumnya tetap diperbarui:
+    aplikasi memilih data_partitions/ lebih dulu daripada CSV, sehingga partisi tidak boleh
+    tertinggal dari output. Mengembalikan ringkasan build (dict).
+    """
+    paths = sorted(glob.glob(os.path.join(source_dir, '*.csv')))
+    if not paths:
+        raise FileNotFoundError(f"Tidak ada file CSV di folder: {source_dir}")
+    partitions_dir = partitions_dir or recorded_partitions(output_path)
+
+    workers = workers or os.cpu_count() or 1
+    manifest = None if full else load_manifest(output_path)
+    mode, to_process, entries = plan_build(paths, manifest)
+    frames = read_year_files(to_process, workers)
+    new_rows, report = merge_year_frames(frames) if frames else (None, pd.DataFrame())
+    if mode == 'append' and new_rows is not None and overlaps_output(new_rows, output_path):
+        # Rekaman terlengkap bisa berada di baris yang sudah tertulis, sehingga output dibangun ulang
+        mode, to_process = 'full', paths
+        frames = read_year_files(paths, workers)
+        new_rows, report = merge_year_frames(frames)
+    rows = 0 if new_rows is None else len(new_rows)
+
+    if mode == 'append':
+        if new_rows is not None:
+            new_rows.to_csv(output_path, mode='a', header=False, index=False)
+    else:
+        tmp_path = output_path + '.tmp'
+        new_rows.to_csv(tmp_path, index=False)
+        os.replace(tmp_path, output_path)
+    write_merge_report(report, output_path, append=mode == 'append')
+
+    decades = []
+    if partitions_dir:
+        # Partisi hanya bisa ditambah jika build sebelumnya juga menulis ke folder yang sama
+        partitions_synced = (
+            mode == 'append' and manifest.get('partitions') == partitions_dir and os.path.isdir(partitions_dir)
+        )
+        if not partitions_synced:
+            decades = write_partitions(read_normalized([output_path]), partitions_dir)
+        elif new_rows is not None:
+            # Baris baru divalidasi seperti read_normalized(); penolakannya ditambahkan ke karantina output
+            valid_rows = normalize_chunk(SCRAPE_ADAPTER, new_rows, Validator(), QuarantineWriter(output_path, append=True))
+            decades = append_partitions(valid_rows, partitions_dir)
+
+    save_manifest(output_path, entries, partitions_dir)
+    return {
+        'mode': mode, 'files': len(paths), 'processed': len(to_process), 'rows_written': rows,
+        'duplicates_dropped': len(report), 'partitions_dir': partitions_dir, 'partitions_written': decades,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Membangun data_final.csv dari file CSV per tahun")
+    parser.add_argument('--source', default='dataset_csv', help="folder berisi file CSV per tahun")
+    parser.add_argument('--output', default='data_final.csv', help="path file CSV gabungan")
+    parser.add_argument(
+        '--partitions', default=None,
+        help="folder dataset Parquet berpartisi dekade (opsional; default: folder yang dicatat build sebelumnya)"
+    )
+    parser.add_argument('--workers', type=int, default=None, help="jumlah proses (default: jumlah CPU)")
+    parser.add_argument('--full', action='store_true', help="abaikan manifest dan bangun ulang seluruh output")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    summary = build(args.source, args.output, workers=args.workers, full=args.full, partitions_dir=args.partitions)
+    elapsed = time.perf_counter() - start
+    if summary['partitions_written']:
+        print(f"{summary['partitions_dir']}: partisi dekade ditulis {summary['partitions_written']}")
+    if summary['mode'] == 'append' and summary['processed'] == 0 and not summary['partitions_written']:
+        print(f"{args.output} sudah mutakhir ({summary['files']} file, {elapsed:.2f} s)")
+    else:
+        print(
+            f"{args.output}: build {summary['mode']}, {summary['processed']}/{summary['files']} file diproses, "
+            f"{summary['rows_written']:,} baris ditulis, {summary['duplicates_dropped']:,} duplikat digabung "
+            f"({elapsed:.2f} s)"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,652 @@
+import hashlib
+import heapq
+import itertools
+import os
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+def clean_duration(durations):
+    """Membersihkan kolom durasi ("130min", 130, 130.0) menjadi angka menit secara vektor"""
+    if pd.api.types.is_numeric_dtype(durations):
+        return durations.astype(float)
+
+    # .str mengembalikan NaN untuk elemen bukan string, sehingga angka asli terdeteksi tanpa loop Python
+    is_number = durations.notna() & durations.str.len().isna()
+    cleaned = durations.astype(str).str.replace('min', '', regex=False).str.strip()
+    # Hanya bilangan bulat yang diterima, sama seperti int(cleaned) pada versi per baris
+    is_int_str = cleaned.str.fullmatch(r'[+-]?\d+')
+    result = pd.to_numeric(cleaned.where(is_int_str), errors='coerce')
+    result[is_number] = durations[is_number].astype(float)
+    result[durations.isna()] = np.nan
+    return result.astype(float)
+
+
+def explode_genres(df):
+    """Memecah kolom 'Category' menjadi satu baris per genre pada kolom 'Genre'"""
+    if df.empty:
+        return pd.DataFrame(columns=list(df.columns) + ['Genre'])
+
+    category = df['Category']
+    genre_lists = category.where(category.isna(), category.astype(str)).str.split(',')
+    df_expanded = df.assign(Genre=genre_lists).explode('Genre')
+
+    # Genre hanya bernilai NaN jika 'Category' kosong, sehingga diganti 'Unknown'
+    df_expanded['Genre'] = df_expanded['Genre'].str.strip().fillna('Unknown')
+    df_expanded = df_expanded[df_expanded['Genre'] != '']
+
+    if 'Duration_Clean' in df_expanded.columns:
+        df_expanded = df_expanded.dropna(subset=['Duration_Clean'])
+    return df_expanded
+
+
+# Versi pipeline pembersihan data; naikkan jika langkah di schema_adapters berubah
+# agar snapshot lama tidak dipakai lagi.
+PIPELINE_VERSION = 9
+SNAPSHOT_DIR = '.cache'
+
+
+def file_hash(path, chunk_size=1 << 20):
+    """Menghitung hash SHA-256 isi file sumber"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _snapshot_prefix(source_path):
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    key = f"{file_hash(source_path)[:16]}-v{PIPELINE_VERSION}"
+    return stem, os.path.join(SNAPSHOT_DIR, f"{stem}-{key}")
+
+
+def load_snapshot(source_path, names):
+    """Memuat snapshot Parquet untuk setiap nama tabel jika masih cocok dengan file sumber"""
+    try:
+        _, prefix = _snapshot_prefix(source_path)
+        paths = [f"{prefix}-{name}.parquet" for name in names]
+        if not all(os.path.exists(path) for path in paths):
+            return None
+        return tuple(pd.read_parquet(path) for path in paths)
+    except (ImportError, OSError, ValueError):
+        return None
+
+
+def save_snapshot(source_path, frames):
+    """Menyimpan dict {nama: DataFrame} sebagai snapshot Parquet dan menghapus snapshot usang"""
+    try:
+        stem, prefix = _snapshot_prefix(source_path)
+        os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+        for name in os.listdir(SNAPSHOT_DIR):
+            if name.startswith(stem + '-') and name.endswith('.parquet'):
+                os.remove(os.path.join(SNAPSHOT_DIR, name))
+        # Tulis ke file sementara lalu rename agar proses lain tidak membaca snapshot setengah jadi
+        for name, frame in frames.items():
+            path = f"{prefix}-{name}.parquet"
+            frame.to_parquet(path + '.tmp')
+            os.replace(path + '.tmp', path)
+    except (ImportError, OSError, ValueError):
+        pass
+
+
+CATEGORICAL_COLUMNS = ['Genre', 'Director', 'Stars', 'Category', 'Decade_Label', 'Title', 'Censor-board-rating']
+INT16_COLUMNS = ['ReleaseYear', 'Decade']
+FLOAT32_COLUMNS = ['IMDb-Rating', 'Duration', 'Duration_Clean']
+# Kolom yang tidak dipakai query mana pun; hanya kolom ini yang boleh dibuang saat nilainya konstan
+DROPPABLE_CONSTANT_COLUMNS = ['Censor-board-rating', 'Decade_Label']
+
+
+def compact_frame(df):
+    """Mengubah DataFrame ke tipe data hemat memori (category, int16, float32).
+
+    Kolom opsional (DROPPABLE_CONSTANT_COLUMNS) yang nilainya konstan dibuang dan disimpan di
+    df.attrs['constant_columns']. Kolom skema lain tetap ada walaupun konstan (misalnya semua
+    film satu genre) dan disimpan sebagai category.
+    """
+    df = df.copy()
+    constants = dict(df.attrs.get('constant_columns', {}))
+    for col in DROPPABLE_CONSTANT_COLUMNS:
+        if col in df.columns and len(df) > 1 and df[col].dtype == object and df[col].nunique(dropna=False) == 1:
+            constants[col] = df[col].iloc[0]
+            df = df.drop(columns=col)
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    for col in INT16_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('int16')
+    for col in FLOAT32_COLUMNS:
+        if col in df.columns and pd.api.types.is_numeric_dtype(df[col]):
+            df[col] = df[col].astype('float32')
+    if pd.api.types.is_integer_dtype(df.index) and len(df) < 2**31:
+        df.index = df.index.astype('int32')
+    df.attrs['constant_columns'] = constants
+    return df
+
+
+def memory_report(df):
+    """Melaporkan pemakaian memori (byte) per kolom, termasuk isi string"""
+    usage = df.memory_usage(deep=True)
+    report = pd.DataFrame({
+        'dtype': [str(df[col].dtype) if col in df.columns else '' for col in usage.index],
+        'bytes': usage.values,
+    }, index=usage.index)
+    report.loc['Total'] = ['', int(usage.sum())]
+    return report
+
+
+def source_fingerprint(*paths):
+    """Sidik jari file sumber (path, mtime, ukuran); berubah jika salah satu file diganti.
+
+    Path berupa folder (dataset berpartisi) diwakili oleh semua file di dalamnya.
+    """
+    fingerprint = []
+    for path in paths:
+        if os.path.isdir(path):
+            files = sorted(os.path.join(folder, name) for folder, _, names in os.walk(path) for name in names)
+            fingerprint.extend(source_fingerprint(*files))
+            continue
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        fingerprint.append((path, stat.st_mtime_ns, stat.st_size))
+    return tuple(fingerprint)
+
+
+def _freeze_array(values):
+    # View numpy tetap bisa ditulis jika array dasarnya bisa ditulis, sehingga seluruh rantai .base dibekukan
+    while isinstance(values, np.ndarray):
+        values.flags.writeable = False
+        values = values.base
+
+
+def _frozen_values(series):
+    """Array kolom yang sudah hanya-baca (tanpa salinan): Categorical lewat codes, kolom numpy lewat to_numpy()"""
+    values = series.array
+    if isinstance(values, pd.Categorical):
+        _freeze_array(values.codes)
+        return values
+    if isinstance(series.dtype, np.dtype):
+        values = series.to_numpy(copy=False)
+        _freeze_array(values)
+    return values
+
+
+def freeze(obj):
+    """Menjadikan array di dalam DataFrame/Series/ndarray/dict hanya-baca (dipakai bersama antar sesi).
+
+    DataFrame dan Series dibangun ulang tanpa salinan dari array kolom yang sudah dibekukan,
+    karena blok internal pandas bisa berupa view lama yang masih bisa ditulis. Pakai nilai
+    kembaliannya; dict dan list diperbarui di tempat.
+    """
+    if isinstance(obj, pd.DataFrame):
+        frozen = pd.DataFrame(
+            {name: _frozen_values(column) for name, column in obj.items()}, index=obj.index, copy=False
+        )
+        frozen.attrs = dict(obj.attrs)
+        return frozen
+    if isinstance(obj, pd.Series):
+        return pd.Series(_frozen_values(obj), index=obj.index, name=obj.name, copy=False)
+    if isinstance(obj, np.ndarray):
+        _freeze_array(obj)
+    elif isinstance(obj, dict):
+        for key, value in obj.items():
+            obj[key] = freeze(value)
+    elif isinstance(obj, list):
+        obj[:] = [freeze(value) for value in obj]
+    elif isinstance(obj, tuple):
+        return tuple(freeze(value) for value in obj)
+    return obj
+
+
+def build_film_genre_model(df):
+    """Membangun tabel films (film_id = posisi baris) dan tabel jembatan film_genres.
+
+    film_genres hanya berisi dua kolom sempit: 'film_id' (int32) dan 'Genre'
+    (category), sehingga film dengan tiga genre tidak perlu disalin tiga kali.
+    Baris yang dibuang sama dengan explode_genres(): durasi kosong dan genre kosong.
+    Setiap film juga membawa kolom 'Genre_Bits', yaitu bitmask genre dengan posisi
+    bit sesuai urutan kategori film_genres['Genre'].
+
+    Kedua tabel diurutkan menurut 'ReleaseYear' sehingga satu rentang tahun selalu
+    berupa potongan baris yang bersebelahan (lihat year_range_slices()).
+    """
+    if 'Duration_Clean' in df.columns:
+        df = df.dropna(subset=['Duration_Clean'])
+    df = df.sort_values('ReleaseYear', kind='stable')
+    genres = explode_genres(df[['Category']])
+    films = df[df.index.isin(genres.index)]
+
+    film_genres = pd.DataFrame({
+        'film_id': films.index.get_indexer(genres.index).astype('int32'),
+        'Genre': pd.Categorical(genres['Genre']),
+    })
+    films = films.reset_index(drop=True)
+    films['Genre_Bits'] = build_genre_bitmask(len(films), film_genres)
+    return films, film_genres
+
+
+def build_genre_bitmask(n_films, film_genres):
+    """Menggabungkan genre setiap film menjadi satu bilangan bulat (bit ke-i = genre ke-i)"""
+    genre_count = len(film_genres['Genre'].cat.categories)
+    if genre_count > 64:
+        raise ValueError(f"Bitmask genre hanya mendukung 64 genre, data memiliki {genre_count} genre.")
+    bits = np.zeros(n_films, dtype=np.uint64)
+    genre_bit = np.left_shift(np.uint64(1), film_genres['Genre'].cat.codes.to_numpy().astype(np.uint64))
+    np.bitwise_or.at(bits, film_genres['film_id'].to_numpy(), genre_bit)
+    return bits
+
+
+def genre_query_bits(genre_names, selected_genres):
+    """Bitmask gabungan genre terpilih (posisi bit sesuai urutan genre_names)"""
+    query = np.uint64(0)
+    for genre in selected_genres:
+        if genre in genre_names:
+            query |= np.left_shift(np.uint64(1), np.uint64(genre_names.index(genre)))
+    return query
+
+
+def genre_filter_mask(films, genre_names, selected_genres, match='any'):
+    """Mask boolean film yang memiliki salah satu ('any') atau semua ('all') genre terpilih"""
+    query = genre_query_bits(genre_names, selected_genres)
+    film_bits = films['Genre_Bits'].to_numpy()
+    if match == 'all':
+        return (film_bits & query) == query
+    return (film_bits & query) != 0
+
+
+def distinct_count(codes, minlength=0):
+    """Menghitung jumlah kode kategori unik (>= 0) dengan np.bincount"""
+    codes = np.asarray(codes)
+    codes = codes[codes >= 0]
+    if codes.size == 0:
+        return 0
+    return int(np.count_nonzero(np.bincount(codes, minlength=minlength)))
+
+
+# Rating IMDb hanya satu angka desimal, sehingga grid 0.1 menampung data tanpa pembulatan
+RATING_STEP = 0.1
+RATING_GRID = np.round(np.arange(0, 101) * RATING_STEP, 1)
+
+
+def rating_bins(ratings):
+    """Mengubah rating (0.0-10.0) menjadi indeks bin pada RATING_GRID"""
+    bins = np.rint(np.asarray(ratings, dtype=np.float64) / RATING_STEP)
+    return np.clip(bins, 0, len(RATING_GRID) - 1).astype(np.int64)
+
+
+def build_year_genre_cube(films, film_genres):
+    """Membangun kubus agregat (tahun x genre) berupa array NumPy padat.
+
+    Berisi jumlah film, jumlah/total/kuadrat rating, total durasi, dan histogram rating
+    (bin 0.1) untuk setiap pasangan (tahun, genre), sehingga filter tahun dan genre
+    cukup berupa slice array.
+    """
+    film_ids = film_genres['film_id'].to_numpy()
+    genre_codes = film_genres['Genre'].cat.codes.to_numpy().astype(np.int64)
+    genres = list(film_genres['Genre'].cat.categories)
+
+    film_years = films['ReleaseYear'].to_numpy().astype(np.int64)
+    first_year = int(film_years.min())
+    years = np.arange(first_year, int(film_years.max()) + 1)
+    shape = (len(years), len(genres))
+
+    cell = (film_years[film_ids] - first_year) * len(genres) + genre_codes
+    film_ratings_all = pd.to_numeric(films['IMDb-Rating'], errors='coerce').to_numpy().astype(np.float64)
+    ratings = film_ratings_all[film_ids]
+    has_rating = ~np.isnan(ratings)
+    ratings = np.where(has_rating, ratings, 0.0)
+    durations = films['Duration_Clean'].to_numpy().astype(np.float64)[film_ids]
+
+    def cube_sum(weights=None):
+        return np.bincount(cell, weights=weights, minlength=shape[0] * shape[1]).reshape(shape)
+
+    cube = {
+        'years': years,
+        'genres': genres,
+        'count': cube_sum().astype(np.int64),
+        'rating_count': cube_sum(has_rating.astype(np.float64)).astype(np.int64),
+        'rating_sum': cube_sum(ratings),
+        'rating_sumsq': cube_sum(ratings ** 2),
+        'duration_sum': cube_sum(durations),
+    }
+    rating_cell = cell * len(RATING_GRID) + rating_bins(ratings)
+    cube['rating_hist'] = np.bincount(
+        rating_cell, weights=has_rating.astype(np.float64), minlength=shape[0] * shape[1] * len(RATING_GRID)
+    ).reshape(shape + (len(RATING_GRID),)).astype(np.int32)
+
+    # Agregat per tahun untuk film unik (setiap film dihitung sekali, semua genre)
+    year_pos = np.unique(film_ids)
+    film_year_idx = film_years[year_pos] - first_year
+    film_ratings = film_ratings_all[year_pos]
+    film_has_rating = ~np.isnan(film_ratings)
+
+    def year_sum(weights=None):
+        return np.bincount(film_year_idx, weights=weights, minlength=len(years))
+
+    cube['film_count'] = year_sum().astype(np.int64)
+    cube['film_rating_count'] = year_sum(film_has_rating.astype(np.float64)).astype(np.int64)
+    cube['film_rating_sum'] = year_sum(np.where(film_has_rating, film_ratings, 0.0))
+    cube['film_duration_sum'] = year_sum(films['Duration_Clean'].to_numpy().astype(np.float64)[year_pos])
+
+    # Offset baris awal setiap tahun pada films dan film_genres (keduanya terurut menurut tahun)
+    cube['film_offsets'] = np.searchsorted(film_years, np.append(years, years[-1] + 1))
+    cube['bridge_offsets'] = np.searchsorted(film_years[film_ids], np.append(years, years[-1] + 1))
+
+    return add_prefix_sums(cube)
+
+
+PREFIX_SUM_FIELDS = [
+    'count', 'rating_count', 'rating_sum', 'rating_sumsq', 'duration_sum', 'rating_hist',
+    'film_count', 'film_rating_count', 'film_rating_sum', 'film_duration_sum',
+]
+
+
+def add_prefix_sums(cube):
+    """Menambahkan prefix sum sepanjang sumbu tahun: total rentang [a, b] = prefix[b + 1] - prefix[a]"""
+    cube['prefix'] = {
+        name: np.concatenate([np.zeros((1,) + cube[name].shape[1:], dtype=cube[name].dtype),
+                              np.cumsum(cube[name], axis=0)])
+        for name in PREFIX_SUM_FIELDS
+    }
+    return cube
+
+
+def cube_selection(cube, year_range, genres=None):
+    """Mengubah filter (rentang tahun, daftar genre) menjadi slice tahun dan indeks genre pada kubus"""
+    years = cube['years']
+    start = int(np.searchsorted(years, year_range[0], side='left'))
+    stop = int(np.searchsorted(years, year_range[1], side='right'))
+    if genres:
+        genre_index = np.array(sorted(cube['genres'].index(g) for g in genres if g in cube['genres']), dtype=np.int64)
+    else:
+        genre_index = np.arange(len(cube['genres']))
+    return slice(start, stop), genre_index
+
+
+def year_range_slices(cube, year_range):
+    """Mencari potongan baris films dan film_genres untuk rentang tahun dengan binary search"""
+    year_slice, _ = cube_selection(cube, year_range)
+    film_offsets, bridge_offsets = cube['film_offsets'], cube['bridge_offsets']
+    return (slice(int(film_offsets[year_slice.start]), int(film_offsets[year_slice.stop])),
+            slice(int(bridge_offsets[year_slice.start]), int(bridge_offsets[year_slice.stop])))
+
+
+def range_sum(cube, name, year_slice):
+    """Total satu field kubus pada rentang tahun dalam waktu konstan memakai prefix sum"""
+    prefix = cube['prefix'][name]
+    return prefix[year_slice.stop] - prefix[year_slice.start]
+
+
+def cube_totals(cube, year_range, genres=None):
+    """Menghitung KPI rentang tahun: jumlah baris film-genre, rata-rata rating dan durasi.
+
+    Nilai rata-rata dihitung per pasangan film-genre, sama seperti mean() pada
+    df_expanded. 'film_count', 'film_avg_rating', dan 'film_avg_duration' menghitung
+    setiap film sekali tanpa memperhatikan filter genre.
+    """
+    year_slice, genre_index = cube_selection(cube, year_range, genres)
+    count = int(range_sum(cube, 'count', year_slice)[genre_index].sum())
+    rating_count = int(range_sum(cube, 'rating_count', year_slice)[genre_index].sum())
+    rating_sum = range_sum(cube, 'rating_sum', year_slice)[genre_index].sum()
+    duration_sum = range_sum(cube, 'duration_sum', year_slice)[genre_index].sum()
+
+    film_count = int(range_sum(cube, 'film_count', year_slice))
+    film_rating_count = int(range_sum(cube, 'film_rating_count', year_slice))
+    return {
+        'count': count,
+        'avg_rating': rating_sum / rating_count if rating_count else np.nan,
+        'avg_duration': duration_sum / count if count else np.nan,
+        'film_count': film_count,
+        'film_avg_rating': range_sum(cube, 'film_rating_sum', year_slice) / film_rating_count
+        if film_rating_count else np.nan,
+        'film_avg_duration': range_sum(cube, 'film_duration_sum', year_slice) / film_count
+        if film_count else np.nan,
+    }
+
+
+def cube_counts_per_year_genre(cube, year_range, genres=None):
+    """Jumlah film per (tahun, genre) dalam format panjang, hanya pasangan yang tidak nol"""
+    year_slice, genre_index = cube_selection(cube, year_range, genres)
+    counts = cube['count'][year_slice][:, genre_index]
+    year_pos, genre_pos = np.nonzero(counts)
+    genre_names = np.array(cube['genres'], dtype=object)
+    return pd.DataFrame({
+        'ReleaseYear': cube['years'][year_slice][year_pos],
+        'Genre': genre_names[genre_index][genre_pos],
+        'Jumlah Film': counts[year_pos, genre_pos],
+    })
+
+
+def cube_counts_per_genre(cube, year_range, genres=None):
+    """Total jumlah film per genre (hanya yang tidak nol), terurut menurun"""
+    year_slice, genre_index = cube_selection(cube, year_range, genres)
+    totals = range_sum(cube, 'count', year_slice)[genre_index]
+    series = pd.Series(totals, index=[cube['genres'][i] for i in genre_index], name='count')
+    return series[series > 0].sort_values(ascending=False, kind='stable')
+
+
+def cube_rating_histogram(cube, year_range, genres=None):
+    """Histogram rating (genre x bin RATING_GRID) untuk rentang tahun, dengan genre terurut menurut nama"""
+    year_slice, genre_index = cube_selection(cube, year_range, genres)
+    hist = range_sum(cube, 'rating_hist', year_slice)[genre_index]
+    names = [cube['genres'][i] for i in genre_index]
+    order = sorted(range(len(names)), key=lambda i: names[i])
+    return [names[i] for i in order], hist[order]
+
+
+def combo_film_count(combos, cube, year_range, genres=None):
+    """Jumlah film dalam rentang tahun yang memiliki salah satu genre terpilih.
+
+    combos berisi jumlah film per (tahun, kombinasi genre) terurut menurut tahun: 'bits',
+    'count', dan 'offsets' (baris awal setiap tahun kubus), sehingga film dengan beberapa
+    genre terpilih tetap dihitung sekali tanpa tabel per film.
+    """
+    year_slice, _ = cube_selection(cube, year_range)
+    if not genres:
+        return int(range_sum(cube, 'film_count', year_slice))
+    rows = slice(int(combos['offsets'][year_slice.start]), int(combos['offsets'][year_slice.stop]))
+    query = genre_query_bits(cube['genres'], genres)
+    return int(combos['count'][rows][(combos['bits'][rows] & query) != 0].sum())
+
+
+TOP_K = 10
+
+
+def build_top_film_index(films, film_genres, cube, k=TOP_K):
+    """Membangun indeks k film terbaik per sel (tahun, genre) pada kubus.
+
+    Urutan film: rating menurun, judul menaik, lalu film_id (urutan baris films).
+    Hasilnya dict berisi 'top_films' (tahun x genre x k, film_id atau -1 jika kosong)
+    beserta kunci urut per film, sehingga rentang tahun cukup di-merge (lihat top_films_in_range()).
+    """
+    ratings = pd.to_numeric(films['IMDb-Rating'], errors='coerce').to_numpy().astype(np.float64)
+    title_codes = films['Title'].cat.codes.to_numpy().astype(np.int64)
+    valid_film = ~np.isnan(ratings) & (title_codes >= 0)
+
+    pairs = film_genres[['film_id', 'Genre']].drop_duplicates()
+    film_ids = pairs['film_id'].to_numpy().astype(np.int64)
+    genre_codes = pairs['Genre'].cat.codes.to_numpy().astype(np.int64)
+    keep = valid_film[film_ids]
+    film_ids, genre_codes = film_ids[keep], genre_codes[keep]
+
+    n_genres = len(cube['genres'])
+    years = films['ReleaseYear'].to_numpy().astype(np.int64)
+    cell = (years[film_ids] - cube['years'][0]) * n_genres + genre_codes
+
+    # Urutkan per sel, lalu rating menurun, judul menaik, film_id menaik
+    order = np.lexsort((film_ids, title_codes[film_ids], -ratings[film_ids], cell))
+    cell, film_ids = cell[order], film_ids[order]
+    cell_start = np.searchsorted(cell, cell, side='left')
+    rank = np.arange(len(cell)) - cell_start
+    keep = rank < k
+
+    top_films = np.full(len(cube['years']) * n_genres * k, -1, dtype=np.int32)
+    top_films[cell[keep] * k + rank[keep]] = film_ids[keep]
+    return {
+        'k': k,
+        'top_films': top_films.reshape(len(cube['years']), n_genres, k),
+        'ratings': ratings,
+        'title_codes': title_codes,
+    }
+
+
+def top_films_in_range(index, cube, year_range, genre, k=TOP_K):
+    """Mengambil hingga k film_id terbaik satu genre pada rentang tahun dengan k-way merge per tahun"""
+    if genre not in cube['genres']:
+        return []
+    year_slice, _ = cube_selection(cube, year_range)
+    cells = index['top_films'][year_slice, cube['genres'].index(genre)]
+    ratings, title_codes = index['ratings'], index['title_codes']
+
+    def sort_key(film_id):
+        return -ratings[film_id], title_codes[film_id], film_id
+
+    per_year = ([int(film_id) for film_id in row if film_id >= 0] for row in cells)
+    merged = heapq.merge(*(row for row in per_year if row), key=sort_key)
+    return list(itertools.islice(merged, min(k, index['k'])))
+
+
+def build_rating_order(films):
+    """Permutasi film_id berating, terurut rating menurun, judul menaik, lalu urutan baris"""
+    ratings = pd.to_numeric(films['IMDb-Rating'], errors='coerce').to_numpy().astype(np.float64)
+    title_codes = films['Title'].cat.codes.to_numpy().astype(np.int64)
+    film_ids = np.flatnonzero(~np.isnan(ratings) & (title_codes >= 0))
+    order = np.lexsort((film_ids, title_codes[film_ids], -ratings[film_ids]))
+    return film_ids[order].astype(np.int32)
+
+
+def leaderboard_scan(films, rating_order, genre_names, year_range, genres, limit, chunk_size=1024):
+    """Memindai rating_order per potongan dan berhenti setelah `limit` film lolos filter tahun dan genre"""
+    years = films['ReleaseYear'].to_numpy()
+    film_bits = films['Genre_Bits'].to_numpy()
+    query = genre_query_bits(genre_names, genres) if genres else None
+
+    hits = []
+    found = 0
+    for start in range(0, len(rating_order), chunk_size):
+        if found >= limit:
+            break
+        chunk = rating_order[start:start + chunk_size]
+        mask = (years[chunk] >= year_range[0]) & (years[chunk] <= year_range[1])
+        if query is not None:
+            mask &= (film_bits[chunk] & query) != 0
+        chunk_hits = chunk[mask][:limit - found]
+        hits.append(chunk_hits)
+        found += len(chunk_hits)
+    return np.concatenate(hits) if hits else np.empty(0, dtype=rating_order.dtype)
+
+
+def leaderboard_page(films, rating_order, genre_names, year_range, genres, page, page_size):
+    """Mengambil film_id untuk satu halaman papan peringkat dan apakah masih ada halaman berikutnya"""
+    end = (page + 1) * page_size
+    hits = leaderboard_scan(films, rating_order, genre_names, year_range, genres, limit=end + 1)
+    return hits[page * page_size:end], len(hits) > end
+
+
+def split_names(names):
+    """Memecah nama yang dipisah koma ("Joel Coen, Ethan Coen") menjadi satu baris per orang.
+
+    Index hasil sama dengan index baris asal sehingga bisa dipetakan kembali ke film.
+    """
+    names = names.astype(object)
+    people = names.where(names.isna(), names.astype(str)).str.split(',').explode().str.strip()
+    return people[people.notna() & (people != '')]
+
+
+def build_director_index(films, cube):
+    """Membangun indeks sutradara: matriks sparse sutradara x tahun dan bitmask genre per sutradara-tahun.
+
+    Matriks 'film_count', 'rating_count', dan 'rating_sum' (scipy.sparse, kolom = tahun kubus)
+    menjawab filter rentang tahun dengan menjumlahkan potongan kolom. Entri per (film, sutradara)
+    yang terurut menurut tahun dipakai jika filter genre aktif.
+    """
+    people = split_names(films['Director'])
+    film_ids = people.index.to_numpy().astype(np.int64)
+    year_idx = films['ReleaseYear'].to_numpy().astype(np.int64)[film_ids] - cube['years'][0]
+    ratings = pd.to_numeric(films['IMDb-Rating'], errors='coerce').to_numpy().astype(np.float64)[film_ids]
+    has_rating = ~np.isnan(ratings)
+    return director_index_from_entries(
+        people.to_numpy(), year_idx, films['Genre_Bits'].to_numpy()[film_ids], len(cube['years']),
+        film_count=np.ones(len(film_ids)),
+        rating_count=has_rating.astype(np.float64),
+        rating_sum=np.where(has_rating, ratings, 0.0),
+    )
+
+
+def director_index_from_entries(directors, year_idx, bits, n_years, film_count, rating_count, rating_sum):
+    """Membangun indeks sutradara dari entri (sutradara, indeks tahun, bitmask genre) berbobot.
+
+    Satu entri boleh mewakili beberapa film dengan sutradara, tahun, dan kombinasi genre
+    yang sama (lihat stream_aggregates.py); entri harus terurut menurut tahun.
+    """
+    director_ids, names = pd.factorize(directors, sort=True)
+    n_directors = len(names)
+
+    def director_year_matrix(weights):
+        return sparse.csc_array((weights, (director_ids, year_idx)), shape=(n_directors, n_years))
+
+    # Bitmask genre per sel (tahun, sutradara) yang terisi, terurut menurut tahun
+    cell_key, cell_inverse = np.unique(year_idx * n_directors + director_ids, return_inverse=True)
+    cell_bits = np.zeros(len(cell_key), dtype=np.uint64)
+    np.bitwise_or.at(cell_bits, cell_inverse, bits)
+    year_bounds = np.arange(n_years + 1)
+
+    return {
+        'names': np.asarray(names, dtype=object),
+        'film_count': director_year_matrix(film_count),
+        'rating_count': director_year_matrix(rating_count),
+        'rating_sum': director_year_matrix(rating_sum),
+        'cell_director': (cell_key % n_directors).astype(np.int32),
+        'cell_bits': cell_bits,
+        'cell_offsets': np.searchsorted(cell_key // n_directors, year_bounds),
+        'entry_director': director_ids.astype(np.int32),
+        'entry_bits': bits,
+        'entry_film_count': film_count,
+        'entry_rating_count': rating_count,
+        'entry_rating_sum': rating_sum,
+        'entry_offsets': np.searchsorted(year_idx, year_bounds),
+    }
+
+
+def director_stats(index, cube, year_range, genres=None):
+    """Statistik per sutradara (jumlah film, rata-rata rating, jumlah genre) untuk filter tahun dan genre"""
+    year_slice, _ = cube_selection(cube, year_range)
+    n_directors = len(index['names'])
+    genre_bits = np.zeros(n_directors, dtype=np.uint64)
+
+    if genres:
+        # Film cocok jika memiliki salah satu genre terpilih; genre dihitung hanya dari genre terpilih
+        query = genre_query_bits(cube['genres'], genres)
+        entries = slice(int(index['entry_offsets'][year_slice.start]), int(index['entry_offsets'][year_slice.stop]))
+        bits = index['entry_bits'][entries] & query
+        keep = bits != 0
+        directors = index['entry_director'][entries][keep]
+
+        def director_sum(name):
+            return np.bincount(directors, weights=index[name][entries][keep], minlength=n_directors)
+
+        film_count = director_sum('entry_film_count')
+        rating_count = director_sum('entry_rating_count')
+        rating_sum = director_sum('entry_rating_sum')
+        np.bitwise_or.at(genre_bits, directors, bits[keep])
+    else:
+        film_count = index['film_count'][:, year_slice].sum(axis=1)
+        rating_count = index['rating_count'][:, year_slice].sum(axis=1)
+        rating_sum = index['rating_sum'][:, year_slice].sum(axis=1)
+        cells = slice(int(index['cell_offsets'][year_slice.start]), int(index['cell_offsets'][year_slice.stop]))
+        np.bitwise_or.at(genre_bits, index['cell_director'][cells], index['cell_bits'][cells])
+
+    present = np.flatnonzero(film_count > 0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        avg_rating = rating_sum[present] / rating_count[present]
+    return pd.DataFrame({
+        'Director': index['names'][present],
+        'Title_Count': np.asarray(film_count[present]).astype(np.int64),
+        'Avg_IMDb_Rating': np.where(rating_count[present] > 0, avg_rating, np.nan),
+        'Unique_Genres': np.bitwise_count(genre_bits[present]).astype(np.int64),
+    })
@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+
+from data_utils import split_names
+
+# Kunci duplikat: judul, tahun, dan sutradara yang sudah dinormalkan (lihat dedup_keys())
+KEY_COLUMNS = ['Title', 'ReleaseYear', 'Director']
+# Kolom berisi daftar; jumlah entrinya menjadi penentu kelengkapan jika jumlah kolom terisi sama
+LIST_COLUMNS = ['Director', 'Actors', 'Category']
+# Pemisah nama sutradara di dalam kunci; tidak mungkin muncul pada teks ternormalkan
+KEY_SEPARATOR = '\x1f'
+
+
+def normalize_text(values):
+    """Teks untuk pencocokan: tanpa aksen, huruf kecil, tanda baca dan spasi berlebih dibuang.
+
+    Normalisasi hanya dijalankan pada nilai unik (nama sutradara dan judul banyak berulang).
+    """
+    codes, uniques = pd.factorize(values.fillna('').astype(str))
+    normalized = (
+        pd.Series(uniques, dtype=object)
+        .str.normalize('NFKD').str.replace(r'[\u0300-\u036f]', '', regex=True)
+        .str.casefold().str.replace(r'[^\w]+', ' ', regex=True).str.strip()
+    )
+    return pd.Series(normalized.to_numpy()[codes], index=values.index)
+
+
+def dedup_key_frame(df):
+    """Kolom kunci ternormalkan (judul, tahun, sutradara) untuk setiap baris df.
+
+    Nama sutradara dinormalkan, dibuang duplikatnya, lalu diurutkan sebelum digabung, sehingga
+    kunci sutradara setara dengan himpunan nama: urutan penulisan ("Joel Coen, Ethan Coen" atau
+    "Ethan Coen, Joel Coen") tidak mengubah kunci, dan himpunan nama yang berbeda tidak pernah sama.
+    """
+    df = df.reset_index(drop=True)
+    people = split_names(df['Director'])
+    names = pd.DataFrame({'row': people.index.to_numpy(), 'name': normalize_text(people).to_numpy()})
+    names = names[names['name'] != ''].drop_duplicates().sort_values(['row', 'name'])
+    # Nama ke-k setiap baris ditambahkan sekaligus untuk semua baris (tanpa join per kelompok)
+    position = names.groupby('row').cumcount().to_numpy()
+    directors = np.full(len(df), '', dtype=object)
+    for k in range(position.max() + 1 if len(names) else 0):
+        part = names[position == k]
+        rows = part['row'].to_numpy()
+        directors[rows] = directors[rows] + ('' if k == 0 else KEY_SEPARATOR) + part['name'].to_numpy()
+    return pd.DataFrame({
+        'title': normalize_text(df['Title']),
+        'year': pd.to_numeric(df['ReleaseYear'], errors='coerce').fillna(-1).astype(np.int64),
+        'director': directors,
+    })
+
+
+def dedup_keys(df):
+    """Hash 64-bit dari dedup_key_frame(df), untuk mencocokkan kunci dengan file lain tanpa menyimpan teksnya"""
+    return pd.util.hash_pandas_object(dedup_key_frame(df), index=False).to_numpy()
+
+
+def completeness(df):
+    """Skor kelengkapan baris: jumlah kolom terisi, lalu jumlah entri pada kolom daftar"""
+    filled = df.notna()
+    for column in df.columns[df.dtypes == object]:
+        filled[column] &= df[column].astype(str).str.strip() != ''
+    entries = sum(
+        df[column].fillna('').astype(str).str.count(',') + filled[column]
+        for column in LIST_COLUMNS if column in df.columns
+    )
+    return (filled.sum(axis=1) * 10_000 + np.minimum(entries, 9_999)).to_numpy()
+
+
+def merge_duplicates(df, sources=None):
+    """Menyisakan satu baris paling lengkap untuk setiap kunci (judul, tahun, sutradara).
+
+    Pengelompokan memakai groupby berbasis hash atas kolom kunci (dibandingkan persis, bukan
+    hanya hash-nya), sehingga waktunya linear terhadap jumlah baris. Jika skor kelengkapan
+    sama, baris yang muncul pertama dipertahankan.
+    sources (opsional, sejajar dengan df) adalah label asal baris untuk laporan.
+    Mengembalikan (DataFrame tanpa duplikat, laporan satu baris per baris yang dibuang).
+    """
+    df = df.reset_index(drop=True)
+    sources = pd.Series(range(len(df)) if sources is None else np.asarray(sources), dtype=object)
+    groups = dedup_key_frame(df).groupby(['title', 'year', 'director'], sort=False).ngroup().to_numpy()
+    score = completeness(df)
+    best = pd.Series(score).groupby(groups, sort=False).idxmax()
+
+    keep = np.zeros(len(df), dtype=bool)
+    keep[best.to_numpy()] = True
+    dropped = np.flatnonzero(~keep)
+    kept_for_dropped = best.loc[groups[dropped]].to_numpy()
+    group_size = np.bincount(groups)
+    report = pd.DataFrame({
+        'Title': df['Title'].to_numpy()[kept_for_dropped],
+        'ReleaseYear': df['ReleaseYear'].to_numpy()[kept_for_dropped],
+        'Director': df['Director'].to_numpy()[kept_for_dropped],
+        'Group_Size': group_size[groups[dropped]],
+        'Kept_Source': sources.to_numpy()[kept_for_dropped],
+        'Kept_Score': score[kept_for_dropped],
+        'Dropped_Source': sources.to_numpy()[dropped],
+        'Dropped_Score': score[dropped],
+        'Dropped_Title': df['Title'].to_numpy()[dropped],
+        'Dropped_Director': df['Director'].to_numpy()[dropped],
+    })
+    return df[keep], report
@@ -0,0 +1,104 @@
+import numpy as np
+import plotly.io as pio
+
+from instrumentation import record_payload_size
+from result_cache import filter_results_cache, normalize_filter_key
+
+# Anggaran payload: jumlah titik maksimum per trace garis dan ukuran spec per grafik
+MAX_POINTS_PER_TRACE = 150
+PAYLOAD_BUDGET_BYTES = 100 * 1024
+# Batas bawah pencuplikan saat spec masih melebihi anggaran
+MIN_POINTS_PER_TRACE = 20
+# Field per titik yang hanya menambah isi tooltip; dibuang lebih dulu jika spec melebihi anggaran
+OPTIONAL_TRACE_FIELDS = ('customdata', 'hovertext')
+
+
+def downsample_indices(n, max_points):
+    """Indeks berjarak rata (titik pertama dan terakhir selalu ikut) untuk mengambil max_points dari n titik"""
+    if n <= max_points:
+        return np.arange(n)
+    return np.unique(np.linspace(0, n - 1, max_points).round().astype(np.int64))
+
+
+def apply_payload_budget(fig, max_points=MAX_POINTS_PER_TRACE):
+    """Memperkecil payload figure sebelum diserialisasi (figure diubah di tempat).
+
+    Trace garis dengan lebih dari max_points titik dicuplik secara merata; trace batang
+    dan marker tidak dicuplik karena setiap titiknya adalah data. Array float64 disimpan
+    sebagai float32 sehingga typed array base64-nya setengah ukuran.
+    """
+    for trace in fig.data:
+        x, y = getattr(trace, 'x', None), getattr(trace, 'y', None)
+        if 'lines' in (getattr(trace, 'mode', None) or '') and isinstance(y, np.ndarray) and len(y) > max_points:
+            keep = downsample_indices(len(y), max_points)
+            trace.y = y[keep]
+            if isinstance(x, np.ndarray) and len(x) == len(y):
+                trace.x = x[keep]
+        for axis in ('x', 'y'):
+            values = getattr(trace, axis, None)
+            if isinstance(values, np.ndarray) and values.dtype == np.float64:
+                setattr(trace, axis, values.astype(np.float32))
+    return fig
+
+
+def figure_spec(fig):
+    """Menserialisasi figure Plotly ke string JSON seperti yang dikirim st.plotly_chart ke frontend.
+
+    Array numerik dikodekan sebagai typed array base64 ({'dtype', 'bdata'}) oleh Plotly.
+    Validasi dilewati karena figure sudah divalidasi saat dibuat.
+    """
+    return pio.to_json(fig, validate=False, engine='auto')
+
+
+def enforce_payload_budget(fig, budget_bytes=PAYLOAD_BUDGET_BYTES):
+    """Memperkecil figure sampai spec JSON-nya muat dalam budget_bytes; mengembalikan (figure, ukuran spec).
+
+    Urutannya: buang field tooltip opsional (OPTIONAL_TRACE_FIELDS), lalu cuplik trace garis
+    dengan jumlah titik yang terus dibagi dua hingga MIN_POINTS_PER_TRACE. Trace batang dan
+    marker tidak dicuplik, sehingga grafik yang tetap terlalu besar dilaporkan over_budget.
+    """
+    spec_bytes = len(figure_spec(fig).encode('utf-8'))
+    if spec_bytes <= budget_bytes:
+        return fig, spec_bytes
+
+    for trace in fig.data:
+        dropped = [name for name in OPTIONAL_TRACE_FIELDS if getattr(trace, name, None) is not None]
+        for name in dropped:
+            setattr(trace, name, None)
+        # Template tooltip yang merujuk field yang dibuang diganti tooltip bawaan Plotly
+        if dropped and any(f'%{{{name}' in (getattr(trace, 'hovertemplate', None) or '') for name in dropped):
+            trace.hovertemplate = None
+    spec_bytes = len(figure_spec(fig).encode('utf-8'))
+
+    max_points = MAX_POINTS_PER_TRACE
+    while spec_bytes > budget_bytes and max_points > MIN_POINTS_PER_TRACE:
+        max_points = max(max_points // 2, MIN_POINTS_PER_TRACE)
+        apply_payload_budget(fig, max_points)
+        spec_bytes = len(figure_spec(fig).encode('utf-8'))
+    return fig, spec_bytes
+
+
+def cached_figure(chart_id, build_fn, year_range, genres):
+    """Mengambil figure siap tampil dari cache LRU lintas sesi berdasarkan (chart_id, filter).
+
+    build_fn(year_range, genres) mengembalikan figure atau None (tidak ada data). Yang disimpan
+    adalah go.Figure yang sudah tervalidasi dan sudah diperkecil sesuai anggaran payload
+    (apply_payload_budget() lalu enforce_payload_budget()), bersama ukuran spec JSON-nya.
+    st.plotly_chart tidak memvalidasi ulang objek Figure (hanya to_dict() lalu to_json()),
+    sehingga saat cache hit pembuatan figure, agregasi, dan validasi dilewati; yang tersisa
+    hanya serialisasi di dalam st.plotly_chart.
+    """
+    key = ('figure', chart_id) + normalize_filter_key(year_range, genres)
+
+    def build_entry():
+        fig = build_fn(year_range, genres)
+        if fig is None:
+            return None
+        return enforce_payload_budget(apply_payload_budget(fig))
+
+    entry = filter_results_cache.get_or_compute(key, build_entry)
+    if entry is None:
+        return None
+    fig, spec_bytes = entry
+    record_payload_size(chart_id, spec_bytes, PAYLOAD_BUDGET_BYTES)
+    return fig
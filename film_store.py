@@ -0,0 +1,224 @@
+import os
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from data_utils import (
+    build_director_index, build_film_genre_model, build_rating_order, build_top_film_index, build_year_genre_cube,
+    combo_film_count, compact_frame, cube_counts_per_genre, cube_counts_per_year_genre, cube_rating_histogram,
+    cube_totals, director_stats, distinct_count, freeze, genre_filter_mask, leaderboard_page, leaderboard_scan,
+    load_snapshot, save_snapshot, top_films_in_range, year_range_slices, TOP_K
+)
+from partitions import read_partitions
+from rating_density import binned_kde
+from schema_adapters import CHUNK_ROWS, read_normalized
+from stream_aggregates import stream_aggregates
+
+
+def read_source(paths, year_bounds=None):
+    """Membaca sumber pertama yang ada dari paths dan menormalkannya ke skema kanonik (schema_adapters).
+
+    Sumber berupa folder dibaca sebagai dataset berpartisi dekade (partitions.py) dan hanya
+    partisi yang beririsan dengan year_bounds yang dibuka. year_bounds (awal, akhir) membatasi
+    tahun rilis; None = semua tahun.
+    Mengembalikan (path, DataFrame); FileNotFoundError jika tidak ada satu pun sumber.
+    Baris tanpa tahun rilis numerik dibuang.
+    """
+    source_path = next((path for path in paths if os.path.exists(path)), None)
+    if source_path is None:
+        raise FileNotFoundError(', '.join(paths))
+    if os.path.isdir(source_path):
+        return source_path, read_partitions(source_path, year_bounds)
+
+    df = read_normalized([source_path])
+    if year_bounds is not None:
+        df = df[df['ReleaseYear'].between(*year_bounds)]
+    return source_path, df
+
+
+@dataclass(frozen=True)
+class Kpis:
+    """Nilai kartu KPI untuk satu filter"""
+    row_count: int          # jumlah pasangan (film, genre) yang lolos filter
+    total_films: int        # jumlah judul film berbeda
+    avg_rating: float
+    avg_duration: float
+
+
+class CubeQueries:
+    """Query yang hanya membutuhkan kubus tahun x genre dan indeks sutradara (dipakai FilmStore dan AggregateStore).
+
+    Semua query menerima filter yang sama: year_range (tahun awal, tahun akhir) dan daftar
+    genre terpilih (kosong = semua genre).
+    """
+
+    @property
+    def genre_names(self):
+        return list(self.cube['genres'])
+
+    @property
+    def year_bounds(self):
+        return int(self.cube['years'][0]), int(self.cube['years'][-1])
+
+    def default_genres(self, n=5):
+        """n genre dengan jumlah film terbanyak di seluruh data"""
+        totals = pd.Series(self.cube['count'].sum(axis=0), index=self.genre_names)
+        return totals.nlargest(n).index.tolist()
+
+    def year_genre_counts(self, year_range, genres):
+        """DataFrame [ReleaseYear, Genre, Jumlah Film] untuk pasangan (tahun, genre) yang tidak nol"""
+        return cube_counts_per_year_genre(self.cube, year_range, genres)
+
+    def genre_counts(self, year_range, genres):
+        """Series jumlah film per genre, terurut menurun"""
+        return cube_counts_per_genre(self.cube, year_range, genres)
+
+    def rating_density(self, year_range, genres, n_points):
+        """Kurva KDE rating per genre: (label genre, x, y) dengan x dan y berukuran (genre, n_points)"""
+        genre_names, rating_hist = cube_rating_histogram(self.cube, year_range, genres)
+        rows, curve_x, curve_y = binned_kde(rating_hist, n_points=n_points)
+        return [genre_names[i] for i in rows], curve_x, curve_y
+
+    def director_stats(self, year_range, genres):
+        """DataFrame [Director, Title_Count, Avg_IMDb_Rating, Unique_Genres]"""
+        return director_stats(self.director_index, self.cube, year_range, genres)
+
+    def top_director(self, year_range, genres):
+        """Nama sutradara dengan film terbanyak (seri diurutkan menurut nama), atau None"""
+        stats = self.director_stats(year_range, genres)
+        if stats.empty:
+            return None
+        return stats.sort_values(['Title_Count', 'Director'], ascending=[False, True])['Director'].iloc[0]
+
+
+@dataclass(frozen=True)
+class FilmStore(CubeQueries):
+    """Tabel film, kubus tahun x genre, dan indeks turunannya (hanya-baca, dipakai bersama semua halaman)"""
+    source_path: str
+    films: pd.DataFrame
+    film_genres: pd.DataFrame
+    cube: dict
+    top_index: dict
+    rating_order: np.ndarray
+    director_index: dict
+
+    aggregates_only = False
+
+    def default_genres(self, n=5):
+        """n genre dengan jumlah film terbanyak di seluruh data"""
+        return self.film_genres['Genre'].value_counts().nlargest(n).index.tolist()
+
+    def kpis(self, year_range, genres):
+        """Nilai kartu KPI (Kpis) untuk filter"""
+        totals = cube_totals(self.cube, year_range, genres)
+        film_rows = self.films_in_range(year_range, genres)
+        return Kpis(
+            row_count=int(totals['count']),
+            total_films=distinct_count(
+                film_rows['Title'].cat.codes.to_numpy(), minlength=len(self.films['Title'].cat.categories)
+            ),
+            avg_rating=totals['avg_rating'],
+            avg_duration=totals['avg_duration'],
+        )
+
+    def films_in_range(self, year_range, genres):
+        """Baris films dalam rentang tahun yang memiliki salah satu genre terpilih"""
+        film_rows, _ = year_range_slices(self.cube, year_range)
+        films = self.films.iloc[film_rows]
+        return films[genre_filter_mask(films, self.genre_names, genres)] if genres else films
+
+    def top_rated_film(self, year_range, genres):
+        """Baris film dengan rating tertinggi yang lolos filter, atau None"""
+        top_ids = leaderboard_scan(self.films, self.rating_order, self.genre_names, year_range, genres, limit=1)
+        return self.films.iloc[top_ids[0]] if len(top_ids) > 0 else None
+
+    def top_films(self, year_range, genre, k=TOP_K):
+        """film_id hingga k film dengan rating tertinggi untuk satu genre"""
+        return top_films_in_range(self.top_index, self.cube, year_range, genre, k)
+
+    def leaderboard_page(self, year_range, genres, page, page_size):
+        """(film_id satu halaman papan peringkat, apakah masih ada halaman berikutnya)"""
+        return leaderboard_page(
+            self.films, self.rating_order, self.genre_names, year_range, genres, page, page_size
+        )
+
+
+@dataclass(frozen=True)
+class AggregateStore(CubeQueries):
+    """Mode "hanya agregat": kubus dan indeks sutradara hasil pemuatan streaming, tanpa tabel per film.
+
+    Dipakai untuk katalog yang lebih besar dari RAM. Query yang membutuhkan baris film
+    (film terbaik, papan peringkat) tidak tersedia, dan total film dihitung per film
+    (bukan per judul unik seperti FilmStore.kpis).
+    """
+    source_path: str
+    cube: dict
+    director_index: dict
+    film_combos: dict
+
+    aggregates_only = True
+
+    def kpis(self, year_range, genres):
+        """Nilai kartu KPI (Kpis) untuk filter"""
+        totals = cube_totals(self.cube, year_range, genres)
+        return Kpis(
+            row_count=int(totals['count']),
+            total_films=combo_film_count(self.film_combos, self.cube, year_range, genres),
+            avg_rating=totals['avg_rating'],
+            avg_duration=totals['avg_duration'],
+        )
+
+
+def load_film_store(paths, year_bounds=None):
+    """Memuat sumber pertama yang ada dan membangun FilmStore yang sudah dibekukan.
+
+    Tabel films/film_genres diambil dari snapshot Parquet bila file sumber CSV tidak berubah
+    (dataset berpartisi dan pemuatan dengan year_bounds tidak memakai snapshot).
+    Mengembalikan None jika tidak ada film dengan tahun dan genre yang valid;
+    FileNotFoundError jika tidak ada sumber.
+    """
+    source_path = next((path for path in paths if os.path.exists(path)), None)
+    use_snapshot = source_path is not None and year_bounds is None and os.path.isfile(source_path)
+    snapshot = load_snapshot(source_path, ['films', 'film_genres']) if use_snapshot else None
+    if snapshot is not None:
+        films, film_genres = snapshot
+    else:
+        source_path, df = read_source(paths, year_bounds)
+        films, film_genres = build_film_genre_model(compact_frame(df))
+        if film_genres.empty:
+            return None
+        if use_snapshot:
+            save_snapshot(source_path, {'films': films, 'film_genres': film_genres})
+
+    cube = build_year_genre_cube(films, film_genres)
+    return FilmStore(
+        source_path=source_path,
+        films=freeze(films),
+        film_genres=freeze(film_genres),
+        cube=freeze(cube),
+        top_index=freeze(build_top_film_index(films, film_genres, cube)),
+        rating_order=freeze(build_rating_order(films)),
+        director_index=freeze(build_director_index(films, cube)),
+    )
+
+
+def load_aggregate_store(paths, year_bounds=None, chunksize=CHUNK_ROWS):
+    """Membangun AggregateStore dari sumber pertama yang ada dengan membaca per potongan chunksize baris.
+
+    Mengembalikan None jika tidak ada film dengan tahun dan genre yang valid;
+    FileNotFoundError jika tidak ada sumber.
+    """
+    source_path = next((path for path in paths if os.path.exists(path)), None)
+    if source_path is None:
+        raise FileNotFoundError(', '.join(paths))
+    aggregates = stream_aggregates(source_path, year_bounds, chunksize)
+    if aggregates is None:
+        return None
+    cube, director_index, film_combos = aggregates
+    return AggregateStore(
+        source_path=source_path,
+        cube=freeze(cube),
+        director_index=freeze(director_index),
+        film_combos=freeze(film_combos),
+    )
@@ -0,0 +1,62 @@
+import streamlit as st
+
+from instrumentation import record_action
+
+# Satu-satunya sumber kebenaran untuk filter rentang tahun; widget hanya menyalin nilainya
+YEAR_RANGE_KEY = 'year_range'
+
+
+def _set_year_range(start, end):
+    st.session_state[YEAR_RANGE_KEY] = (start, end)
+    st.session_state.year_slider = (start, end)
+    st.session_state.start_year_num_input = start
+    st.session_state.end_year_num_input = end
+
+
+def year_range_controls(min_year, max_year):
+    """Input tahun awal/akhir dan slider rentang tahun yang selalu sinkron.
+
+    Sinkronisasi hanya terjadi di callback on_change, yang dijalankan Streamlit sebelum
+    skrip dieksekusi ulang, sehingga satu aksi pengguna = satu eksekusi skrip (tanpa st.rerun()).
+    Mengembalikan rentang tahun terpilih (tahun awal, tahun akhir).
+    """
+    if YEAR_RANGE_KEY not in st.session_state:
+        _set_year_range(min_year, max_year)
+
+    def sync_inputs_to_range():
+        record_action('tahun (input angka)')
+        start = st.session_state.start_year_num_input
+        end = st.session_state.end_year_num_input
+        # Rentang tidak valid tidak mengubah filter; peringatan ditampilkan di bawah input
+        if start <= end:
+            _set_year_range(start, end)
+
+    def sync_slider_to_range():
+        record_action('tahun (slider)')
+        _set_year_range(*st.session_state.year_slider)
+
+    col_start_year, col_end_year = st.columns(2)
+    with col_start_year:
+        st.number_input(
+            "Tahun Awal:", min_value=min_year, max_value=max_year, step=1, key="start_year_num_input",
+            on_change=sync_inputs_to_range,
+            help=f"Tahun paling awal data: {min_year}"
+        )
+    with col_end_year:
+        st.number_input(
+            "Tahun Akhir:", min_value=min_year, max_value=max_year, step=1, key="end_year_num_input",
+            on_change=sync_inputs_to_range,
+            help=f"Tahun paling akhir data: {max_year}"
+        )
+
+    if st.session_state.start_year_num_input > st.session_state.end_year_num_input:
+        st.warning("Tahun awal tidak boleh lebih besar dari tahun akhir.")
+
+    st.slider(
+        "Rentang Tahun Rilis:",
+        min_value=min_year,
+        max_value=max_year,
+        key="year_slider",
+        on_change=sync_slider_to_range
+    )
+    return st.session_state[YEAR_RANGE_KEY]
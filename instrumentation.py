@@ -0,0 +1,82 @@
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+import streamlit as st
+
+
+def _record(name, elapsed_ms):
+    timings = st.session_state.setdefault('section_timings', {})
+    entry = timings.setdefault(name, {'runs': 0, 'last_ms': 0.0, 'total_ms': 0.0})
+    entry['runs'] += 1
+    entry['last_ms'] = elapsed_ms
+    entry['total_ms'] += elapsed_ms
+
+
+@contextmanager
+def timed_section(name):
+    """Mencatat jumlah eksekusi dan waktu (ms) satu bagian dashboard di st.session_state"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(name, (time.perf_counter() - start) * 1000)
+
+
+def start_script_timer():
+    """Menandai awal eksekusi skrip penuh (dipasangkan dengan finish_script_timer())"""
+    st.session_state['_script_started_at'] = time.perf_counter()
+
+
+def finish_script_timer():
+    started_at = st.session_state.pop('_script_started_at', None)
+    if started_at is not None:
+        _record('script', (time.perf_counter() - started_at) * 1000)
+
+
+def record_action(name):
+    """Menandai satu aksi pengguna baru; dipanggil dari callback on_change widget"""
+    st.session_state['_action_seq'] = st.session_state.get('_action_seq', 0) + 1
+    st.session_state['_action_name'] = name
+
+
+def count_rerun():
+    """Menghitung eksekusi skrip penuh untuk aksi pengguna terakhir (panggil di awal skrip)"""
+    stats = st.session_state.setdefault('rerun_stats', {
+        'runs': 0, 'actions': 0, 'last_action': None, 'last_action_runs': 0, 'max_runs_per_action': 0,
+    })
+    seq = st.session_state.get('_action_seq', 0)
+    stats['runs'] += 1
+    if stats.get('action_seq') != seq:
+        stats['action_seq'] = seq
+        stats['actions'] += 1
+        stats['last_action'] = st.session_state.get('_action_name', 'muat awal')
+        stats['last_action_runs'] = 1
+    else:
+        stats['last_action_runs'] += 1
+    stats['max_runs_per_action'] = max(stats['max_runs_per_action'], stats['last_action_runs'])
+
+
+def record_payload_size(chart_id, size_bytes, budget_bytes):
+    """Mencatat ukuran spec JSON (byte) yang dikirim untuk satu grafik pada rerun terakhir"""
+    payloads = st.session_state.setdefault('chart_payloads', {})
+    payloads[chart_id] = {'kb': size_bytes / 1024, 'budget_kb': budget_bytes / 1024, 'over_budget': size_bytes > budget_bytes}
+
+
+def render_timing_panel():
+    """Menampilkan waktu eksekusi per bagian, rerun per aksi, dan ukuran payload grafik jika URL memuat ?debug=1"""
+    if st.query_params.get('debug') != '1':
+        return
+    timings = st.session_state.get('section_timings', {})
+    with st.sidebar.expander("⏱️ Waktu Eksekusi", expanded=False):
+        st.dataframe(
+            pd.DataFrame.from_dict(timings, orient='index').rename_axis('Bagian').round(1),
+            use_container_width=True
+        )
+        st.json(st.session_state.get('rerun_stats', {}))
+        payloads = st.session_state.get('chart_payloads', {})
+        if payloads:
+            st.dataframe(
+                pd.DataFrame.from_dict(payloads, orient='index').rename_axis('Grafik').round(1),
+                use_container_width=True
+            )
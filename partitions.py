@@ -0,0 +1,101 @@
+import os
+import shutil
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from schema_adapters import CANONICAL_COLUMNS, CHUNK_ROWS, DERIVED_COLUMNS
+
+# Satu partisi Parquet per dekade (kolom Decade): <root>/Decade=1990/part.parquet
+PARTITION_COLUMN = 'Decade'
+PARTITION_FILE = 'part.parquet'
+
+
+def partition_path(root, decade):
+    return os.path.join(root, f"{PARTITION_COLUMN}={int(decade)}", PARTITION_FILE)
+
+
+def list_partitions(root):
+    """{dekade: path} untuk semua partisi yang ada di root"""
+    partitions = {}
+    if not os.path.isdir(root):
+        return partitions
+    for name in os.listdir(root):
+        column, _, value = name.partition('=')
+        path = os.path.join(root, name, PARTITION_FILE)
+        if column == PARTITION_COLUMN and value.isdigit() and os.path.exists(path):
+            partitions[int(value)] = path
+    return dict(sorted(partitions.items()))
+
+
+def _to_partition_frame(df):
+    # Parquet butuh satu tipe per kolom, sedangkan Duration mentah bisa berupa "130min" atau 130.0
+    df = df[CANONICAL_COLUMNS + DERIVED_COLUMNS].copy()
+    df['Duration'] = df['Duration_Clean']
+    return df.reset_index(drop=True)
+
+
+def _write_partition(root, decade, df):
+    path = partition_path(root, decade)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Tulis ke file sementara lalu rename agar pembaca tidak melihat partisi setengah jadi
+    df.to_parquet(path + '.tmp', index=False)
+    os.replace(path + '.tmp', path)
+
+
+def write_partitions(df, root):
+    """Menulis DataFrame berskema kanonik sebagai dataset berpartisi dekade (partisi lama diganti)"""
+    df = _to_partition_frame(df)
+    decades = set()
+    for decade, part in df.groupby(PARTITION_COLUMN, sort=True):
+        _write_partition(root, decade, part)
+        decades.add(int(decade))
+    for decade, path in list_partitions(root).items():
+        if decade not in decades:
+            shutil.rmtree(os.path.dirname(path))
+    return sorted(decades)
+
+
+def append_partitions(df, root):
+    """Menambahkan baris ke partisi dekade yang bersangkutan; hanya partisi yang tersentuh ditulis ulang"""
+    df = _to_partition_frame(df)
+    existing = list_partitions(root)
+    decades = []
+    for decade, part in df.groupby(PARTITION_COLUMN, sort=True):
+        decade = int(decade)
+        if decade in existing:
+            part = pd.concat([pd.read_parquet(existing[decade]), part], ignore_index=True)
+        _write_partition(root, decade, part)
+        decades.append(decade)
+    return decades
+
+
+def select_partitions(root, year_bounds=None):
+    """{dekade: path} untuk partisi yang beririsan dengan year_bounds (awal, akhir); None = semua"""
+    partitions = list_partitions(root)
+    if year_bounds is None:
+        return partitions
+    start, end = year_bounds
+    return {decade: path for decade, path in partitions.items() if decade + 9 >= start and decade <= end}
+
+
+def read_partitions(root, year_bounds=None):
+    """Membaca dataset berpartisi; hanya partisi yang beririsan dengan year_bounds (awal, akhir) yang dibuka"""
+    partitions = select_partitions(root, year_bounds)
+    if not partitions:
+        return pd.DataFrame(columns=CANONICAL_COLUMNS + DERIVED_COLUMNS)
+
+    df = pd.concat([pd.read_parquet(path) for path in partitions.values()], ignore_index=True)
+    if year_bounds is not None:
+        df = df[df['ReleaseYear'].between(*year_bounds)].reset_index(drop=True)
+    return df
+
+
+def read_partition_chunks(root, year_bounds=None, chunksize=CHUNK_ROWS):
+    """Membaca partisi yang beririsan dengan year_bounds per potongan berisi paling banyak chunksize baris"""
+    for path in select_partitions(root, year_bounds).values():
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            chunk = batch.to_pandas()
+            if year_bounds is not None:
+                chunk = chunk[chunk['ReleaseYear'].between(*year_bounds)]
+            yield chunk
@@ -0,0 +1,88 @@
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+
+def estimate_size(value):
+    """Memperkirakan ukuran memori (byte) sebuah hasil yang akan disimpan di cache"""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum()) if isinstance(usage, pd.Series) else int(usage)
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    if hasattr(value, 'to_plotly_json'):
+        return estimate_size(value.to_plotly_json())
+    return sys.getsizeof(value)
+
+
+def normalize_filter_key(year_range, genres):
+    """Kunci cache dari state filter: (tahun awal, tahun akhir) dan tuple genre terurut"""
+    return (int(year_range[0]), int(year_range[1])), tuple(sorted(genres or []))
+
+
+class LRUCache:
+    """Cache LRU lintas sesi dengan batas total ukuran memori (byte).
+
+    Aman dipakai dari beberapa thread sesi Streamlit sekaligus. Nilai yang disimpan
+    dibagikan ke semua sesi, sehingga pemanggil tidak boleh mengubahnya.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compute(self, key, compute):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+
+        # Dihitung di luar lock agar sesi lain tidak ikut menunggu
+        value = compute()
+        size = estimate_size(value)
+        with self._lock:
+            if key in self._entries or size > self.max_bytes:
+                return value
+            self._entries[key] = (value, size)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / total if total else 0.0,
+            }
+
+
+# Cache hasil filter untuk seluruh proses (dipakai bersama oleh semua sesi)
+filter_results_cache = LRUCache(max_bytes=64 * 1024 * 1024)
@@ -0,0 +1,173 @@
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+from data_utils import clean_duration
+from validation import QuarantineWriter, Validator
+
+# Skema kanonik yang dipakai seluruh pipeline (sama dengan kolom IMDb_Data_final.csv)
+CANONICAL_COLUMNS = ['Title', 'ReleaseYear', 'Duration', 'Director', 'Stars', 'Category', 'IMDb-Rating',
+                     'Censor-board-rating']
+DERIVED_COLUMNS = ['Decade', 'Decade_Label', 'Duration_Clean']
+LIST_COLUMNS = ['Director', 'Stars', 'Category']
+
+# Jumlah baris per potongan saat membaca CSV
+CHUNK_ROWS = 50_000
+
+# Huruf kecil/kapital Latin (termasuk beraksen, misalnya "YasujirôOzu") untuk memisahkan nama yang menempel
+_LOWER = 'a-zß-öø-ÿ'
+_UPPER = 'A-ZÀ-ÖØ-Þ'
+# Awalan marga yang memang diikuti huruf kapital (McConaughey, DeWitt, LeRoy, DiCaprio)
+_SURNAME_PREFIXES = ('Mc', 'Mac', 'Da', 'De', 'Di', 'Du', 'La', 'Le')
+# Marga berpartikel huruf kecil yang dikenal. Partikel hanya dipisah dari nama depan jika diikuti
+# marga di daftar ini ("LarsvonTrier"), karena banyak nama depan berakhiran sama (Devon, Wade,
+# Maude, Adelaide, Donovan). Tambahkan entri jika sumber data baru memuat nama seperti ini.
+_PARTICLE_SURNAMES = (
+    'de Armas', 'de Havilland', 'de Malberg', 'de Oliveira', 'de Tavira', 'del Toro',
+    'van Eyck', 'van Groeningen', 'van Houten', 'van Werveke',
+    'von Donnersmarck', 'von Stroheim', 'von Sydow', 'von Trier', 'von Wangenheim',
+)
+_NAME_BOUNDARY = (
+    ''.join(f'(?<!{prefix})' for prefix in _SURNAME_PREFIXES)
+    + f'(?:(?<=[{_LOWER}])(?=[{_UPPER}][{_LOWER}.])|(?<=\\.)(?=[{_UPPER}][{_LOWER}]))'
+    + f'|(?<=[{_LOWER}])(?=(?:{"|".join(name.replace(" ", "") for name in _PARTICLE_SURNAMES)})(?![{_LOWER}]))'
+)
+
+
+def normalize_list(values):
+    """Merapikan kolom berisi daftar dipisah koma menjadi "A, B, C" (entri kosong dibuang)"""
+    text = values.where(values.isna(), values.astype(str))
+    text = (
+        text.str.replace(r'\s*,[\s,]*', ', ', regex=True)
+        .str.strip(', ')
+    )
+    return text.mask(text == '')
+
+
+def split_joined_names(values):
+    """Menyisipkan spasi pada nama yang menempel ("JosephKosinski" -> "Joseph Kosinski")"""
+    return values.str.replace(_NAME_BOUNDARY, ' ', regex=True)
+
+
+def split_leaked_directors(director, stars):
+    """Memindahkan sutradara tambahan yang ikut tertulis di awal kolom Stars.
+
+    Pada IMDb_Data_final.csv, film dengan beberapa sutradara ditulis "PeteDocter," di kolom
+    Director dan "LeeUnkrich, , BillyCrystal, ..." di kolom Stars: entri sebelum entri kosong
+    pertama adalah sutradara. Baris tanpa penanda tersebut tidak diubah.
+    """
+    flagged = director.str.rstrip().str.endswith(',', na=False)
+    parts = (director[flagged] + stars[flagged].fillna('')).str.extract(r'^(.*?)\s*,\s*,\s*(.*)$')
+    matched = parts[0].notna()
+    director, stars = director.copy(), stars.copy()
+    director.loc[parts.index[matched]] = parts.loc[matched, 0]
+    stars.loc[parts.index[matched]] = parts.loc[matched, 1]
+    return director, stars
+
+
+@dataclass(frozen=True)
+class SchemaAdapter:
+    """Pemetaan satu format file sumber ke skema kanonik"""
+    name: str
+    signature: frozenset                       # kolom (setelah rename) yang menandai format ini
+    renames: dict = field(default_factory=dict)
+    defaults: dict = field(default_factory=dict)
+    joined_names: bool = False                 # nama orang ditulis tanpa spasi ("JosephKosinski")
+
+    def matches(self, columns):
+        return self.signature <= set(self.renames.get(column, column) for column in columns)
+
+    def normalize(self, chunk):
+        """Mengubah satu potongan DataFrame mentah ke skema kanonik (belum divalidasi, lihat normalize_chunk())"""
+        df = chunk.rename(columns=self.renames)
+        for column, value in self.defaults.items():
+            if column not in df.columns:
+                df[column] = value
+        if self.joined_names:
+            df['Director'], df['Stars'] = split_leaked_directors(df['Director'], df['Stars'])
+            df['Director'] = split_joined_names(df['Director'])
+            df['Stars'] = split_joined_names(df['Stars'])
+        for column in LIST_COLUMNS:
+            df[column] = normalize_list(df[column])
+
+        df['ReleaseYear'] = pd.to_numeric(df['ReleaseYear'], errors='coerce')
+        df['Duration_Clean'] = clean_duration(df['Duration'])
+        df['IMDb-Rating'] = pd.to_numeric(df['IMDb-Rating'], errors='coerce')
+        return df[CANONICAL_COLUMNS + ['Duration_Clean']]
+
+
+def add_decade_columns(df):
+    """Menambahkan Decade dan Decade_Label pada baris yang sudah lolos validasi (tahun pasti terisi)"""
+    df = df.assign(ReleaseYear=df['ReleaseYear'].astype(int))
+    df['Decade'] = (df['ReleaseYear'] // 10) * 10
+    df['Decade_Label'] = df['Decade'].astype(str) + 's'
+    return df[CANONICAL_COLUMNS + DERIVED_COLUMNS]
+
+
+def normalize_chunk(adapter, chunk, validator, quarantine):
+    """Menormalkan dan memvalidasi satu potongan; baris yang ditolak ditulis ke karantina (validation.py)"""
+    valid, rejected = validator.split(adapter.normalize(chunk))
+    quarantine.write(rejected)
+    return add_decade_columns(valid)
+
+
+# Hasil scraping (dataset_csv/, data_final.csv): nama berspasi, durasi numerik, tanpa rating sensor.
+# Nama kolom versi scraper lama (Name, Directors, ...) ikut dipetakan.
+SCRAPE_ADAPTER = SchemaAdapter(
+    name='scrape',
+    signature=frozenset(['Title', 'ReleaseYear', 'Director', 'Stars', 'Category', 'IMDb-Rating']),
+    renames={
+        'Name': 'Title',
+        'Directors': 'Director',
+        'Actors': 'Stars',
+        'Rating': 'IMDb-Rating',
+        'Genres': 'Category',
+        'Year': 'ReleaseYear',
+    },
+    defaults={'Censor-board-rating': 'Not Rated'},
+)
+
+# IMDb_Data_final.csv: durasi "130min", nama tanpa spasi, kolom Censor-board-rating
+IMDB_TOP_ADAPTER = SchemaAdapter(
+    name='imdb_top',
+    signature=frozenset(CANONICAL_COLUMNS),
+    joined_names=True,
+)
+
+# Urutan penting: format yang lebih spesifik dicek lebih dulu
+ADAPTERS = [IMDB_TOP_ADAPTER, SCRAPE_ADAPTER]
+
+
+def detect_adapter(columns):
+    """Memilih adapter pertama yang cocok dengan kolom file; ValueError jika tidak ada"""
+    for adapter in ADAPTERS:
+        if adapter.matches(columns):
+            return adapter
+    raise ValueError(f"Format kolom tidak dikenali: {list(columns)}")
+
+
+def read_normalized_chunks(path, chunksize=CHUNK_ROWS, validator=None):
+    """Membaca CSV per potongan dan menghasilkan potongan yang sudah berskema kanonik dan tervalidasi.
+
+    Baris yang ditolak ditulis ke quarantine/<nama file>.csv beserta kode alasannya.
+    validator dapat dipakai bersama beberapa file agar duplikat antar file ikut terdeteksi.
+    """
+    validator = validator or Validator()
+    quarantine = QuarantineWriter(path)
+    adapter = None
+    for chunk in pd.read_csv(path, chunksize=chunksize):
+        if adapter is None:
+            adapter = detect_adapter(chunk.columns)
+        # Potongan mentah dilepas sebelum yield agar hanya potongan kanonik yang tertahan di memori
+        chunk = normalize_chunk(adapter, chunk, validator, quarantine)
+        yield chunk
+    quarantine.close()
+
+
+def read_normalized(paths, chunksize=CHUNK_ROWS):
+    """Membaca beberapa file (boleh berbeda format) menjadi satu DataFrame berskema kanonik"""
+    validator = Validator()
+    frames = [chunk for path in paths for chunk in read_normalized_chunks(path, chunksize, validator)]
+    if not frames:
+        return pd.DataFrame(columns=CANONICAL_COLUMNS + DERIVED_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
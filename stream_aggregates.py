@@ -0,0 +1,272 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from data_utils import (
+    RATING_GRID, add_prefix_sums, director_index_from_entries, explode_genres, rating_bins, split_names
+)
+from partitions import read_partition_chunks
+from schema_adapters import CHUNK_ROWS, read_normalized_chunks
+from validation import Validator
+
+MAX_GENRES = 64
+
+# Kolom agregat per sel (tahun, genre), per tahun, dan per entri sutradara beserta tipe hasilnya
+CELL_FIELDS = [('count', np.int64), ('rating_count', np.int64), ('rating_sum', np.float64),
+               ('rating_sumsq', np.float64), ('duration_sum', np.float64)]
+YEAR_FIELDS = [('film_count', np.int64), ('film_rating_count', np.int64),
+               ('film_rating_sum', np.float64), ('film_duration_sum', np.float64)]
+DIRECTOR_FIELDS = ('film_count', 'rating_count', 'rating_sum')
+# Kolom potongan yang dibaca AggregateAccumulator.update()
+SOURCE_COLUMNS = ['ReleaseYear', 'IMDb-Rating', 'Duration_Clean', 'Category', 'Director']
+
+
+def _grow(array, shape):
+    """Memperbesar array (diisi nol) agar setiap sumbunya minimal sebesar shape; kapasitas dilipatduakan"""
+    if all(have >= need for have, need in zip(array.shape, shape)):
+        return array
+    capacity = tuple(have if have >= need else max(need, 2 * have) for have, need in zip(array.shape, shape))
+    grown = np.zeros(capacity, dtype=array.dtype)
+    grown[tuple(slice(0, n) for n in array.shape)] = array
+    return grown
+
+
+def _assign_codes(codes, keys):
+    """Kode untuk setiap kunci; kunci baru mendapat kode berikutnya (urutan kemunculan)"""
+    return np.array([codes.setdefault(key, len(codes)) for key in keys], dtype=np.int64)
+
+
+def _split_unique(values, split):
+    """Memecah setiap nilai unik values dengan split() lalu memetakan hasilnya kembali ke baris.
+
+    split(Series nilai unik) mengembalikan Series satu baris per bagian dengan index posisi
+    nilai unik (explode_genres, split_names). Teks yang sama cukup dipecah sekali per potongan.
+    Mengembalikan (posisi baris, bagian) untuk setiap pasangan baris-bagian.
+    """
+    labels, uniques = pd.factorize(values, use_na_sentinel=False)
+    parts = split(pd.Series(uniques, dtype=object))
+    counts = np.bincount(parts.index.to_numpy(), minlength=len(uniques))
+    starts = np.cumsum(counts) - counts
+    per_row = counts[labels]
+    rows = np.repeat(np.arange(len(labels)), per_row)
+    part_pos = np.repeat(starts[labels] - (np.cumsum(per_row) - per_row), per_row) + np.arange(per_row.sum())
+    return rows, parts.to_numpy()[part_pos]
+
+
+class SortedKeyCodes:
+    """Kode untuk kunci uint64 yang disimpan sebagai array terurut (tanpa objek Python per kunci).
+
+    Kunci baru mendapat kode berikutnya (urutan kemunculan); kunci lama dicari dengan
+    np.searchsorted dan kunci baru disisipkan di posisinya, sehingga memorinya 16 byte per kunci.
+    """
+
+    def __init__(self):
+        self.keys = np.zeros(0, dtype=np.uint64)   # terurut
+        self.codes = np.zeros(0, dtype=np.int64)   # kode untuk keys pada posisi yang sama
+
+    def __len__(self):
+        return len(self.keys)
+
+    def encode(self, keys):
+        """Kode per elemen keys; kunci yang belum ada ditambahkan"""
+        unique, first, inverse = np.unique(np.asarray(keys, dtype=np.uint64), return_index=True, return_inverse=True)
+        pos = np.searchsorted(self.keys, unique)
+        found = pos < len(self.keys)
+        found[found] = self.keys[pos[found]] == unique[found]
+        new = np.flatnonzero(~found)
+        if len(new):
+            new_codes = np.empty(len(new), dtype=np.int64)
+            new_codes[np.argsort(first[new], kind='stable')] = np.arange(len(self.keys), len(self.keys) + len(new))
+            self.codes = np.insert(self.codes, pos[new], new_codes)
+            self.keys = np.insert(self.keys, pos[new], unique[new])
+        return self.codes[np.searchsorted(self.keys, unique)][inverse]
+
+    def keys_by_code(self):
+        """Array kunci yang diindeks kode"""
+        keys = np.empty(len(self.keys), dtype=np.uint64)
+        keys[self.codes] = self.keys
+        return keys
+
+
+def _key_codes(codes, *columns):
+    """Kode per baris untuk kunci gabungan (tuple nilai columns) yang disimpan di dict codes"""
+    keys, inverse = np.unique(np.column_stack([np.asarray(c, dtype=np.uint64) for c in columns]),
+                              axis=0, return_inverse=True)
+    return _assign_codes(codes, map(tuple, keys.tolist()))[inverse.ravel()]
+
+
+class AggregateAccumulator:
+    """Agregat berjalan yang diperbarui per potongan baris.
+
+    Yang disimpan hanya jumlah per kunci: (tahun, genre), (tahun, genre, bin rating),
+    tahun, (tahun, kombinasi genre), dan (sutradara, tahun, kombinasi genre). Setiap jenis
+    kunci diberi kode lewat dict yang tumbuh (urutan kemunculan) dan jumlahnya disimpan di
+    array NumPy yang diindeks kode tersebut, sehingga satu potongan hanya menambah nilai di
+    tempat (np.add.at) tanpa menggabungkan ulang agregat yang sudah ada. Kunci sutradara,
+    yang jumlahnya hampir sebanyak film, dikemas menjadi satu uint64 (kode sutradara dan
+    kode kombinasi) di SortedKeyCodes.
+
+    Kombinasi genre tetap menjadi bagian kunci sutradara agar director_stats() dengan filter
+    genre sama dengan FilmStore; bitmask hasil OR per (sutradara, tahun) dibentuk oleh
+    director_index_from_entries().
+    """
+
+    def __init__(self):
+        self.genre_codes = {}       # nama genre -> posisi bit sementara (urutan kemunculan)
+        self.year_codes = {}        # tahun rilis -> kode tahun
+        self.combo_codes = {}       # (kode tahun, bitmask genre) -> kode kombinasi
+        self.director_codes = {}    # nama sutradara -> kode sutradara
+        self.director_entry_codes = SortedKeyCodes()    # kode sutradara << 32 | kode kombinasi
+        # Sel (kode tahun, kode genre)
+        self.cells = {name: np.zeros((0, 0), dtype=dtype) for name, dtype in CELL_FIELDS}
+        self.hist = np.zeros((0, 0, len(RATING_GRID)), dtype=np.int32)
+        # Per kode tahun, per kode kombinasi, dan per kode entri sutradara
+        self.years = {name: np.zeros(0, dtype=dtype) for name, dtype in YEAR_FIELDS}
+        self.combo_count = np.zeros(0, dtype=np.int64)
+        self.directors = {name: np.zeros(0, dtype=np.float64) for name in DIRECTOR_FIELDS}
+
+    def update(self, chunk):
+        """Menambahkan satu potongan berskema kanonik (lihat schema_adapters) ke agregat"""
+        # Baris yang dibuang sama dengan build_film_genre_model(): durasi kosong dan genre kosong
+        chunk = chunk[SOURCE_COLUMNS].dropna(subset=['Duration_Clean']).reset_index(drop=True)
+        film_pos, genres = _split_unique(
+            chunk['Category'], lambda category: explode_genres(category.to_frame('Category'))['Genre']
+        )
+        if len(film_pos) == 0:
+            return
+        for genre in pd.unique(genres):
+            self.genre_codes.setdefault(genre, len(self.genre_codes))
+        if len(self.genre_codes) > MAX_GENRES:
+            raise ValueError(
+                f"Bitmask genre hanya mendukung {MAX_GENRES} genre, data memiliki {len(self.genre_codes)} genre."
+            )
+
+        codes = pd.Index(list(self.genre_codes)).get_indexer(genres).astype(np.int64)
+        bits = np.zeros(len(chunk), dtype=np.uint64)
+        np.bitwise_or.at(bits, film_pos, np.left_shift(np.uint64(1), codes.astype(np.uint64)))
+        keep = np.unique(film_pos)
+
+        # Nilai dibulatkan ke float32 seperti compact_frame() agar hasilnya sama dengan FilmStore
+        year_keys, year_inverse = np.unique(chunk['ReleaseYear'].to_numpy().astype(np.int64), return_inverse=True)
+        years = _assign_codes(self.year_codes, year_keys.tolist())[year_inverse]
+        ratings = pd.to_numeric(chunk['IMDb-Rating'], errors='coerce').to_numpy().astype(np.float32).astype(np.float64)
+        has_rating = ~np.isnan(ratings)
+        ratings = np.where(has_rating, ratings, 0.0)
+        durations = chunk['Duration_Clean'].to_numpy().astype(np.float32).astype(np.float64)
+
+        shape = (len(self.year_codes), len(self.genre_codes))
+        cell = (years[film_pos], codes)
+        for name, values in [('count', 1), ('rating_count', has_rating[film_pos]), ('rating_sum', ratings[film_pos]),
+                             ('rating_sumsq', ratings[film_pos] ** 2), ('duration_sum', durations[film_pos])]:
+            self.cells[name] = _grow(self.cells[name], shape)
+            np.add.at(self.cells[name], cell, values)
+
+        rated = has_rating[film_pos]
+        self.hist = _grow(self.hist, shape + (len(RATING_GRID),))
+        np.add.at(self.hist, (cell[0][rated], codes[rated], rating_bins(ratings[film_pos][rated])), 1)
+
+        for name, values in [('film_count', 1), ('film_rating_count', has_rating[keep]),
+                             ('film_rating_sum', ratings[keep]), ('film_duration_sum', durations[keep])]:
+            self.years[name] = _grow(self.years[name], shape[:1])
+            np.add.at(self.years[name], years[keep], values)
+
+        combos = np.zeros(len(chunk), dtype=np.int64)
+        combos[keep] = _key_codes(self.combo_codes, years[keep], bits[keep])
+        self.combo_count = _grow(self.combo_count, (len(self.combo_codes),))
+        np.add.at(self.combo_count, combos[keep], 1)
+
+        film_ids, people = _split_unique(chunk['Director'].iloc[keep], split_names)
+        film_ids = keep[film_ids]
+        name_ids, names = pd.factorize(people)
+        directors = _assign_codes(self.director_codes, names)[name_ids]
+        entries = self.director_entry_codes.encode(
+            (directors.astype(np.uint64) << np.uint64(32)) | combos[film_ids].astype(np.uint64)
+        )
+        for name, values in [('film_count', 1.0), ('rating_count', has_rating[film_ids]),
+                             ('rating_sum', ratings[film_ids])]:
+            self.directors[name] = _grow(self.directors[name], (len(self.director_entry_codes),))
+            np.add.at(self.directors[name], entries, values)
+
+    def finish(self):
+        """Mengubah agregat berjalan menjadi (kubus, indeks sutradara, kombinasi genre per tahun).
+
+        Format kubus dan indeks sutradara sama dengan build_year_genre_cube() dan
+        build_director_index(), kecuali offset baris tabel film yang tidak ada. Mengembalikan
+        None jika belum ada film dengan genre.
+        """
+        if not self.year_codes:
+            return None
+        genres = sorted(self.genre_codes)
+        genre_map = np.array([genres.index(name) for name in self.genre_codes], dtype=np.int64)
+
+        def remap_bits(bits):
+            # Posisi bit sementara (urutan kemunculan) -> urutan genre terurut nama
+            bits = np.asarray(bits, dtype=np.uint64)
+            remapped = np.zeros(len(bits), dtype=np.uint64)
+            for old, new in enumerate(genre_map):
+                remapped |= ((bits >> np.uint64(old)) & np.uint64(1)) << np.uint64(new)
+            return remapped
+
+        # Kode tahun -> indeks tahun kubus
+        year_values = np.array(list(self.year_codes), dtype=np.int64)
+        first_year = int(year_values.min())
+        year_idx = year_values - first_year
+        years = np.arange(first_year, int(year_values.max()) + 1)
+        n_codes = (len(year_values), len(genres))
+        shape = (len(years), len(genres))
+
+        cube = {'years': years, 'genres': genres}
+        cells = np.ix_(year_idx, genre_map)
+        for name, dtype in CELL_FIELDS:
+            cube[name] = np.zeros(shape, dtype=dtype)
+            cube[name][cells] = self.cells[name][:n_codes[0], :n_codes[1]]
+        cube['rating_hist'] = np.zeros(shape + (len(RATING_GRID),), dtype=np.int32)
+        cube['rating_hist'][cells] = self.hist[:n_codes[0], :n_codes[1]]
+        for name, dtype in YEAR_FIELDS:
+            cube[name] = np.zeros(len(years), dtype=dtype)
+            cube[name][year_idx] = self.years[name][:n_codes[0]]
+        add_prefix_sums(cube)
+
+        year_bounds = np.arange(len(years) + 1)
+        # Kunci per kode kombinasi: (kode tahun, bitmask genre)
+        combo_keys = np.array(list(self.combo_codes), dtype=np.uint64).reshape(-1, 2)
+        combo_year = year_idx[combo_keys[:, 0].astype(np.int64)]
+        order = np.argsort(combo_year, kind='stable')
+        film_combos = {
+            'bits': remap_bits(combo_keys[order, 1]),
+            'count': self.combo_count[:len(combo_keys)][order],
+            'offsets': np.searchsorted(combo_year[order], year_bounds),
+        }
+
+        entry_keys = self.director_entry_codes.keys_by_code()
+        entry_director = (entry_keys >> np.uint64(32)).astype(np.int64)
+        entry_combo = (entry_keys & np.uint64(0xFFFFFFFF)).astype(np.int64)
+        entry_year = combo_year[entry_combo]
+        order = np.argsort(entry_year, kind='stable')
+        n_entries = len(entry_keys)
+        director_index = director_index_from_entries(
+            np.array(list(self.director_codes), dtype=object)[entry_director[order]],
+            entry_year[order], remap_bits(combo_keys[entry_combo[order], 1]), len(years),
+            **{name: self.directors[name][:n_entries][order] for name in DIRECTOR_FIELDS},
+        )
+        return cube, director_index, film_combos
+
+
+def stream_aggregates(source_path, year_bounds=None, chunksize=CHUNK_ROWS):
+    """Membaca sumber (CSV atau folder partisi) per potongan chunksize baris dan mengembalikan hasil finish().
+
+    Hanya satu potongan baris mentah yang ada di memori pada satu waktu. Cek duplikat dilewati
+    karena kumpulan kuncinya tumbuh sebanding jumlah baris (lihat validation.Validator).
+    """
+    if os.path.isdir(source_path):
+        chunks = read_partition_chunks(source_path, year_bounds, chunksize)
+    else:
+        chunks = read_normalized_chunks(source_path, chunksize, Validator(check_duplicates=False))
+
+    accumulator = AggregateAccumulator()
+    for chunk in chunks:
+        if year_bounds is not None:
+            chunk = chunk[chunk['ReleaseYear'].between(*year_bounds)]
+        accumulator.update(chunk)
+    return accumulator.finish()
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Modul repository berada di root (tanpa paket), sama seperti skrip di benchmarks/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
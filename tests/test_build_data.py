@@ -0,0 +1,48 @@
+import pandas as pd
+
+from build_data import build, merge_report_path
+from partitions import read_partitions
+
+YEAR_FILE_COLUMNS = ['ID', 'Name', 'Year', 'Duration', 'Directors', 'Actors', 'Genres', 'Rating']
+
+
+def write_year_file(folder, year, titles):
+    rows = [[i, title, year, 100.0, 'Ann Lee', 'Bo Chen', 'Drama', 7.0] for i, title in enumerate(titles)]
+    pd.DataFrame(rows, columns=YEAR_FILE_COLUMNS).to_csv(folder / f'{year}_final.csv', index=False)
+
+
+def test_plain_build_keeps_recorded_partitions_in_sync(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    source = tmp_path / 'src'
+    source.mkdir()
+    write_year_file(source, 2023, ['A', 'B'])
+    write_year_file(source, 2024, ['C'])
+    build('src', 'out.csv', workers=1, partitions_dir='parts')
+
+    write_year_file(source, 2025, ['D'])
+    summary = build('src', 'out.csv', workers=1)
+    assert summary['mode'] == 'append' and summary['partitions_dir'] == 'parts'
+    assert sorted(read_partitions('parts')['ReleaseYear']) == [2023, 2023, 2024, 2025]
+
+    # Build penuh tanpa --partitions juga menulis ulang folder yang sama
+    summary = build('src', 'out.csv', workers=1, full=True)
+    assert summary['partitions_written'] and sorted(read_partitions('parts')['Title']) == ['A', 'B', 'C', 'D']
+
+
+def test_incomplete_copies_lose_the_merge_and_are_reported(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    source = tmp_path / 'src'
+    source.mkdir()
+    rows = [
+        [0, 'A', 2023, 100.0, 'Ann Lee', 'Bo Chen', 'Drama', None],     # salinan A tanpa rating
+        [1, 'A', 2023, 100.0, 'Ann Lee', 'Bo Chen', 'Drama', 7.5],
+        [2, 'B', 2023, None, 'Ann Lee', 'Bo Chen', 'Drama', 6.0],       # B hanya punya salinan tidak lengkap
+    ]
+    pd.DataFrame(rows, columns=YEAR_FILE_COLUMNS).to_csv(source / '2023_final.csv', index=False)
+
+    summary = build('src', 'out.csv', workers=1)
+    output = pd.read_csv('out.csv')
+    assert output['Title'].tolist() == ['A'] and output['IMDb-Rating'].tolist() == [7.5]
+    report = pd.read_csv(merge_report_path('out.csv'))
+    assert summary['duplicates_dropped'] == 1
+    assert report[['Kept_Source', 'Dropped_Source']].values.tolist() == [['2023_final.csv:3', '2023_final.csv:2']]
@@ -0,0 +1,33 @@
+import pandas as pd
+import pytest
+
+from data_utils import build_director_index, build_film_genre_model, build_year_genre_cube, compact_frame, freeze
+
+
+def test_constant_schema_columns_are_kept():
+    df = pd.DataFrame({
+        'Title': ['A', 'B', 'C'], 'ReleaseYear': [2001, 2002, 2003], 'Director': ['Ann Lee'] * 3,
+        'Category': ['Drama'] * 3, 'IMDb-Rating': [7.0, 6.0, 8.0], 'Duration_Clean': [100.0, 110.0, 90.0],
+        'Censor-board-rating': ['Not Rated'] * 3,
+    })
+    compact = compact_frame(df)
+    assert 'Censor-board-rating' not in compact.columns
+    assert compact.attrs['constant_columns'] == {'Censor-board-rating': 'Not Rated'}
+    assert compact['Category'].dtype == 'category' and compact['Director'].dtype == 'category'
+
+    films, film_genres = build_film_genre_model(compact)
+    cube = build_year_genre_cube(films, film_genres)
+    assert cube['genres'] == ['Drama']
+    assert build_director_index(films, cube) is not None
+
+
+def test_freeze_keeps_attrs_and_rejects_writes():
+    df = compact_frame(pd.DataFrame({
+        'Title': ['A', 'B'], 'ReleaseYear': [2001, 2002], 'IMDb-Rating': [7.0, 6.0],
+        'Censor-board-rating': ['Not Rated'] * 2,
+    }))
+    frozen = freeze(df)
+    assert frozen.attrs['constant_columns'] == {'Censor-board-rating': 'Not Rated'}
+    for position in range(frozen.shape[1]):
+        with pytest.raises(ValueError):
+            frozen.iloc[0, position] = frozen.iloc[1, position]
@@ -0,0 +1,75 @@
+import pandas as pd
+
+from dedup import completeness, dedup_keys, merge_duplicates
+
+COLUMNS = ['Title', 'ReleaseYear', 'Duration', 'Director', 'Actors', 'Category', 'IMDb-Rating']
+
+
+def films(*rows):
+    return pd.DataFrame(list(rows), columns=COLUMNS)
+
+
+def test_key_ignores_accents_case_punctuation_and_director_order():
+    df = films(
+        ['Amélie', 2001, 122.0, 'Jean-Pierre Jeunet', 'Audrey Tautou', 'Comedy', 8.3],
+        ['AMELIE!', 2001, 122.0, 'jean pierre jeunet', 'Audrey Tautou', 'Comedy', 8.3],
+        ['Fargo', 1996, 98.0, 'Joel Coen, Ethan Coen', 'Frances McDormand', 'Crime', 8.1],
+        ['Fargo', 1996, 98.0, 'Ethan Coen,Joel Coen', 'Frances McDormand', 'Crime', 8.1],
+    )
+    keys = dedup_keys(df)
+    assert keys[0] == keys[1] and keys[2] == keys[3] and keys[0] != keys[2]
+
+
+def test_different_director_sets_are_never_merged():
+    df = films(
+        ['Fargo', 1996, 98.0, 'Joel Coen, Ethan Coen', 'Frances McDormand', 'Crime', 8.1],
+        ['Fargo', 1996, 98.0, 'Joel Coen', 'Frances McDormand', 'Crime', 8.1],
+        ['Fargo', 1996, 98.0, 'Ethan Coen', 'Frances McDormand', 'Crime', 8.1],
+        ['Fargo', 1996, 98.0, 'Noah Hawley', 'Frances McDormand', 'Crime', 8.1],
+        ['Fargo', 1996, 98.0, 'Joel Coen, Ethan Coen, Noah Hawley', 'Frances McDormand', 'Crime', 8.1],
+    )
+    merged, report = merge_duplicates(df)
+    assert len(merged) == 5 and report.empty
+
+
+def test_more_filled_columns_win_over_earlier_rows():
+    df = films(
+        ['Dune', 2021, None, 'Denis Villeneuve', 'Timothée Chalamet, Zendaya, Rebecca Ferguson', 'Sci-Fi', 8.0],
+        ['Dune', 2021, 155.0, 'Denis Villeneuve', 'Timothée Chalamet', 'Sci-Fi', 8.0],
+    )
+    merged, report = merge_duplicates(df, sources=['2021_final.csv:2', '2021_final.csv:9'])
+    assert merged['Duration'].tolist() == [155.0]
+    assert report[['Kept_Source', 'Dropped_Source', 'Group_Size']].values.tolist() == [
+        ['2021_final.csv:9', '2021_final.csv:2', 2],
+    ]
+    assert (report['Kept_Score'] > report['Dropped_Score']).all()
+
+
+def test_more_list_entries_break_ties_in_filled_columns():
+    df = films(
+        ['Dune', 2021, 155.0, 'Denis Villeneuve', 'Timothée Chalamet', 'Sci-Fi', 8.0],
+        ['Dune', 2021, 155.0, 'Denis Villeneuve', 'Timothée Chalamet, Zendaya', 'Sci-Fi, Adventure', 8.0],
+    )
+    score = completeness(df)
+    assert score[1] > score[0]
+    merged, _ = merge_duplicates(df)
+    assert merged['Actors'].tolist() == ['Timothée Chalamet, Zendaya']
+
+
+def test_blank_text_does_not_count_as_filled():
+    df = films(
+        ['Dune', 2021, 155.0, 'Denis Villeneuve', '  ', 'Sci-Fi', 8.0],
+        ['Dune', 2021, 155.0, 'Denis Villeneuve', None, 'Sci-Fi', 8.0],
+    )
+    score = completeness(df)
+    assert score[0] == score[1]
+
+
+def test_equal_scores_keep_first_occurrence():
+    df = films(
+        ['Dune', 2021, 155.0, 'Denis Villeneuve', 'Timothée Chalamet', 'Sci-Fi', 8.0],
+        ['DUNE', 2021, 156.0, 'Denis Villeneuve', 'Zendaya', 'Sci-Fi', 8.1],
+    )
+    merged, report = merge_duplicates(df)
+    assert merged['Title'].tolist() == ['Dune']
+    assert report['Dropped_Title'].tolist() == ['DUNE']
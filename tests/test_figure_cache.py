@@ -0,0 +1,38 @@
+import numpy as np
+import plotly.graph_objects as go
+
+from figure_cache import MIN_POINTS_PER_TRACE, apply_payload_budget, enforce_payload_budget, figure_spec
+
+
+def line_figure(n_traces=20, n_points=2_000):
+    x = np.linspace(1.0, 10.0, n_points)
+    return go.Figure([
+        go.Scatter(
+            x=x, y=np.sin(x + i), mode='lines', customdata=np.arange(n_points),
+            hovertemplate='%{x}: %{customdata}<extra></extra>',
+        )
+        for i in range(n_traces)
+    ])
+
+
+def test_small_figure_is_left_untouched():
+    fig = apply_payload_budget(line_figure(n_traces=1, n_points=50))
+    _, spec_bytes = enforce_payload_budget(fig)
+    assert fig.data[0].customdata is not None and len(fig.data[0].y) == 50
+    assert spec_bytes == len(figure_spec(fig).encode('utf-8'))
+
+
+def test_budget_is_enforced_by_dropping_hover_fields_then_downsampling():
+    fig = apply_payload_budget(line_figure())
+    budget = len(figure_spec(fig).encode('utf-8')) // 4
+    fig, spec_bytes = enforce_payload_budget(fig, budget)
+    assert spec_bytes <= budget
+    assert all(trace.customdata is None and trace.hovertemplate is None for trace in fig.data)
+    assert MIN_POINTS_PER_TRACE <= len(fig.data[0].y) < 150
+    assert len(fig.data[0].x) == len(fig.data[0].y)
+
+
+def test_bar_traces_are_never_downsampled():
+    fig = go.Figure(go.Bar(x=np.arange(500), y=np.arange(500.0)))
+    fig, spec_bytes = enforce_payload_budget(fig, budget_bytes=100)
+    assert len(fig.data[0].y) == 500 and spec_bytes > 100
@@ -0,0 +1,76 @@
+import pandas as pd
+import pytest
+
+from schema_adapters import IMDB_TOP_ADAPTER, split_joined_names, split_leaked_directors
+
+
+@pytest.mark.parametrize('joined, expected', [
+    ('JosephKosinski', 'Joseph Kosinski'),
+    ('YasujirôOzu', 'Yasujirô Ozu'),
+    # Awalan marga berhuruf kapital tetap menempel pada marganya
+    ('ChristopherMcQuarrie', 'Christopher McQuarrie'),
+    ('KyleMacLachlan', 'Kyle MacLachlan'),
+    ('BrianDePalma', 'Brian DePalma'),
+    ('LeonardoDiCaprio', 'Leonardo DiCaprio'),
+    ('KevinMacdonald', 'Kevin Macdonald'),
+    # Partikel marga huruf kecil dipisah dari nama depan dan marga
+    ('FelixvanGroeningen', 'Felix van Groeningen'),
+    ('LarsvonTrier', 'Lars von Trier'),
+    ('FlorianHenckelvonDonnersmarck', 'Florian Henckel von Donnersmarck'),
+    ('AnadeArmas', 'Ana de Armas'),
+    ('GuillermodelToro', 'Guillermo del Toro'),
+    # Nama depan yang berakhiran partikel tidak ikut dipisah
+    ('ClaudeRains', 'Claude Rains'),
+    ('JudeLaw', 'Jude Law'),
+    ('CleavonLittle', 'Cleavon Little'),
+    ('DevonSawa', 'Devon Sawa'),
+    ('WadeWilliams', 'Wade Williams'),
+    ('MaudeApatow', 'Maude Apatow'),
+    ('JadePettyjohn', 'Jade Pettyjohn'),
+    ('AdelaideKane', 'Adelaide Kane'),
+    ('SladeHall', 'Slade Hall'),
+    ('DonovanMcNabb', 'Donovan McNabb'),
+    ('AbdelAhmedGhili', 'Abdel Ahmed Ghili'),
+    # Inisial dan singkatan
+    ('CecilB.DeMille', 'Cecil B. DeMille'),
+    ('GeorgeP.Cosmatos', 'George P. Cosmatos'),
+    ('RobertDowneyJr.', 'Robert Downey Jr.'),
+    ('KodiSmit-McPhee', 'Kodi Smit-McPhee'),
+    # Nama satu kata tidak diubah
+    ('Priyadarshan', 'Priyadarshan'),
+    ('Vetrimaaran', 'Vetrimaaran'),
+])
+def test_split_joined_names(joined, expected):
+    assert split_joined_names(pd.Series([joined])).iloc[0] == expected
+
+
+def test_split_leaked_directors_moves_entries_before_empty_entry():
+    director = pd.Series(['PeteDocter,', 'Gayatri,', 'DanKwan,', 'YorgosLanthimos'])
+    stars = pd.Series([
+        'LeeUnkrich, , BillyCrystal, JohnGoodman',
+        'Pushkar, , RMadhavan',
+        '  , MichelleYeoh, KeHuyQuan',
+        'ChristosStergioglou, , MicheleValley',
+    ])
+    director, stars = split_leaked_directors(director, stars)
+    assert director.tolist() == ['PeteDocter,LeeUnkrich', 'Gayatri,Pushkar', 'DanKwan', 'YorgosLanthimos']
+    # Baris tanpa penanda (Director tidak berakhiran koma) tidak diubah
+    assert stars.tolist() == [
+        'BillyCrystal, JohnGoodman', 'RMadhavan', 'MichelleYeoh, KeHuyQuan', 'ChristosStergioglou, , MicheleValley',
+    ]
+
+
+def test_imdb_top_adapter_normalizes_joined_director_lists():
+    raw = pd.DataFrame({
+        'Title': ['Vikram Vedha', 'Melancholia'],
+        'Director': ['Gayatri,', 'LarsvonTrier'],
+        'Stars': ['Pushkar, , RMadhavan, VijaySethupathi', 'KirstenDunst, CharlotteGainsbourg'],
+        'IMDb-Rating': [8.2, 7.1],
+        'Category': ['Action, Crime', 'Drama, Sci-Fi'],
+        'Duration': ['147 min', '135 min'],
+        'Censor-board-rating': ['UA', 'R'],
+        'ReleaseYear': [2017, 2011],
+    })
+    df = IMDB_TOP_ADAPTER.normalize(raw)
+    assert df['Director'].tolist() == ['Gayatri, Pushkar', 'Lars von Trier']
+    assert df['Stars'].tolist() == ['RMadhavan, Vijay Sethupathi', 'Kirsten Dunst, Charlotte Gainsbourg']
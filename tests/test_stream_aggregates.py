@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+from data_utils import build_director_index, build_film_genre_model, build_year_genre_cube, compact_frame, director_stats
+from stream_aggregates import AggregateAccumulator, SortedKeyCodes
+
+
+def catalog():
+    return pd.DataFrame({
+        'Title': ['A', 'B', 'C', 'D', 'E', 'F'],
+        'ReleaseYear': [2001, 2001, 2002, 2001, 2003, 2002],
+        'Director': ['Ann Lee', 'Ann Lee', 'Bo Kim, Ann Lee', 'Bo Kim', 'Cy Dunn', 'Cy Dunn'],
+        'Category': ['Drama', 'Comedy', 'Drama, Horror', 'Horror', 'Drama', 'Comedy, Drama'],
+        'IMDb-Rating': [7.0, np.nan, 8.0, 5.5, 6.0, 7.5],
+        'Duration_Clean': [100.0, 95.0, 110.0, 90.0, np.nan, 120.0],
+    })
+
+
+def test_sorted_key_codes_keep_first_seen_codes():
+    codes = SortedKeyCodes()
+    assert codes.encode([30, 10, 30]).tolist() == [0, 1, 0]
+    assert codes.encode([20, 10, 40]).tolist() == [2, 1, 3]
+    assert codes.keys_by_code().tolist() == [30, 10, 20, 40]
+
+
+def test_chunked_aggregates_match_film_table():
+    df = catalog()
+    films, film_genres = build_film_genre_model(compact_frame(df))
+    cube = build_year_genre_cube(films, film_genres)
+    index = build_director_index(films, cube)
+
+    accumulator = AggregateAccumulator()
+    for start in range(0, len(df), 2):
+        accumulator.update(df.iloc[start:start + 2])
+    stream_cube, stream_index, _ = accumulator.finish()
+
+    assert stream_cube['genres'] == cube['genres']
+    for name in ('count', 'rating_count', 'rating_sum', 'film_count', 'rating_hist'):
+        np.testing.assert_allclose(stream_cube[name], cube[name])
+    year_range = (2001, 2003)
+    for genres in (None, ['Drama'], ['Comedy', 'Horror']):
+        expected = director_stats(index, cube, year_range, genres).sort_values('Director', ignore_index=True)
+        actual = director_stats(stream_index, stream_cube, year_range, genres).sort_values('Director', ignore_index=True)
+        pd.testing.assert_frame_equal(actual, expected)
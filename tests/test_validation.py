@@ -0,0 +1,75 @@
+import pandas as pd
+
+from schema_adapters import read_normalized_chunks
+from validation import (
+    DUPLICATE_KEY, DURATION_NOT_POSITIVE, RATING_MISSING, RATING_OUT_OF_RANGE, TITLE_EMPTY, YEAR_OUT_OF_RANGE,
+    Validator, quarantine_path
+)
+
+COLUMNS = ['Title', 'ReleaseYear', 'Duration', 'Director', 'Actors', 'Category', 'IMDb-Rating']
+
+
+def scrape_row(title='Dune', year=2021, duration=155.0, rating=8.0, director='Denis Villeneuve'):
+    return [title, year, duration, director, 'Timothée Chalamet', 'Sci-Fi', rating]
+
+
+def test_quarantine_has_one_row_per_reason_code(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    rows = [
+        scrape_row(),
+        scrape_row(title='Nosferatu', year=1800),
+        scrape_row(title='Cats', rating=11.0),
+        scrape_row(title='Morbius', rating=None),
+        scrape_row(title='Thalaivaa', duration=0.0),
+        scrape_row(title='  '),
+        scrape_row(),                               # salinan baris pertama
+        scrape_row(title='Dune', director='David Lynch', year=1984),
+    ]
+    pd.DataFrame(rows, columns=COLUMNS).to_csv('films.csv', index=False)
+
+    valid = pd.concat(read_normalized_chunks('films.csv', chunksize=3))
+    assert list(zip(valid['Title'], valid['ReleaseYear'])) == [('Dune', 2021), ('Dune', 1984)]
+
+    quarantine = pd.read_csv(quarantine_path('films.csv'), keep_default_na=False)
+    assert quarantine['Reason'].tolist() == [
+        YEAR_OUT_OF_RANGE, RATING_OUT_OF_RANGE, RATING_MISSING, DURATION_NOT_POSITIVE, TITLE_EMPTY, DUPLICATE_KEY,
+    ]
+    assert quarantine['Title'].tolist() == ['Nosferatu', 'Cats', 'Morbius', 'Thalaivaa', '  ', 'Dune']
+
+
+def test_reasons_are_combined_and_clean_file_removes_old_quarantine(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pd.DataFrame([scrape_row(year=1800, rating=0.5)], columns=COLUMNS).to_csv('films.csv', index=False)
+    list(read_normalized_chunks('films.csv'))
+    reason = pd.read_csv(quarantine_path('films.csv'))['Reason'].tolist()
+    assert reason == [f'{YEAR_OUT_OF_RANGE}|{RATING_OUT_OF_RANGE}']
+
+    pd.DataFrame([scrape_row()], columns=COLUMNS).to_csv('films.csv', index=False)
+    list(read_normalized_chunks('films.csv'))
+    assert not (tmp_path / quarantine_path('films.csv')).exists()
+
+
+def test_streaming_validator_keeps_no_duplicate_keys():
+    df = pd.DataFrame({
+        'Title': ['Dune', 'Dune'], 'ReleaseYear': [2021, 2021], 'Director': ['Denis Villeneuve'] * 2,
+        'IMDb-Rating': [8.0, 8.0], 'Duration_Clean': [155.0, 155.0],
+    })
+    validator = Validator(check_duplicates=False)
+    valid, rejected = validator.split(df)
+    assert len(valid) == 2 and rejected.empty
+    assert len(validator.seen_keys) == 0
+
+
+def test_duplicates_are_found_across_chunks():
+    def chunk(titles):
+        return pd.DataFrame({
+            'Title': titles, 'ReleaseYear': 2021, 'Director': 'Denis Villeneuve',
+            'IMDb-Rating': 8.0, 'Duration_Clean': 155.0,
+        })
+
+    validator = Validator()
+    validator.split(chunk(['Dune', 'Arrival', 'Sicario']))
+    valid, rejected = validator.split(chunk(['Arrival', 'Enemy', 'Enemy', 'Dune']))
+    assert valid['Title'].tolist() == ['Enemy']
+    assert rejected['Reason'].tolist() == [DUPLICATE_KEY] * 3
+    assert len(validator.seen_keys) == 4 and (validator.seen_keys[1:] > validator.seen_keys[:-1]).all()
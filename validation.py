@@ -0,0 +1,119 @@
+import os
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+# Kode alasan penolakan (kolom 'Reason' pada file karantina, beberapa alasan dipisah '|')
+YEAR_OUT_OF_RANGE = 'year_out_of_range'
+RATING_OUT_OF_RANGE = 'rating_out_of_range'
+RATING_MISSING = 'rating_missing'
+DURATION_NOT_POSITIVE = 'duration_not_positive'
+TITLE_EMPTY = 'title_empty'
+DUPLICATE_KEY = 'duplicate_key'
+
+MIN_YEAR = 1888
+MIN_RATING, MAX_RATING = 1.0, 10.0
+# (Title, ReleaseYear) saja bentrok untuk 48 film berbeda di data_final.csv (mis. dua film "Alone"
+# tahun 2020), sehingga sutradara ikut menjadi bagian kunci duplikat
+DUPLICATE_KEY_COLUMNS = ['Title', 'ReleaseYear', 'Director']
+QUARANTINE_DIR = 'quarantine'
+
+
+class Validator:
+    """Memisahkan baris valid dari baris yang ditolak pada potongan berskema kanonik.
+
+    Kunci duplikat yang sudah lolos disimpan sebagai hash 64-bit dalam array terurut
+    (dicari dengan np.searchsorted), sehingga duplikat antar potongan (dan antar file) tetap
+    terdeteksi tanpa menyimpan baris sebelumnya dan tanpa memindai ulang seluruh kumpulan hash
+    per potongan. Kumpulan hash ini tumbuh 8 byte per baris; pemuatan streaming memakai
+    check_duplicates=False agar memorinya tidak bergantung pada jumlah baris (duplikat sudah
+    digabung oleh build_data.py).
+    """
+
+    def __init__(self, min_year=MIN_YEAR, max_year=None, check_duplicates=True):
+        self.min_year = min_year
+        self.max_year = max_year if max_year is not None else date.today().year + 1
+        self.check_duplicates = check_duplicates
+        self.seen_keys = np.empty(0, dtype=np.uint64)   # terurut
+
+    def split(self, df):
+        """Mengembalikan (baris valid, baris ditolak dengan kolom 'Reason')"""
+        title = df['Title'].astype(str).str.strip().where(df['Title'].notna(), '')
+        # Tahun dan durasi NaN gagal pada between() dan perbandingan, sehingga ikut ditolak dengan
+        # kode rentangnya; rating kosong punya kode sendiri agar tidak terbaca sebagai rating salah
+        rating = df['IMDb-Rating']
+        checks = {
+            YEAR_OUT_OF_RANGE: ~df['ReleaseYear'].between(self.min_year, self.max_year),
+            RATING_MISSING: rating.isna(),
+            RATING_OUT_OF_RANGE: rating.notna() & ~rating.between(MIN_RATING, MAX_RATING),
+            DURATION_NOT_POSITIVE: ~(df['Duration_Clean'] > 0),
+            TITLE_EMPTY: title == '',
+        }
+        passed = ~np.logical_or.reduce([mask.to_numpy() for mask in checks.values()])
+        valid = passed
+        if self.check_duplicates:
+            valid = passed & ~self._mark_duplicates(df, title, passed, checks)
+
+        reason = pd.Series('', index=df.index)
+        for code, mask in checks.items():
+            reason = reason.where(~mask, reason + code + '|')
+        rejected = df[~valid].assign(Reason=reason[~valid].str.rstrip('|'))
+        return df[valid], rejected
+
+    def _mark_duplicates(self, df, title, passed, checks):
+        """Menambahkan checks[DUPLICATE_KEY] dan mengembalikan mask duplikatnya (numpy)"""
+        # Duplikat hanya dicek di antara baris yang lolos, agar salinan rusak tidak menyingkirkan salinan yang baik
+        keys = pd.util.hash_pandas_object(pd.DataFrame({
+            'Title': title[passed],
+            'ReleaseYear': df['ReleaseYear'][passed].astype(np.int64),
+            'Director': df['Director'][passed].fillna('').astype(str),
+        }), index=False).to_numpy()
+        pos = np.searchsorted(self.seen_keys, keys)
+        seen = pos < len(self.seen_keys)
+        seen[seen] = self.seen_keys[pos[seen]] == keys[seen]
+        duplicate = pd.Series(False, index=df.index)
+        duplicate[passed] = pd.Series(keys).duplicated().to_numpy() | seen
+        checks[DUPLICATE_KEY] = duplicate
+        new_keys = np.sort(keys[~duplicate[passed].to_numpy()])
+        self.seen_keys = np.insert(self.seen_keys, np.searchsorted(self.seen_keys, new_keys), new_keys)
+        return duplicate.to_numpy()
+
+
+def quarantine_path(source_path):
+    stem = os.path.splitext(os.path.basename(os.path.normpath(source_path)))[0]
+    return os.path.join(QUARANTINE_DIR, f"{stem}.csv")
+
+
+class QuarantineWriter:
+    """Menulis baris yang ditolak ke quarantine/<nama sumber>.csv per potongan.
+
+    Isi lama diganti, kecuali append=True (build inkremental yang hanya memproses file baru).
+    File karantina hanya untuk diagnosis: kegagalan menulis (mis. sistem file hanya-baca)
+    tidak menghentikan pemuatan data.
+    """
+
+    def __init__(self, source_path, append=False):
+        self.path = quarantine_path(source_path)
+        self.append = append
+        self.rows = 0
+
+    def write(self, rejected):
+        if rejected.empty:
+            return
+        try:
+            os.makedirs(QUARANTINE_DIR, exist_ok=True)
+            append = self.rows or self.append
+            header = not append or not os.path.exists(self.path)
+            rejected.to_csv(self.path, mode='a' if append else 'w', header=header, index=False)
+        except OSError:
+            return
+        self.rows += len(rejected)
+
+    def close(self):
+        """Menghapus file karantina lama jika kali ini tidak ada baris yang ditolak"""
+        if not self.rows and not self.append:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass